@@ -0,0 +1,884 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for tools/generate_docs.py.
+
+`pipeline` generates a synthetic framework-shaped Lua tree, times each stage of
+the generator on it, writes the timings as JSON and compares them against a
+stored baseline. `memory` runs the generator on such a tree in a child process
+and reports its peak RSS. `scanners` compares the Lua lexer with the per-line
+regex scanners it replaced, which are kept here as reference implementations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import generate_docs as gd  # noqa: E402
+
+
+DEFAULT_CORPUS_DIR = "gamemode"
+DEFAULT_SCALE = 50
+DEFAULT_REPEAT = 3
+DEFAULT_RESULTS_FILE = "benchmark.json"
+DEFAULT_BASELINE_FILE = "benchmark-baseline.json"
+DEFAULT_MEMORY_FILE = "memory.json"
+DEFAULT_MEMORY_SCALE = 100
+# Written into every work directory the benchmark creates: proves the directory is ours to delete, and lets a
+# later run with the same profile reuse the corpus in it.
+CORPUS_MARKER_FILE = ".corpus.json"
+DEFAULT_THRESHOLD = 0.25
+# Stage changes smaller than this are noise, whatever the ratio.
+MIN_REGRESSION_SECONDS = 0.02
+RESULTS_VERSION = 1
+STAGES = ("scan", "parse_comments", "index", "render", "write", "write_unchanged")
+
+# Shape of today's gamemode/ tree, which the synthetic corpus is modeled on.
+REAL_FILE_COUNT = 270
+FRAMEWORK_FOLDERS = ("core", "hooks", "interface", "libraries", "meta", "networking", "util")
+MODULE_FOLDERS = ("core", "hooks", "interface", "libraries", "meta", "networking")
+FILES_PER_MODULE = 8
+REALM_PREFIXES = ("sh_", "cl_", "sv_")
+SYNTHETIC_WORDS = (
+    "actor", "bag", "bank", "cache", "channel", "client", "color", "config", "door", "entity",
+    "faction", "flag", "inventory", "item", "job", "key", "model", "notice", "option", "panel",
+    "rank", "record", "scene", "slot", "sound", "store", "target", "vendor", "voice", "zone",
+)
+SYNTHETIC_TYPES = ("string", "number", "boolean", "table", "Player", "Entity", "function")
+LARGE_FILE_NAMES = ("sh_utf8.lua", "cl_store.lua")
+LARGE_FILE_REPEAT = 20
+
+FUNCTION_DEF_RE = re.compile(
+    r"^\s*(local\s+)?function\s+([A-Za-z_][\w\.:]*)\s*\(([^)]*)\)"
+)
+ASSIGN_FUNCTION_DEF_RE = re.compile(
+    r"^\s*([A-Za-z_][\w\.:]*)\s*=\s*function\s*\(([^)]*)\)"
+)
+GM_HOOK_DEF_RE = re.compile(r"^\s*(?:local\s+)?function\s+GM:([A-Za-z_][\w]*)\s*\(")
+MODULE_HOOK_DEF_RE = re.compile(r"^\s*(?:local\s+)?function\s+MODULE:([A-Za-z_][\w]*)\s*\(")
+HOOK_RUN_RE = re.compile(r'\bhook\.Run\s*\(\s*["\']([^"\']+)["\']')
+HOOK_ADD_RE = re.compile(r'\bhook\.Add\s*\(\s*["\']([^"\']+)["\']')
+META_ALIAS_RE = re.compile(
+    r"^\s*(?:local\s+)?([A-Za-z_][\w]*)\s*=\s*ax\.({})\.meta\b".format("|".join(gd.META_TYPES))
+)
+META_FIND_RE = re.compile(
+    r"^\s*(?:local\s+)?([A-Za-z_][\w]*)\s*=.*FindMetaTable\s*\(\s*[\"'](Character|Color|Entity|Inventory|Item|Player|Tool)[\"']\s*\)"
+)
+CANDIDATE_LINE_RE = re.compile(r"function|hook\.|FindMetaTable|\.meta\b")
+
+Corpus = List[Tuple[Path, str]]
+
+
+@dataclass
+class CorpusProfile:
+    files: int
+    functions_per_file: int
+    documented_ratio: float
+    hook_calls_per_file: int
+    meta_alias_ratio: float
+    usage_ratio: float
+    body_lines: int
+    seed: int
+
+
+def parse_args() -> argparse.Namespace:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--root",
+        type=Path,
+        default=Path(__file__).resolve().parents[1],
+        help="Parallax project root.",
+    )
+    common.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="Timed repetitions per case; the best run is reported.",
+    )
+    parser = argparse.ArgumentParser(description="Benchmark tools/generate_docs.py.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    corpus = argparse.ArgumentParser(add_help=False)
+    corpus.add_argument("--files", type=int, default=None, help="Exact file count; overrides --scale.")
+    corpus.add_argument("--functions", type=int, default=8, help="Functions per file.")
+    corpus.add_argument(
+        "--documented",
+        type=float,
+        default=0.6,
+        help="Share of functions with a doc comment.",
+    )
+    corpus.add_argument("--hook-calls", type=int, default=2, help="hook.Run/hook.Add calls per file.")
+    corpus.add_argument(
+        "--meta-aliases",
+        type=float,
+        default=0.15,
+        help="Share of files that alias a metatable.",
+    )
+    corpus.add_argument(
+        "--usage",
+        type=float,
+        default=0.3,
+        help="Share of documented functions with an @usage block.",
+    )
+    corpus.add_argument("--body-lines", type=int, default=18, help="Statements per function body.")
+    corpus.add_argument("--seed", type=int, default=1, help="Random seed for the corpus.")
+
+    pipeline = commands.add_parser(
+        "pipeline", parents=[common, corpus], help="Time each generator stage on a synthetic corpus."
+    )
+    pipeline.add_argument(
+        "--scale",
+        type=float,
+        default=10,
+        help=f"Corpus size as a multiple of today's tree ({REAL_FILE_COUNT} files, about 76k lines).",
+    )
+    pipeline.add_argument("--jobs", type=int, default=1, help="Scan worker processes.")
+    pipeline.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help=(
+            "Build the corpus and docs here and keep them (default: a temporary directory). Must be new, empty, "
+            "or a directory an earlier benchmark run created; its contents are replaced."
+        ),
+    )
+    pipeline.add_argument(
+        "--output",
+        type=Path,
+        default=Path(gd.DEFAULT_CACHE_DIR) / DEFAULT_RESULTS_FILE,
+        help="Where to write the JSON results (relative to --root unless absolute).",
+    )
+    pipeline.add_argument(
+        "--baseline",
+        type=Path,
+        default=Path(gd.DEFAULT_CACHE_DIR) / DEFAULT_BASELINE_FILE,
+        help="Stored results to compare against (relative to --root unless absolute).",
+    )
+    pipeline.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing.",
+    )
+    pipeline.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Fail when a stage is slower than the baseline by more than this fraction.",
+    )
+
+    memory = commands.add_parser(
+        "memory", parents=[common, corpus], help="Measure the generator's peak RSS on a synthetic corpus."
+    )
+    memory.add_argument(
+        "--scale",
+        type=float,
+        default=DEFAULT_MEMORY_SCALE,
+        help=f"Corpus size as a multiple of today's tree ({REAL_FILE_COUNT} files, about 76k lines).",
+    )
+    memory.add_argument("--jobs", type=int, default=1, help="Scan worker processes for the generator.")
+    memory.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        help=(
+            "Keep the corpus here and reuse it while the profile matches (default: a temporary directory). Must be "
+            "new, empty, or a directory an earlier benchmark run created."
+        ),
+    )
+    memory.add_argument(
+        "--generator",
+        type=Path,
+        default=Path(__file__).resolve().parent / "generate_docs.py",
+        help="Generator script to measure, e.g. an older copy for before/after comparisons.",
+    )
+    memory.add_argument(
+        "--output",
+        type=Path,
+        default=Path(gd.DEFAULT_CACHE_DIR) / DEFAULT_MEMORY_FILE,
+        help="Where to write the JSON results (relative to --root unless absolute).",
+    )
+
+    scanners = commands.add_parser("scanners", parents=[common], help="Compare the Lua lexer with the old regex scanners.")
+    scanners.add_argument(
+        "--corpus",
+        default=DEFAULT_CORPUS_DIR,
+        help="Directory with the real Lua corpus (relative to --root unless absolute).",
+    )
+    scanners.add_argument(
+        "--scale",
+        type=int,
+        default=DEFAULT_SCALE,
+        help="Multiplier for the synthetic corpus built from the real one.",
+    )
+    return parser.parse_args()
+
+
+def profile_from_args(args: argparse.Namespace) -> CorpusProfile:
+    return CorpusProfile(
+        files=args.files if args.files is not None else max(1, round(REAL_FILE_COUNT * args.scale)),
+        functions_per_file=args.functions,
+        documented_ratio=args.documented,
+        hook_calls_per_file=args.hook_calls,
+        meta_alias_ratio=args.meta_aliases,
+        usage_ratio=args.usage,
+        body_lines=args.body_lines,
+        seed=args.seed,
+    )
+
+
+def load_corpus(corpus_dir: Path) -> Corpus:
+    return [(path, gd.read_text(path)) for path in sorted(corpus_dir.rglob("*.lua"))]
+
+
+def scale_corpus(corpus: Corpus, scale: int) -> Corpus:
+    """Replicate the real files under distinct paths, keeping their real shape."""
+    scaled: Corpus = []
+    for copy_index in range(scale):
+        for path, content in corpus:
+            scaled.append((path.with_name(f"{path.stem}_{copy_index}{path.suffix}"), content))
+    return scaled
+
+
+def find_function_definition(line: str) -> Optional[Tuple[str, str]]:
+    match = FUNCTION_DEF_RE.match(line)
+    if match:
+        if match.group(1):
+            return None
+        return match.group(2), match.group(3)
+
+    match = ASSIGN_FUNCTION_DEF_RE.match(line)
+    if match:
+        return match.group(1), match.group(2)
+
+    return None
+
+
+def update_meta_aliases(line: str, aliases: Dict[str, str]) -> None:
+    alias_match = META_ALIAS_RE.match(line)
+    if alias_match:
+        aliases[alias_match.group(1)] = alias_match.group(2)
+        return
+
+    find_match = META_FIND_RE.match(line)
+    if find_match:
+        aliases[find_match.group(1)] = find_match.group(2).lower()
+
+
+def collect_line_hook_occurrences(
+    line: str,
+    line_number: int,
+    file_path: Path,
+    occurrences: List[gd.HookOccurrence],
+) -> None:
+    for kind, pattern in (("gm", GM_HOOK_DEF_RE), ("module", MODULE_HOOK_DEF_RE)):
+        match = pattern.match(line)
+        if match:
+            occurrences.append(gd.HookOccurrence(kind=kind, hook_name=match.group(1), source_path=file_path, line=line_number))
+
+    for kind, pattern in (("run", HOOK_RUN_RE), ("add", HOOK_ADD_RE)):
+        for match in pattern.finditer(line):
+            occurrences.append(gd.HookOccurrence(kind=kind, hook_name=match.group(1), source_path=file_path, line=line_number))
+
+
+def sanitize_signature_args(args: str) -> str:
+    return ", ".join(part for part in (part.strip() for part in args.split(",")) if part)
+
+
+def _scan_regex_lines(
+    lines: Sequence[str],
+    indices: Iterable[int],
+    source_dir: Path,
+    api_subdir: str,
+    file_path: Path,
+) -> gd.ScannedFile:
+    functions: List[gd.FunctionDoc] = []
+    hooks: List[gd.HookOccurrence] = []
+    meta_aliases: Dict[str, str] = {}
+
+    for index in indices:
+        line = lines[index]
+        update_meta_aliases(line, meta_aliases)
+        collect_line_hook_occurrences(line, index + 1, file_path, hooks)
+
+        parsed_def = find_function_definition(line)
+        if not parsed_def:
+            continue
+
+        doc_lines = gd.collect_doc_lines_above(lines, index)
+        if not doc_lines:
+            continue
+
+        parsed_comment = gd.parse_comment_lines(doc_lines)
+        if not parsed_comment.has_content:
+            continue
+
+        function_name, raw_args = parsed_def
+        functions.append(
+            gd.FunctionDoc(
+                name=function_name,
+                signature=f"{function_name}({sanitize_signature_args(raw_args)})",
+                line=index + 1,
+                description=parsed_comment.description,
+                realm=parsed_comment.realm or gd.infer_realm_from_filename(file_path),
+                params=parsed_comment.params,
+                returns=parsed_comment.returns,
+                usage=parsed_comment.usage,
+                meta_type=gd.infer_meta_type(function_name, meta_aliases),
+            )
+        )
+
+    file_doc = None
+    if functions:
+        file_doc = gd.FileDoc(
+            source_path=file_path,
+            source_group=source_dir.name,
+            relative_path=file_path.relative_to(source_dir),
+            output_relative=Path(api_subdir),
+            module=None,
+            section=None,
+            summary=None,
+            functions=functions,
+        )
+    return gd.ScannedFile(source_path=file_path, file_doc=file_doc, meta_aliases=meta_aliases, hooks=hooks)
+
+
+def scan_regex_cascade(
+    content: str,
+    source_dir: Path,
+    api_subdir: str,
+    file_path: Path,
+) -> gd.ScannedFile:
+    """Reference scanner: every regex on every line."""
+    lines = content.splitlines()
+    return _scan_regex_lines(lines, range(len(lines)), source_dir, api_subdir, file_path)
+
+
+def scan_regex_prefiltered(
+    content: str,
+    source_dir: Path,
+    api_subdir: str,
+    file_path: Path,
+) -> gd.ScannedFile:
+    """Reference scanner: the regex cascade behind a keyword prefilter over the whole text."""
+    lines = content.splitlines()
+    indices: List[int] = []
+    line_index = 0
+    position = 0
+    for match in CANDIDATE_LINE_RE.finditer(content):
+        start = match.start()
+        line_index += content.count("\n", position, start)
+        position = start
+        if not indices or indices[-1] != line_index:
+            indices.append(line_index)
+    return _scan_regex_lines(lines, indices, source_dir, api_subdir, file_path)
+
+
+def scan_fingerprint(scanned: gd.ScannedFile) -> Tuple[object, ...]:
+    functions = scanned.file_doc.functions if scanned.file_doc else []
+    return (
+        [(function.signature, function.line, function.meta_type) for function in functions],
+        scanned.meta_aliases,
+        scanned.hooks,
+    )
+
+
+def compare_scanners(corpus: Corpus, corpus_dir: Path) -> None:
+    """Report where the lexer and the line regexes disagree on the real corpus."""
+    regex_functions = regex_hooks = lexer_functions = lexer_hooks = 0
+    differing_files: List[str] = []
+    for path, content in corpus:
+        expected = scan_fingerprint(scan_regex_cascade(content, corpus_dir, gd.DEFAULT_API_SUBDIR, path))
+        actual = scan_fingerprint(gd.scan_lua_source(content, corpus_dir, gd.DEFAULT_API_SUBDIR, path))
+        regex_functions += len(expected[0])
+        regex_hooks += len(expected[2])
+        lexer_functions += len(actual[0])
+        lexer_hooks += len(actual[2])
+        if expected != actual:
+            differing_files.append(path.relative_to(corpus_dir).as_posix())
+
+    print(
+        f"Documented functions: regex {regex_functions}, lexer {lexer_functions}. "
+        f"Hook occurrences: regex {regex_hooks}, lexer {lexer_hooks}."
+    )
+    if differing_files:
+        print(f"Files where the lexer differs ({len(differing_files)}): {', '.join(differing_files)}")
+    print("")
+
+
+def time_scanner(
+    scanner: Callable[[str, Path, str, Path], gd.ScannedFile],
+    corpus: Corpus,
+    corpus_dir: Path,
+    repeat: int,
+) -> float:
+    best = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        for path, content in corpus:
+            scanner(content, corpus_dir, gd.DEFAULT_API_SUBDIR, path)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def summarize(corpus: Corpus) -> Tuple[int, int]:
+    return len(corpus), sum(content.count("\n") + 1 for _, content in corpus)
+
+
+def synthetic_file_paths(profile: CorpusProfile) -> List[Tuple[str, str]]:
+    """Return (relative path, folder kind) pairs laid out like gamemode/."""
+    rng = random.Random(profile.seed)
+    framework_files = max(1, profile.files // 3)
+    paths: List[Tuple[str, str]] = []
+    for index in range(framework_files):
+        folder = FRAMEWORK_FOLDERS[index % len(FRAMEWORK_FOLDERS)]
+        prefix = "cl_" if folder == "interface" else rng.choice(REALM_PREFIXES)
+        paths.append((f"gamemode/framework/{folder}/{prefix}{_synthetic_word(rng)}_{index}.lua", folder))
+
+    remaining = profile.files - framework_files
+    module_index = 0
+    while remaining > 0:
+        module = f"gamemode/modules/{_synthetic_word(rng)}_{module_index}"
+        paths.append((f"{module}/boot.lua", "boot"))
+        remaining -= 1
+        for index in range(min(FILES_PER_MODULE - 1, remaining)):
+            folder = MODULE_FOLDERS[index % len(MODULE_FOLDERS)]
+            prefix = "cl_" if folder == "interface" else rng.choice(REALM_PREFIXES)
+            paths.append((f"{module}/{folder}/{prefix}{_synthetic_word(rng)}_{index}.lua", folder))
+            remaining -= 1
+        module_index += 1
+    return paths
+
+
+def _synthetic_word(rng: random.Random) -> str:
+    return rng.choice(SYNTHETIC_WORDS)
+
+
+def _synthetic_owner(folder: str, library: str, rng: random.Random) -> str:
+    if folder == "meta":
+        return f"ax.{rng.choice(gd.META_TYPES)}.meta:"
+    if folder == "interface":
+        return "PANEL:"
+    if folder == "hooks":
+        return "MODULE:" if rng.random() < 0.5 else "GM:"
+    return f"ax.{library}:"
+
+
+def render_synthetic_file(folder: str, profile: CorpusProfile, rng: random.Random) -> str:
+    library = _synthetic_word(rng)
+    lines: List[str] = [
+        f"--- The {library} {folder} layer.",
+        f"-- @module ax.{library}",
+        "",
+    ]
+    alias: Optional[str] = None
+    if rng.random() < profile.meta_alias_ratio:
+        meta_type = rng.choice(gd.META_TYPES)
+        alias = meta_type.upper()
+        if rng.random() < 0.5:
+            lines.append(f'local {alias} = FindMetaTable("{meta_type.capitalize()}")')
+        else:
+            lines.append(f"local {alias} = ax.{meta_type}.meta")
+        lines.append("")
+
+    hook_lines = set(rng.sample(range(profile.functions_per_file), min(profile.hook_calls_per_file, profile.functions_per_file)))
+    for index in range(profile.functions_per_file):
+        name = f"{_synthetic_word(rng).capitalize()}{_synthetic_word(rng).capitalize()}{index}"
+        owner = f"{alias}:" if alias and rng.random() < 0.5 else _synthetic_owner(folder, library, rng)
+        params = [f"{_synthetic_word(rng)}{position}" for position in range(rng.randint(0, 3))]
+        if rng.random() < profile.documented_ratio:
+            lines.append(f"--- Handles the {_synthetic_word(rng)} of a {_synthetic_word(rng)}.")
+            lines.append(f"-- Keeps the {_synthetic_word(rng)} in sync with the {_synthetic_word(rng)}.")
+            lines.append(f"-- @realm {rng.choice(('client', 'server', 'shared'))}")
+            for param in params:
+                lines.append(f"-- @param {param} {rng.choice(SYNTHETIC_TYPES)} The {param} to use.")
+            lines.append(f"-- @treturn {rng.choice(SYNTHETIC_TYPES)} The resulting {_synthetic_word(rng)}.")
+            if rng.random() < profile.usage_ratio:
+                lines.append(f"-- @usage local result = {owner.replace(':', '.')}{name}({', '.join(repr(p) for p in params)})")
+                lines.append("-- print(result)")
+        lines.append(f"function {owner}{name}({', '.join(params)})")
+        lines.extend(_synthetic_body(profile, rng, index in hook_lines))
+        lines.append("end")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _synthetic_body(profile: CorpusProfile, rng: random.Random, with_hook: bool) -> List[str]:
+    body: List[str] = []
+    for line_index in range(profile.body_lines):
+        word = _synthetic_word(rng)
+        choice = rng.randrange(6)
+        if choice == 0:
+            body.append(f"    local {word} = self.{word} or {{}}")
+        elif choice == 1:
+            body.append(f"    if ( {word} != nil && {word}.valid ) then")
+            body.append(f'        ax.util:PrintDebug("{word} changed: " .. tostring({word}))')
+            body.append("    end")
+        elif choice == 2:
+            body.append(f"    -- keep the {word} cache warm")
+        elif choice == 3:
+            body.append(f"    for _, {word} in ipairs(self.{word}s or {{}}) do")
+            body.append(f"        {word}:Update()")
+            body.append("    end")
+        elif choice == 4:
+            body.append(f'    net.WriteString("{word}")')
+        else:
+            body.append(f"    self.{word} = ({word} or 0) + {line_index}")
+    if with_hook:
+        hook_name = f"On{_synthetic_word(rng).capitalize()}{_synthetic_word(rng).capitalize()}"
+        if rng.random() < 0.5:
+            body.append(f'    hook.Run("{hook_name}", self)')
+        else:
+            body.append(f'    hook.Add("{hook_name}", "ax.synthetic", function() end)')
+    return body
+
+
+def reset_workdir(root: Path) -> None:
+    """Empty root for a new corpus; refuse to delete a non-empty directory this benchmark did not create."""
+    if root.exists():
+        if not root.is_dir():
+            raise SystemExit(f"--workdir {root} exists and is not a directory.")
+        if (root / CORPUS_MARKER_FILE).is_file():
+            shutil.rmtree(root)
+        elif any(root.iterdir()):
+            raise SystemExit(
+                f"--workdir {root} is not empty and has no {CORPUS_MARKER_FILE} from an earlier benchmark run; "
+                "refusing to delete it. Pass an empty or new directory."
+            )
+    root.mkdir(parents=True, exist_ok=True)
+    # Claim the directory before writing anything, so an interrupted run can still be cleaned up by the next one.
+    (root / CORPUS_MARKER_FILE).write_text("{}\n", encoding="utf-8")
+
+
+def write_corpus_marker(root: Path, profile: CorpusProfile, files: int, lines: int) -> None:
+    payload = {"profile": asdict(profile), "files": files, "lines": lines}
+    (root / CORPUS_MARKER_FILE).write_text(json.dumps(payload) + "\n", encoding="utf-8")
+
+
+def write_synthetic_corpus(root: Path, profile: CorpusProfile) -> Tuple[int, int]:
+    """Write the synthetic tree under root; return its file and line counts."""
+    rng = random.Random(profile.seed)
+    files = lines = 0
+    for relative, folder in synthetic_file_paths(profile):
+        content = render_synthetic_file(folder, profile, rng)
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        files += 1
+        lines += content.count("\n") + 1
+    return files, lines
+
+
+def synthetic_layout(root: Path) -> gd.DocsLayout:
+    return gd.DocsLayout(
+        root=root,
+        source_dirs=[root / source for source in gd.DEFAULT_SOURCE_DIRS],
+        docs_dir=root / gd.DEFAULT_DOCS_DIR,
+        docs_dir_relative=gd.DEFAULT_DOCS_DIR,
+        api_subdir=gd.DEFAULT_API_SUBDIR,
+        libraries_subdir=gd.DEFAULT_LIBRARIES_SUBDIR,
+        meta_subdir=gd.DEFAULT_META_SUBDIR,
+        hooks_subdir=gd.DEFAULT_HOOKS_SUBDIR,
+        manuals_source_dir=root / gd.DEFAULT_MANUALS_SOURCE_DIR,
+        manuals_subdir=gd.DEFAULT_MANUALS_SUBDIR,
+        mkdocs_path=root / gd.DEFAULT_MKDOCS_FILE,
+        site_name=gd.DEFAULT_SITE_NAME,
+        site_description=gd.DEFAULT_SITE_DESCRIPTION,
+    )
+
+
+def collect_comment_blocks(layout: gd.DocsLayout) -> List[List[str]]:
+    """Gather the doc block above every definition, the input of parse_comment_lines."""
+    blocks: List[List[str]] = []
+    for source_dir in layout.source_dirs:
+        for path in sorted(source_dir.rglob("*.lua")):
+            content = gd.read_text(path)
+            lines = content.split("\n")
+            events, long_comments = gd.scan_lua_events(content)
+            for event in events:
+                if event.kind != "def":
+                    continue
+                block = gd.collect_doc_lines_above(lines, event.line, long_comments)
+                if block:
+                    blocks.append(block)
+    return blocks
+
+
+def run_pipeline_once(layout: gd.DocsLayout, blocks: Sequence[List[str]], jobs: int) -> Tuple[Dict[str, float], Dict[str, int]]:
+    timings: Dict[str, float] = {}
+
+    started = time.perf_counter()
+    scanned_files = gd.scan_source_dirs(layout.root, layout.source_dirs, layout.api_subdir, None, jobs)
+    timings["scan"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for block in blocks:
+        gd.parse_comment_lines(block)
+    timings["parse_comments"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    model = gd.build_docs_model(scanned_files, layout)
+    plans = gd.plan_pages(model, layout)
+    timings["index"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    rendered = [(layout.docs_dir / plan.output_relative, plan.render()) for plan in plans]
+    rendered.append((layout.mkdocs_path, gd.render_mkdocs_config(model, layout)))
+    timings["render"] = time.perf_counter() - started
+
+    for stage in ("write", "write_unchanged"):
+        started = time.perf_counter()
+        for path, content in rendered:
+            gd.write_if_changed(path, content, False)
+        timings[stage] = time.perf_counter() - started
+
+    counts = {
+        "scanned_files": len(scanned_files),
+        "documented_files": len(model.file_docs),
+        "documented_functions": sum(len(file_doc.functions) for file_doc in model.file_docs),
+        "pages": len(rendered),
+    }
+    return timings, counts
+
+
+def benchmark_pipeline(root: Path, profile: CorpusProfile, repeat: int, jobs: int) -> Dict[str, object]:
+    layout = synthetic_layout(root)
+    started = time.perf_counter()
+    files, lines = write_synthetic_corpus(root, profile)
+    write_corpus_marker(root, profile, files, lines)
+    print(f"Synthetic corpus: {files} files, {lines} lines in {time.perf_counter() - started:.1f}s ({root})")
+    blocks = collect_comment_blocks(layout)
+
+    best: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+    for _ in range(max(1, repeat)):
+        if layout.docs_dir.exists():
+            shutil.rmtree(layout.docs_dir)
+        timings, counts = run_pipeline_once(layout, blocks, jobs)
+        for stage, seconds in timings.items():
+            best[stage] = min(best.get(stage, seconds), seconds)
+
+    return {
+        "version": RESULTS_VERSION,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "repeat": max(1, repeat),
+        "jobs": jobs,
+        "corpus": {"profile": asdict(profile), "files": files, "lines": lines, "comment_blocks": len(blocks), **counts},
+        "stages": {stage: round(best[stage], 6) for stage in STAGES},
+        "total": round(sum(best.values()), 6),
+    }
+
+
+def compare_with_baseline(results: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """Print a stage-by-stage comparison; return the stages that regressed."""
+    if baseline.get("corpus", {}).get("profile") != results["corpus"]["profile"] or baseline.get("jobs") != results["jobs"]:
+        print("Baseline was recorded on a different corpus profile or job count; not comparing.")
+        return []
+
+    regressions: List[str] = []
+    print(f"{'stage':<16} {'baseline':>10} {'current':>10} {'change':>8}")
+    for stage in STAGES:
+        previous = baseline.get("stages", {}).get(stage)
+        current = results["stages"][stage]
+        if previous is None:
+            print(f"{stage:<16} {'-':>10} {current:>9.3f}s")
+            continue
+        change = (current - previous) / previous if previous else 0.0
+        flag = ""
+        if change > threshold and current - previous > MIN_REGRESSION_SECONDS:
+            regressions.append(stage)
+            flag = "  REGRESSION"
+        print(f"{stage:<16} {previous:>9.3f}s {current:>9.3f}s {change:>+7.0%}{flag}")
+    return regressions
+
+
+def print_stage_table(results: Dict[str, object]) -> None:
+    corpus = results["corpus"]
+    print(
+        f"{corpus['scanned_files']} files scanned, {corpus['documented_functions']} documented functions, "
+        f"{corpus['pages']} pages (best of {results['repeat']})"
+    )
+    for stage in STAGES:
+        print(f"  {stage:<16} {results['stages'][stage]:>9.3f}s")
+    print(f"  {'total':<16} {results['total']:>9.3f}s")
+
+
+def run_pipeline(args: argparse.Namespace) -> int:
+    root = args.root.resolve()
+    profile = profile_from_args(args)
+    if args.workdir is not None:
+        workdir = args.workdir.resolve()
+        reset_workdir(workdir)
+        results = benchmark_pipeline(workdir, profile, args.repeat, max(1, args.jobs))
+    else:
+        with tempfile.TemporaryDirectory(prefix="parallax-bench-") as temp_dir:
+            results = benchmark_pipeline(Path(temp_dir), profile, args.repeat, max(1, args.jobs))
+
+    print_stage_table(results)
+    output_path = gd.normalize_path(root, str(args.output))
+    baseline_path = gd.normalize_path(root, str(args.baseline))
+    payload = json.dumps(results, indent=2) + "\n"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    gd.atomic_write_bytes(output_path, payload.encode("utf-8"))
+    print(f"Wrote: {output_path}")
+
+    if args.update_baseline:
+        gd.atomic_write_bytes(baseline_path, payload.encode("utf-8"))
+        print(f"Wrote baseline: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"No baseline at {baseline_path}; rerun with --update-baseline to store one.")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    regressions = compare_with_baseline(results, baseline, args.threshold)
+    if regressions:
+        print(f"Slower than baseline by more than {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+def prepare_corpus(root: Path, profile: CorpusProfile) -> Tuple[int, int]:
+    """Write the corpus under root unless a corpus with the same profile is already there."""
+    marker = root / CORPUS_MARKER_FILE
+    try:
+        stored = json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        stored = None
+    if stored is not None and stored.get("profile") == asdict(profile):
+        print(f"Reusing synthetic corpus: {stored['files']} files, {stored['lines']} lines ({root})")
+        return stored["files"], stored["lines"]
+
+    reset_workdir(root)
+    started = time.perf_counter()
+    files, lines = write_synthetic_corpus(root, profile)
+    print(f"Synthetic corpus: {files} files, {lines} lines in {time.perf_counter() - started:.1f}s ({root})")
+    write_corpus_marker(root, profile, files, lines)
+    return files, lines
+
+
+def measure_generator(generator: Path, root: Path, jobs: int) -> Tuple[float, int]:
+    """Run the generator on root in a child process; return its wall time and peak RSS in bytes."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, str(generator), "--root", str(root), "--no-cache", "--jobs", str(jobs)],
+        stdout=subprocess.DEVNULL,
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise SystemExit(f"{generator} exited with {process.returncode}")
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return time.perf_counter() - started, usage.ru_maxrss * scale
+
+
+def benchmark_memory(root: Path, profile: CorpusProfile, generator: Path, repeat: int, jobs: int) -> Dict[str, object]:
+    files, lines = prepare_corpus(root, profile)
+    runs: Dict[str, Dict[str, float]] = {}
+    for _ in range(max(1, repeat)):
+        for case in ("cold", "unchanged"):
+            if case == "cold":
+                for generated in (root / gd.DEFAULT_DOCS_DIR, root / gd.DEFAULT_MKDOCS_FILE):
+                    if generated.is_dir():
+                        shutil.rmtree(generated)
+                    elif generated.exists():
+                        generated.unlink()
+            seconds, peak = measure_generator(generator, root, jobs)
+            best = runs.setdefault(case, {"seconds": seconds, "peak_rss_bytes": peak})
+            best["seconds"] = min(best["seconds"], seconds)
+            best["peak_rss_bytes"] = min(best["peak_rss_bytes"], peak)
+
+    return {
+        "version": RESULTS_VERSION,
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "generator": str(generator),
+        "repeat": max(1, repeat),
+        "jobs": jobs,
+        "corpus": {"profile": asdict(profile), "files": files, "lines": lines},
+        "runs": {case: {"seconds": round(run["seconds"], 3), "peak_rss_bytes": run["peak_rss_bytes"]} for case, run in runs.items()},
+    }
+
+
+def run_memory(args: argparse.Namespace) -> int:
+    if not hasattr(os, "wait4"):
+        print("Peak RSS needs os.wait4, which this platform does not provide.")
+        return 1
+
+    root = args.root.resolve()
+    profile = profile_from_args(args)
+    generator = args.generator.resolve()
+    if args.workdir is not None:
+        results = benchmark_memory(args.workdir.resolve(), profile, generator, args.repeat, max(1, args.jobs))
+    else:
+        with tempfile.TemporaryDirectory(prefix="parallax-bench-") as temp_dir:
+            results = benchmark_memory(Path(temp_dir), profile, generator, args.repeat, max(1, args.jobs))
+
+    print(f"{results['corpus']['files']} files, {results['corpus']['lines']} lines (best of {results['repeat']})")
+    for case, run in results["runs"].items():
+        print(f"  {case:<10} {run['seconds']:>8.1f}s  peak RSS {run['peak_rss_bytes'] / (1024 * 1024):>8.1f} MiB")
+
+    output_path = gd.normalize_path(root, str(args.output))
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    gd.atomic_write_bytes(output_path, (json.dumps(results, indent=2) + "\n").encode("utf-8"))
+    print(f"Wrote: {output_path}")
+    return 0
+
+
+def run_scanners(args: argparse.Namespace) -> int:
+    root = args.root.resolve()
+    corpus_dir = gd.normalize_path(root, args.corpus)
+    real = load_corpus(corpus_dir)
+    compare_scanners(real, corpus_dir)
+    cases = [
+        ("real", real, args.repeat),
+        (f"synthetic x{args.scale}", scale_corpus(real, args.scale), args.repeat),
+    ]
+    for name in LARGE_FILE_NAMES:
+        large = [(path, content) for path, content in real if path.name == name]
+        if large:
+            cases.append((f"{name} x{LARGE_FILE_REPEAT}", large * LARGE_FILE_REPEAT, args.repeat))
+
+    scanners = (
+        ("regex cascade", scan_regex_cascade),
+        ("prefiltered", scan_regex_prefiltered),
+        ("lexer", gd.scan_lua_source),
+    )
+    header = f"{'corpus':<20} {'files':>7} {'lines':>10}"
+    header += "".join(f" {label:>14}" for label, _ in scanners)
+    print(header + f" {'lexer speedup':>14}")
+    for label, corpus, repeat in cases:
+        files, lines = summarize(corpus)
+        timings = [time_scanner(scanner, corpus, corpus_dir, repeat) for _, scanner in scanners]
+        row = f"{label:<20} {files:>7} {lines:>10}"
+        row += "".join(f" {timing:>13.3f}s" for timing in timings)
+        print(row + f" {timings[0] / timings[-1]:>13.2f}x")
+    return 0
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "pipeline":
+        sys.exit(run_pipeline(args))
+    if args.command == "memory":
+        sys.exit(run_memory(args))
+    sys.exit(run_scanners(args))
+
+
+if __name__ == "__main__":
+    main()
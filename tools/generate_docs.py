@@ -1,19 +1,41 @@
 #!/usr/bin/env python3
 """
 Generate MkDocs documentation for Parallax from Lua doc comments.
+
+Other tools can import this module and drive the stages in-process through
+DocsProject instead of running the script and re-parsing the Lua tree:
+
+    project = DocsProject.from_args(["--root", "path/to/parallax"])
+    model = project.index()
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
+import cProfile
+import ctypes
+import ctypes.util
+import hashlib
+import json
 import os
 import re
+import select
 import shutil
-from collections import defaultdict
+import sqlite3
+import struct
+import subprocess
+import sys
+import textwrap
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 
 DEFAULT_SOURCE_DIRS = ("gamemode/framework", "gamemode/modules")
@@ -25,6 +47,126 @@ DEFAULT_HOOKS_SUBDIR = "hooks"
 DEFAULT_MANUALS_SOURCE_DIR = "manuals"
 DEFAULT_MANUALS_SUBDIR = "manuals"
 DEFAULT_MKDOCS_FILE = "mkdocs.yml"
+DEFAULT_CACHE_DIR = ".parallax-docs-cache"
+SCAN_CACHE_FILE = "scan-cache.json"
+# Dot-prefixed so MkDocs excludes it from the built site.
+MANIFEST_FILE = ".parallax-manifest.json"
+MANIFEST_VERSION = 1
+# The scanned model of the last generation, for --since; dot-prefixed like the manifest.
+MODEL_FILE = ".parallax-model.json"
+MODEL_VERSION = 2
+# Bump when the shape of cached scan records changes. Parser and regex edits are
+# picked up automatically because the generator's own digest is part of the stamp.
+SCAN_CACHE_VERSION = 1
+FINGERPRINT_FILE = "fingerprint.json"
+TITLE_CACHE_FILE = "titles.json"
+# auto tries a copy-on-write clone and falls back to copy; hardlink/symlink alias the sources.
+MANUALS_MODES = ("auto", "copy", "reflink", "hardlink", "symlink")
+# Linux FICLONE ioctl: share the source's extents instead of copying bytes.
+FICLONE = 0x40049409
+# Read size when hashing an existing output without loading it whole.
+STREAM_BLOCK_SIZE = 1 << 20
+FINGERPRINT_VERSION = 1
+# Below this many files to parse, process start-up costs more than it saves.
+MIN_PARALLEL_SCAN_FILES = 16
+WATCH_SUFFIXES = (".lua", ".md")
+WATCH_POLL_INTERVAL = 0.5
+WATCH_DEBOUNCE = 0.1
+PROFILE_FILE = "profile.json"
+# Hook and library pages larger than this are split into per-letter sub-pages.
+DEFAULT_PAGE_BUDGET_KB = 256
+SYMBOL_INDEX_FILE = "api.ndjson"
+SYMBOL_INDEX_VERSION = 1
+SYMBOL_DB_FILE = "symbols.db"
+# Bump when the table layout changes; older databases are rebuilt from scratch.
+SYMBOL_DB_VERSION = 1
+SYMBOL_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    source_group TEXT,
+    module TEXT,
+    section TEXT,
+    summary TEXT,
+    api_page TEXT
+);
+CREATE TABLE IF NOT EXISTS functions (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    realm TEXT,
+    description TEXT NOT NULL,
+    usage TEXT NOT NULL,
+    meta_type TEXT,
+    anchor TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS functions_name ON functions(name);
+CREATE INDEX IF NOT EXISTS functions_file ON functions(file_id);
+CREATE TABLE IF NOT EXISTS params (
+    function_id INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type_name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (function_id, position)
+);
+CREATE TABLE IF NOT EXISTS returns (
+    function_id INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    type_name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    PRIMARY KEY (function_id, position)
+);
+CREATE TABLE IF NOT EXISTS hooks (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    hook_name TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS hooks_name ON hooks(hook_name, kind);
+CREATE INDEX IF NOT EXISTS hooks_file ON hooks(file_id);
+CREATE TABLE IF NOT EXISTS library_members (
+    library TEXT NOT NULL,
+    function_id INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    PRIMARY KEY (library, function_id)
+);
+CREATE INDEX IF NOT EXISTS library_members_function ON library_members(function_id);
+CREATE TABLE IF NOT EXISTS meta_members (
+    meta_type TEXT NOT NULL,
+    function_id INTEGER NOT NULL REFERENCES functions(id) ON DELETE CASCADE,
+    PRIMARY KEY (meta_type, function_id)
+);
+CREATE INDEX IF NOT EXISTS meta_members_function ON meta_members(function_id);
+"""
+# External-content FTS5 index over function names and descriptions, kept in step by triggers.
+SYMBOL_DB_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS functions_fts USING fts5(
+    name, description, content='functions', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS functions_fts_insert AFTER INSERT ON functions BEGIN
+    INSERT INTO functions_fts(rowid, name, description) VALUES (new.id, new.name, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS functions_fts_delete AFTER DELETE ON functions BEGIN
+    INSERT INTO functions_fts(functions_fts, rowid, name, description)
+    VALUES ('delete', old.id, old.name, old.description);
+END;
+"""
+SEARCH_INDEX_SUBDIR = "assets/search"
+SEARCH_LOADER_PATH = "assets/javascripts/symbol-search.js"
+SEARCH_INDEX_VERSION = 1
+# Shards above this many entries are split by the first two letters instead of one.
+SEARCH_SHARD_MAX_ENTRIES = 800
+SEARCH_SUMMARY_CHARS = 120
+# Material's search plugin skips pages carrying this front matter.
+SEARCH_EXCLUDE_FRONT_MATTER = "---\nsearch:\n  exclude: true\n---\n\n"
+DEFAULT_PROFILE_TOP = 10
 DEFAULT_SITE_NAME = "Parallax Framework Documentation"
 DEFAULT_SITE_DESCRIPTION = "Parallax manuals and generated API reference."
 DEFAULT_INDEX_CONTENT = """# Parallax Documentation
@@ -41,13 +183,208 @@ DEFAULT_EXTRA_CSS_CONTENT = """:root {
   --md-accent-fg-color: #a86bff;
 }
 """
+SYMBOL_SEARCH_JS = r"""// Generated by tools/generate_docs.py --search-index. Do not edit.
+// Looks symbols up in the sharded index under assets/search/, fetching only the
+// shard for the typed prefix, and lists matches above Material's search results.
+(function () {
+  "use strict";
+
+  var script = document.currentScript;
+  var siteRoot = new URL("../../", script.src);
+  var indexRoot = new URL("../search/", script.src);
+  var manifest = null;
+  var shards = {};
+
+  function shortName(name) {
+    var parts = name.split(/[.:]/);
+    return parts[parts.length - 1].toLowerCase();
+  }
+
+  function shardKey(text, length) {
+    var key = "";
+    for (var i = 0; i < length; i++) {
+      var c = text.charAt(i);
+      key += /[a-z0-9]/.test(c) ? c : "_";
+    }
+    return key;
+  }
+
+  function fetchJson(name) {
+    return fetch(new URL(name, indexRoot)).then(function (response) {
+      return response.ok ? response.json() : [];
+    });
+  }
+
+  function loadManifest() {
+    if (!manifest) {
+      manifest = fetchJson("manifest.json");
+    }
+    return manifest;
+  }
+
+  function loadShard(key) {
+    if (!shards[key]) {
+      shards[key] = fetchJson(key + ".json");
+    }
+    return shards[key];
+  }
+
+  // Entries are [name, kind, signature, realm, summary, url].
+  function lookup(query, limit) {
+    var text = query.trim().toLowerCase();
+    var prefix = shortName(text);
+    if (!prefix) {
+      return Promise.resolve([]);
+    }
+    var qualifier = text.slice(0, text.length - prefix.length);
+    return loadManifest().then(function (index) {
+      var first = shardKey(prefix, 1);
+      var keys = [first];
+      if ((index.split || []).indexOf(first) >= 0) {
+        keys = prefix.length > 1 ? [shardKey(prefix, 2)] : Object.keys(index.shards).filter(function (key) {
+          return key.charAt(0) === first && key.length === 2;
+        });
+      }
+      keys = keys.filter(function (key) { return key in index.shards; });
+      return Promise.all(keys.map(loadShard));
+    }).then(function (loaded) {
+      var matches = [];
+      loaded.forEach(function (entries) {
+        entries.forEach(function (entry) {
+          var name = entry[0].toLowerCase();
+          if (shortName(name).indexOf(prefix) === 0 && name.indexOf(qualifier) >= 0) {
+            matches.push(entry);
+          }
+        });
+      });
+      matches.sort(function (a, b) {
+        var exact = (shortName(b[0]) === prefix) - (shortName(a[0]) === prefix);
+        return exact || a[0].length - b[0].length || (a[0] < b[0] ? -1 : 1);
+      });
+      return matches.slice(0, limit || 20);
+    });
+  }
+
+  function attach() {
+    var input = document.querySelector(".md-search__input");
+    var output = document.querySelector(".md-search__scrollwrap");
+    if (!input || !output) {
+      return;
+    }
+    var panel = document.createElement("ol");
+    panel.className = "md-search-result__list ax-symbol-results";
+    output.insertBefore(panel, output.firstChild);
+
+    var pending = 0;
+    input.addEventListener("input", function () {
+      var ticket = ++pending;
+      lookup(input.value, 12).then(function (matches) {
+        if (ticket !== pending) {
+          return;
+        }
+        panel.textContent = "";
+        matches.forEach(function (entry) {
+          var item = document.createElement("li");
+          item.className = "md-search-result__item";
+          var link = document.createElement("a");
+          link.className = "md-search-result__link";
+          link.href = new URL(entry[5], siteRoot).href;
+          var article = document.createElement("article");
+          article.className = "md-search-result__article";
+          var title = document.createElement("h1");
+          title.className = "md-search-result__title";
+          var code = document.createElement("code");
+          code.textContent = entry[2];
+          title.appendChild(code);
+          article.appendChild(title);
+          var teaser = document.createElement("p");
+          teaser.className = "md-search-result__teaser";
+          teaser.textContent = [entry[3], entry[4]].filter(Boolean).join(" \u00b7 ");
+          article.appendChild(teaser);
+          link.appendChild(article);
+          item.appendChild(link);
+          panel.appendChild(item);
+        });
+      });
+    });
+  }
+
+  window.parallaxSymbolSearch = { lookup: lookup };
+  if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", attach);
+  } else {
+    attach();
+  }
+})();
+"""
+
+TABLE_SORT_JS = r"""// Generated by tools/generate_docs.py --panel-audit. Do not edit.
+// Makes the tables of pages whose title carries the ax-sortable class sortable:
+// click a header to sort by that column, click again to reverse.
+(function () {
+  "use strict";
+
+  function cellValue(row, column) {
+    var cell = row.cells[column];
+    return cell ? cell.textContent.trim() : "";
+  }
+
+  function sortTable(table, column, header) {
+    var body = table.tBodies[0];
+    if (!body) {
+      return;
+    }
+    var rows = Array.prototype.slice.call(body.rows);
+    var numeric = rows.every(function (row) {
+      var value = cellValue(row, column);
+      return value === "" || value === "-" || !isNaN(parseFloat(value));
+    });
+    var descending = header.getAttribute("aria-sort") !== "descending";
+    rows.sort(function (a, b) {
+      var x = cellValue(a, column);
+      var y = cellValue(b, column);
+      var order = numeric ? (parseFloat(x) || 0) - (parseFloat(y) || 0) : x.localeCompare(y);
+      return descending ? -order : order;
+    });
+    Array.prototype.forEach.call(header.parentNode.cells, function (cell) {
+      cell.removeAttribute("aria-sort");
+    });
+    header.setAttribute("aria-sort", descending ? "descending" : "ascending");
+    rows.forEach(function (row) {
+      body.appendChild(row);
+    });
+  }
+
+  function attach() {
+    var article = document.querySelector("article");
+    if (!article || !article.querySelector(".ax-sortable")) {
+      return;
+    }
+    Array.prototype.forEach.call(article.querySelectorAll("table"), function (table) {
+      var head = table.tHead;
+      if (!head || !head.rows.length) {
+        return;
+      }
+      Array.prototype.forEach.call(head.rows[0].cells, function (header, column) {
+        header.style.cursor = "pointer";
+        header.addEventListener("click", function () {
+          sortTable(table, column, header);
+        });
+      });
+    });
+  }
+
+  // Material's instant navigation swaps pages without reloading scripts.
+  if (typeof document$ !== "undefined") {
+    document$.subscribe(attach);
+  } else if (document.readyState === "loading") {
+    document.addEventListener("DOMContentLoaded", attach);
+  } else {
+    attach();
+  }
+})();
+"""
 
-FUNCTION_DEF_RE = re.compile(
-    r"^\s*(local\s+)?function\s+([A-Za-z_][\w\.:]*)\s*\(([^)]*)\)"
-)
-ASSIGN_FUNCTION_DEF_RE = re.compile(
-    r"^\s*([A-Za-z_][\w\.:]*)\s*=\s*function\s*\(([^)]*)\)"
-)
 HEADER_RE = re.compile(r"^\s*#\s+(.+)\s*$")
 
 PARAM_TAG_RE = re.compile(r"^@param\s+(\.\.\.|[A-Za-z_][\w]*)\s+([^\s]+)\s*(.*)$")
@@ -59,11 +396,6 @@ MODULE_TAG_RE = re.compile(r"^@module\s+([^\s]+)\s*$")
 SECTION_TAG_RE = re.compile(r"^@section\s+([^\s]+)\s*$")
 GENERIC_TAG_RE = re.compile(r"^@([A-Za-z_][\w\[\]=\.]*)\s+([A-Za-z_][\w]*)\s*(.*)$")
 
-GM_HOOK_DEF_RE = re.compile(r"^\s*(?:local\s+)?function\s+GM:([A-Za-z_][\w]*)\s*\(")
-MODULE_HOOK_DEF_RE = re.compile(r"^\s*(?:local\s+)?function\s+MODULE:([A-Za-z_][\w]*)\s*\(")
-HOOK_RUN_RE = re.compile(r'\bhook\.Run\s*\(\s*["\']([^"\']+)["\']')
-HOOK_ADD_RE = re.compile(r'\bhook\.Add\s*\(\s*["\']([^"\']+)["\']')
-
 META_TYPES = ("character", "color", "entity", "inventory", "item", "player", "tool")
 META_TYPE_TITLES = {
     "character": "Character Meta",
@@ -74,15 +406,188 @@ META_TYPE_TITLES = {
     "player": "Player Meta",
     "tool": "Tool Meta",
 }
-META_ALIAS_RE = re.compile(
-    r"^\s*(?:local\s+)?([A-Za-z_][\w]*)\s*=\s*ax\.({})\.meta\b".format("|".join(META_TYPES))
+META_TYPE_NAMES = {meta_type.capitalize(): meta_type for meta_type in META_TYPES}
+AX_META_FUNCTION_RE = re.compile(r"^ax\.({})\.meta[:\.]".format("|".join(META_TYPES)))
+
+# One pass over a file: strings and line comments are matched whole and skipped,
+# block comments are kept for doc lookup, and the keywords start a definition, a
+# hook call, a metatable alias or an `ax.net` call. The lookahead lets the engine
+# skip every other character without trying the alternatives.
+LUA_SCAN_RE = re.compile(
+    r"""
+    (?=[-/"'\[fhF.])
+    (?:
+        (?P<comment>--\[(?P<level>=*)\[.*?\](?P=level)\]|/\*.*?\*/)
+        |(?P<skip>
+            --[^\n]*
+            |//[^\n]*
+            |"(?:[^"\\\n]+|\\z\s*|\\.)*"?
+            |'(?:[^'\\\n]+|\\z\s*|\\.)*'?
+            |\[(?P<string_level>=*)\[.*?\](?P=string_level)\]
+        )
+        |(?P<keyword>\b(?:function|hook|FindMetaTable)\b)
+        |(?P<meta>\.meta\b)
+        |(?P<net>\.net:)
+    )
+    """,
+    re.VERBOSE | re.DOTALL,
 )
-META_FIND_RE = re.compile(
-    r"^\s*(?:local\s+)?([A-Za-z_][\w]*)\s*=.*FindMetaTable\s*\(\s*[\"'](Character|Color|Entity|Inventory|Item|Player|Tool)[\"']\s*\)"
+# GMod Lua accepts C-style comments and the !=, && and || operators.
+LUA_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    |(?P<comment>--|//|/\*)
+    |(?P<long>\[=*\[)
+    |(?P<quote>["'])
+    |(?P<name>[^\W\d]\w*)
+    |(?P<number>0[xX][0-9A-Fa-f]+|(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    |(?P<op>\.\.\.|\.\.|==|~=|!=|<=|>=|&&|\|\||::|<<|>>|.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+LONG_BRACKET_RE = re.compile(r"\[(=*)\[")
+# Fast path for the usual comment-free `function name(args)` head; anything else
+# goes through the tokenizer.
+FUNCTION_HEAD_RE = re.compile(r"\s*([^\W\d]\w*(?:\s*[.:]\s*[^\W\d]\w*)*)?\s*\(([\w\s,.]*)\)")
+PARAM_NAME_RE = re.compile(r"[^\W\d]\w*|\.\.\.")
+SHORT_STRING_RES = {
+    quote: re.compile(r"{0}(?:[^{0}\\\n]|\\z\s*|\\[\s\S])*{0}?".format(quote))
+    for quote in ("\"", "'")
+}
+LUA_KEYWORDS = frozenset(
+    (
+        "and", "break", "continue", "do", "else", "elseif", "end", "false", "for", "function", "goto",
+        "if", "in", "local", "nil", "not", "or", "repeat", "return", "then", "true", "until", "while",
+    )
 )
-AX_META_FUNCTION_RE = re.compile(r"^ax\.({})\.meta[:\.]".format("|".join(META_TYPES)))
 
 HOOK_KIND_ORDER = ("gm", "module", "run", "add")
+# Engine hooks that fire every frame or tick: name -> (cadence, realms the engine calls it in).
+HOT_HOOKS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "Think": ("frame", ("client", "server")),
+    "Tick": ("frame", ("client", "server")),
+    "HUDPaint": ("frame", ("client",)),
+    "HUDPaintBackground": ("frame", ("client",)),
+    "HUDShouldDraw": ("frame", ("client",)),
+    "HUDDrawTargetID": ("frame", ("client",)),
+    "PreDrawHUD": ("frame", ("client",)),
+    "PostDrawHUD": ("frame", ("client",)),
+    "DrawOverlay": ("frame", ("client",)),
+    "PostRenderVGUI": ("frame", ("client",)),
+    "PreRender": ("frame", ("client",)),
+    "PostRender": ("frame", ("client",)),
+    "RenderScene": ("frame", ("client",)),
+    "RenderScreenspaceEffects": ("frame", ("client",)),
+    "PreDrawOpaqueRenderables": ("frame", ("client",)),
+    "PostDrawOpaqueRenderables": ("frame", ("client",)),
+    "PreDrawTranslucentRenderables": ("frame", ("client",)),
+    "PostDrawTranslucentRenderables": ("frame", ("client",)),
+    "PreDrawViewModel": ("frame", ("client",)),
+    "PostDrawViewModel": ("frame", ("client",)),
+    "PreDrawEffects": ("frame", ("client",)),
+    "PostDrawEffects": ("frame", ("client",)),
+    "NeedsDepthPass": ("frame", ("client",)),
+    "SetupWorldFog": ("frame", ("client",)),
+    "SetupSkyboxFog": ("frame", ("client",)),
+    "GetMotionBlurValues": ("frame", ("client",)),
+    "CalcView": ("frame", ("client",)),
+    "CalcViewModelView": ("frame", ("client",)),
+    "ShouldDrawLocalPlayer": ("frame", ("client",)),
+    "CreateMove": ("frame", ("client",)),
+    "InputMouseApply": ("frame", ("client",)),
+    "AdjustMouseSensitivity": ("frame", ("client",)),
+    "PlayerTick": ("player", ("client", "server")),
+    "PlayerPostThink": ("player", ("client", "server")),
+    "StartCommand": ("player", ("client", "server")),
+    "SetupMove": ("player", ("client", "server")),
+    "Move": ("player", ("client", "server")),
+    "FinishMove": ("player", ("client", "server")),
+    "CalcMainActivity": ("player", ("client", "server")),
+    "TranslateActivity": ("player", ("client", "server")),
+    "UpdateAnimation": ("player", ("client", "server")),
+    "GrabEarAnimation": ("player", ("client",)),
+    "MouthMoveAnimation": ("player", ("client",)),
+    "PrePlayerDraw": ("player", ("client",)),
+    "PostPlayerDraw": ("player", ("client",)),
+    "SetupPlayerVisibility": ("player", ("server",)),
+    "PlayerCanHearPlayersVoice": ("pair", ("server",)),
+    "ShouldCollide": ("pair", ("client", "server")),
+}
+HOT_HOOK_CADENCES = {
+    "frame": "every frame or tick",
+    "player": "per player, every frame or tick",
+    "pair": "per pair of players or entities",
+}
+# Listener kinds that add work to a hot hook; hook.Run callers are only counted.
+HOT_HOOK_LISTENER_KINDS = ("gm", "module", "add")
+HOT_HOOKS_PAGE = "hot.md"
+HOT_HOOKS_JSON = "hot.json"
+HOT_HOOKS_VERSION = 1
+DEFAULT_HOT_HOOKS_BUDGET = "tools/hot-hooks-budget.json"
+# Used for hooks and settings the budget file leaves out; 0 disables a limit.
+DEFAULT_HOT_HOOK_LIMITS = {"listeners": 3, "complexity": 0}
+# ax.net methods -> how many leading arguments name the message and its recipients.
+NET_METHODS = {"Hook": 1, "Start": 2, "StartPVS": 2, "StartPAS": 2, "StartOmit": 2}
+NET_SEND_TARGETS = {"StartPVS": "pvs", "StartPAS": "pas", "StartOmit": "omit"}
+NET_SEND_CALLS = frozenset(f"ax.net:{method}" for method in NET_METHODS if method != "Hook")
+NET_TARGET_TITLE = {
+    "server": "to server",
+    "broadcast": "broadcast",
+    "player": "player(s)",
+    "pvs": "PVS",
+    "pas": "PAS",
+    "omit": "all but player(s)",
+}
+NET_CATALOG_PAGE = "network.md"
+NET_CATALOG_JSON = "network.json"
+NET_CATALOG_VERSION = 1
+NET_IDS_PAGE = "network-ids.md"
+NET_IDS_JSON = "network-ids.json"
+NET_IDS_VERSION = 1
+DEFAULT_NET_IDS_FILE = "gamemode/framework/libraries/sh_net_ids.lua"
+# Hot-path lint rules: id -> (SARIF level, short description).
+HOT_LINT_RULES = {
+    "per-call-resource": ("error", "Material(), CreateMaterial() or surface.CreateFont() called every frame"),
+    "entity-search": ("warning", "player.GetAll(), ents.GetAll() or an ents.Find* search every frame"),
+    "find-metatable": ("warning", "FindMetaTable() looked up every frame"),
+    "concat-in-loop": ("warning", "String concatenation inside a loop"),
+    "table-constructor": ("warning", "Table constructor allocates every frame"),
+    "per-call-color": ("warning", "Color() allocates every frame"),
+    "constant-setting-get": ("note", "ax.config:Get()/ax.option:Get() with a constant key every frame"),
+}
+HOT_LINT_LEVELS = ("note", "warning", "error")
+HOT_LINT_PAGE = "hot-lint.md"
+HOT_LINT_SARIF = "hot-lint.sarif.json"
+HOT_LINT_VERSION = 1
+HOT_LINT_SEARCH_CALLS = frozenset(("player.GetAll", "player.GetHumans", "player.GetBots", "ents.GetAll"))
+HOT_LINT_RESOURCE_CALLS = frozenset(("Material", "CreateMaterial", "surface.CreateFont"))
+HOT_LINT_SETTING_CALLS = frozenset(("ax.config:Get", "ax.option:Get"))
+# `-- ax-lint: ignore [rule, ...]` on a finding's line or the line above; `ignore-file` anywhere in the file.
+HOT_LINT_SUPPRESS_RE = re.compile(r"(?:--|//)\s*ax-lint:\s*(ignore-file|ignore)\b([\w \t,-]*)")
+PANEL_AUDIT_PAGE = "panels.md"
+PANEL_AUDIT_JSON = "panels.json"
+PANEL_AUDIT_VERSION = 1
+PANEL_METHODS = ("Paint", "PaintOver", "Think", "PerformLayout")
+PANEL_PAINT_METHODS = ("Paint", "PaintOver")
+PANEL_MEASURE_CALLS = frozenset(
+    (
+        "surface.GetTextSize", "draw.GetFontHeight", "ax.util:GetTextWidth", "ax.util:GetTextHeight",
+        "ax.util:GetWrappedText", "markup.Parse",
+    )
+)
+PANEL_ALLOC_CALLS = frozenset(("Color", "Vector", "Angle", "Material", "CreateMaterial", "string.format", "Format"))
+# Relative cost of one operation of each kind; every enclosing loop multiplies it by PANEL_LOOP_FACTOR.
+PANEL_COST_WEIGHTS = {"draw": 1, "measure": 4, "alloc": 2}
+PANEL_LOOP_FACTOR = 4
+TABLE_SORT_PATH = "assets/javascripts/table-sort.js"
+# Callbacks handed to these run later, repeatedly for timer.Create.
+NET_TIMER_CALLS = frozenset(("timer.Create", "timer.Simple", "timer.Adjust"))
+# Methods the engine calls every frame on entities, weapons and panels.
+NET_FRAME_METHODS = frozenset(("Think", "Paint", "PaintOver", "Draw", "DrawTranslucent", "DrawHUD"))
+NET_FRAME_OWNERS = frozenset(("ENT", "SWEP", "PANEL"))
+# Table names whose methods are looked up next to the calling file rather than globally.
+NET_LOCAL_OWNERS = frozenset(("self", "MODULE", "PANEL", "ENT", "SWEP"))
+NET_HOOK_OWNERS = frozenset(("GM", "MODULE", "SCHEMA"))
 HOOK_KIND_TITLE = {
     "gm": "GM Hook Definitions",
     "module": "MODULE Hook Definitions",
@@ -110,14 +615,14 @@ PARAM_FALLBACK_TAGS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamDoc:
     name: str
     type_name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnDoc:
     type_name: str
     description: str
@@ -146,20 +651,21 @@ class ParsedComment:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDoc:
     name: str
     signature: str
     line: int
     description: str
     realm: Optional[str]
-    params: List[ParamDoc]
-    returns: List[ReturnDoc]
-    usage: List[str]
+    # Tuples rather than lists: no spare capacity, and the empty tuple is shared.
+    params: Tuple[ParamDoc, ...]
+    returns: Tuple[ReturnDoc, ...]
+    usage: Tuple[str, ...]
     meta_type: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDoc:
     source_path: Path
     source_group: str
@@ -171,7 +677,7 @@ class FileDoc:
     functions: List[FunctionDoc]
 
 
-@dataclass
+@dataclass(slots=True)
 class HookOccurrence:
     kind: str
     hook_name: str
@@ -179,7 +685,73 @@ class HookOccurrence:
     line: int
 
 
-def parse_args() -> argparse.Namespace:
+@dataclass(slots=True)
+class NetOccurrence:
+    """An `ax.net` send or receiver; name is None when the message name is computed at runtime."""
+
+    direction: str
+    name: Optional[str]
+    # The name argument as written, kept for computed names.
+    expression: str
+    # Sends only: "server", "broadcast", "player", "pvs", "pas", "omit", or None when it cannot be told.
+    target: Optional[str]
+    source_path: Path
+    line: int
+
+
+@dataclass(slots=True)
+class ScannedFile:
+    """Everything a single read of one Lua file produces for the later stages."""
+
+    source_path: Path
+    file_doc: Optional[FileDoc]
+    meta_aliases: Dict[str, str]
+    hooks: List[HookOccurrence]
+    net: List[NetOccurrence] = field(default_factory=list)
+
+
+class LuaToken(NamedTuple):
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+class LuaEvent(NamedTuple):
+    """A definition, hook occurrence or metatable alias found by scan_lua_events."""
+
+    line: int
+    kind: str
+    name: str
+    value: object
+
+
+@dataclass
+class LongComment:
+    start_line: int
+    end_line: int
+    body: str
+    standalone: bool
+
+    @property
+    def is_doc(self) -> bool:
+        # `--[[--` opens an LDoc block and `--[[-----` banners title the code below.
+        if self.body.startswith("--"):
+            return True
+        return any(line.lstrip().startswith("@") for line in self.body.split("\n"))
+
+    def doc_lines(self) -> List[str]:
+        lines = [line.rstrip() for line in self.body.split("\n")]
+        lines = [line for line in lines if not line.strip() or line.strip().strip("-")]
+        lines = textwrap.dedent("\n".join(lines)).split("\n")
+        while lines and not lines[0].strip():
+            lines.pop(0)
+        while lines and not lines[-1].strip():
+            lines.pop()
+        return lines
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate MkDocs docs for Parallax.")
     parser.add_argument(
         "--root",
@@ -246,17 +818,228 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_SITE_DESCRIPTION,
         help="site_description value written to mkdocs.yml.",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help="Parse cache directory (relative to --root unless absolute).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the on-disk parse cache.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=default_job_count(),
+        help="Worker processes used to parse Lua files (default: CPU count, 1 disables).",
+    )
     parser.add_argument(
         "--clean",
         action="store_true",
         help="Remove the generated API directory before writing.",
     )
+    parser.add_argument(
+        "--symbol-index",
+        nargs="?",
+        const=f"{DEFAULT_DOCS_DIR}/{SYMBOL_INDEX_FILE}",
+        default=None,
+        help=(
+            "Also write every documented function, hook occurrence and library/meta grouping as a "
+            f"streamed symbol index: NDJSON, or a JSON array if the path ends in .json "
+            f"(default path: {DEFAULT_DOCS_DIR}/{SYMBOL_INDEX_FILE})."
+        ),
+    )
+    parser.add_argument(
+        "--symbol-db",
+        nargs="?",
+        const=f"{DEFAULT_CACHE_DIR}/{SYMBOL_DB_FILE}",
+        default=None,
+        help=(
+            "Also keep the parsed model in a SQLite database for the query subcommand; only files whose "
+            f"content hash changed are rewritten (default path: {DEFAULT_CACHE_DIR}/{SYMBOL_DB_FILE})."
+        ),
+    )
+    parser.add_argument(
+        "--hot-hooks",
+        action="store_true",
+        help=(
+            f"Also write {DEFAULT_HOOKS_SUBDIR}/{HOT_HOOKS_PAGE} and {DEFAULT_HOOKS_SUBDIR}/{HOT_HOOKS_JSON}: listener "
+            "fan-out and body size of per-frame hooks. The run fails when a hook exceeds its budget."
+        ),
+    )
+    parser.add_argument(
+        "--hot-hooks-budget",
+        default=DEFAULT_HOT_HOOKS_BUDGET,
+        help=(
+            "JSON budget for --hot-hooks: default \"listeners\"/\"complexity\" limits per hook and realm, with "
+            "overrides under \"hooks\" keyed Name or Name@realm "
+            f"(default: {DEFAULT_HOT_HOOKS_BUDGET}; built-in limits if missing)."
+        ),
+    )
+    parser.add_argument(
+        "--net-catalog",
+        action="store_true",
+        help=(
+            f"Also write {DEFAULT_HOOKS_SUBDIR}/{NET_CATALOG_PAGE} and {DEFAULT_HOOKS_SUBDIR}/{NET_CATALOG_JSON}: every "
+            "ax.net message with its senders and receivers, orphans on either side, and sends reachable from "
+            "per-frame hooks or timers."
+        ),
+    )
+    parser.add_argument(
+        "--net-ids",
+        nargs="?",
+        const=DEFAULT_NET_IDS_FILE,
+        default=None,
+        help=(
+            "Also write a shared Lua table numbering every literal ax.net message name, with a hash of the set, "
+            f"and {DEFAULT_HOOKS_SUBDIR}/{NET_IDS_PAGE} with the bytes each send saves (default path: {DEFAULT_NET_IDS_FILE})."
+        ),
+    )
+    parser.add_argument(
+        "--hot-lint",
+        action="store_true",
+        help=(
+            f"Also write {DEFAULT_HOOKS_SUBDIR}/{HOT_LINT_PAGE} and {DEFAULT_HOOKS_SUBDIR}/{HOT_LINT_SARIF}: known "
+            "performance traps in functions run every frame. Silence one with `-- ax-lint: ignore [rule]`."
+        ),
+    )
+    parser.add_argument(
+        "--fail-on",
+        choices=("none",) + HOT_LINT_LEVELS,
+        default="none",
+        help="With --hot-lint, fail the run on unsuppressed findings at or above this level (default: none).",
+    )
+    parser.add_argument(
+        "--panel-audit",
+        action="store_true",
+        help=(
+            f"Also write {DEFAULT_API_SUBDIR}/{PANEL_AUDIT_PAGE} and {DEFAULT_API_SUBDIR}/{PANEL_AUDIT_JSON}: every "
+            "vgui.Register panel with its base and overrides, and a sortable static cost ranking of paint methods."
+        ),
+    )
+    parser.add_argument(
+        "--snippet-includes",
+        action="store_true",
+        help=(
+            "Write each function block only on its API page and include it into library pages "
+            "through pymdownx.snippets sections instead of repeating it."
+        ),
+    )
+    parser.add_argument(
+        "--manuals-mode",
+        choices=MANUALS_MODES,
+        default="auto",
+        help=(
+            "How manuals are mirrored into the docs dir: auto (reflink where supported, else copy), copy "
+            "(byte copy, skipped while size and mtime match), reflink, hardlink or symlink. Default: auto."
+        ),
+    )
+    parser.add_argument(
+        "--page-budget",
+        type=int,
+        default=DEFAULT_PAGE_BUDGET_KB,
+        metavar="KB",
+        help=(
+            "Split library and hook pages larger than this into per-letter sub-pages behind an index page "
+            f"(default: {DEFAULT_PAGE_BUDGET_KB}; 0 disables)."
+        ),
+    )
+    parser.add_argument(
+        "--search-index",
+        action="store_true",
+        help=(
+            f"Emit a sharded symbol search index under <docs-dir>/{SEARCH_INDEX_SUBDIR} with a client-side "
+            "loader, and exclude generated pages from the MkDocs search plugin."
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Report wall time and peak traced memory per phase, the slowest files and the largest pages.",
+    )
+    parser.add_argument(
+        "--profile-json",
+        default=None,
+        help=f"Where --profile writes its JSON report (default: <cache-dir>/{PROFILE_FILE}).",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_PROFILE_TOP,
+        help="How many slowest files and largest pages --profile lists.",
+    )
+    parser.add_argument(
+        "--cprofile",
+        default=None,
+        help="Also dump cProfile statistics of the run to this file (for pstats or snakeviz).",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help=(
+            "Reparse only the Lua and manual files git reports as changed between REV and the working tree, "
+            "merging them into the model stored by the previous generation."
+        ),
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help=(
+            "Only fingerprint the inputs (Lua sources, manuals, handwritten docs, generator and options) and "
+            "exit 0 if they match the last generation, 1 if the docs need regenerating."
+        ),
+    )
+    parser.add_argument(
+        "--write-fingerprint",
+        action="store_true",
+        help="Only store the current input fingerprint, e.g. once CI has deployed the site it was built from.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate only the pages affected by each source or manual change.",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
         help="Show what would be written without changing files.",
     )
-    return parser.parse_args()
+
+    commands = parser.add_subparsers(dest="command", metavar="{query}")
+    query = commands.add_parser(
+        "query",
+        help="Answer questions from the --symbol-db database instead of regenerating pages.",
+        description="Query the symbol database written by --symbol-db.",
+    )
+    query_common = argparse.ArgumentParser(add_help=False)
+    query_common.add_argument(
+        "--db",
+        default=f"{DEFAULT_CACHE_DIR}/{SYMBOL_DB_FILE}",
+        help="Symbol database (relative to --root unless absolute).",
+    )
+    query_common.add_argument("--json", action="store_true", help="Print the rows as a JSON array.")
+    query_common.add_argument("--limit", type=int, default=0, help="Print at most this many rows (0: all).")
+    queries = query.add_subparsers(dest="query", required=True)
+    hook_query = queries.add_parser("hook", parents=[query_common], help="Where a hook is defined, run or listened to.")
+    hook_query.add_argument("name", help="Hook name, e.g. PlayerLoadout.")
+    hook_query.add_argument("--kind", choices=HOOK_KIND_ORDER, help="Only gm/module definitions, hook.Run or hook.Add.")
+    functions_query = queries.add_parser("functions", parents=[query_common], help="Documented functions by filter.")
+    functions_query.add_argument(
+        "--name", help="Glob on the full name, e.g. 'ax.character.*'; '.' and ':' match each other."
+    )
+    functions_query.add_argument("--library", help="Library the function is listed under, e.g. ax.character.")
+    functions_query.add_argument("--meta", help="Meta type the function is listed under, e.g. player.")
+    functions_query.add_argument("--realm", help="Realm: client, server or shared.")
+    search_query = queries.add_parser("search", parents=[query_common], help="Full-text search over names and descriptions.")
+    search_query.add_argument(
+        "text", help="Search terms (FTS5 query syntax; text FTS5 rejects, like 'ax.character', is searched as phrases)."
+    )
+
+    args = parser.parse_args(argv)
+    if args.since and args.clean:
+        parser.error("--since cannot be combined with --clean")
+    return args
 
 
 def normalize_path(root: Path, path_str: str) -> Path:
@@ -273,18 +1056,13 @@ def read_text(path: Path) -> str:
         return path.read_text(encoding="latin-1", errors="replace")
 
 
-def find_function_definition(line: str) -> Optional[Tuple[str, str]]:
-    match = FUNCTION_DEF_RE.match(line)
-    if match:
-        if match.group(1):  # local function — skip
-            return None
-        return match.group(2), match.group(3)
-
-    match = ASSIGN_FUNCTION_DEF_RE.match(line)
-    if match:
-        return match.group(1), match.group(2)
-
-    return None
+def decode_source(data: bytes) -> str:
+    """Decode raw file bytes the same way read_text does, newline translation included."""
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        text = data.decode("latin-1", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
 def infer_realm_from_filename(file_path: Path) -> Optional[str]:
@@ -298,21 +1076,10 @@ def infer_realm_from_filename(file_path: Path) -> Optional[str]:
     return None
 
 
-def update_meta_aliases(line: str, aliases: Dict[str, str]) -> None:
-    alias_match = META_ALIAS_RE.match(line)
-    if alias_match:
-        aliases[alias_match.group(1)] = alias_match.group(2)
-        return
-
-    find_match = META_FIND_RE.match(line)
-    if find_match:
-        aliases[find_match.group(1)] = find_match.group(2).lower()
-
-
 def infer_meta_type(function_name: str, aliases: Dict[str, str]) -> Optional[str]:
     ax_match = AX_META_FUNCTION_RE.match(function_name)
     if ax_match:
-        return ax_match.group(1)
+        return sys.intern(ax_match.group(1))
 
     if ":" in function_name:
         prefix = function_name.split(":", 1)[0]
@@ -324,7 +1091,16 @@ def infer_meta_type(function_name: str, aliases: Dict[str, str]) -> Optional[str
     return aliases.get(prefix)
 
 
-def collect_doc_lines_above(lines: Sequence[str], index: int) -> List[str]:
+def collect_doc_lines_above(
+    lines: Sequence[str],
+    index: int,
+    long_comments: Optional[Dict[int, LongComment]] = None,
+) -> List[str]:
+    """Collect the comment block above lines[index].
+
+    long_comments maps the last line of each `--[[ ]]` comment to the comment, so
+    block comments are read as a whole instead of line by line.
+    """
     cursor = index - 1
 
     while cursor >= 0 and lines[cursor].strip() == "":
@@ -333,8 +1109,18 @@ def collect_doc_lines_above(lines: Sequence[str], index: int) -> List[str]:
     if cursor < 0:
         return []
 
-    block: List[str] = []
+    block: List[object] = []
+    has_doc_signal = False
     while cursor >= 0:
+        comment = long_comments.get(cursor) if long_comments else None
+        if comment is not None and comment.standalone:
+            if comment.is_doc:
+                block.append(comment.doc_lines())
+                has_doc_signal = True
+            elif comment.start_line != comment.end_line:
+                break
+            cursor = comment.start_line - 1
+            continue
         stripped = lines[cursor].lstrip()
         if stripped.startswith("--") or stripped == "":
             block.append(lines[cursor])
@@ -344,9 +1130,11 @@ def collect_doc_lines_above(lines: Sequence[str], index: int) -> List[str]:
 
     block.reverse()
     cleaned: List[str] = []
-    has_doc_signal = False
-    for raw_line in block:
-        stripped = raw_line.lstrip()
+    for entry in block:
+        if isinstance(entry, list):
+            cleaned.extend(entry)
+            continue
+        stripped = entry.lstrip()
         if stripped.startswith("--[[") or stripped.startswith("]]"):
             continue
         if stripped.startswith("---"):
@@ -403,7 +1191,7 @@ def parse_comment_lines(comment_lines: Sequence[str]) -> ParsedComment:
 
             realm_match = REALM_TAG_RE.match(line)
             if realm_match:
-                parsed.realm = realm_match.group(1).strip()
+                parsed.realm = sys.intern(realm_match.group(1).strip())
                 continue
 
             usage_match = USAGE_TAG_RE.match(line)
@@ -426,8 +1214,8 @@ def parse_comment_lines(comment_lines: Sequence[str]) -> ParsedComment:
 
                 parsed.params.append(
                     ParamDoc(
-                        name=name,
-                        type_name=type_name.strip(),
+                        name=sys.intern(name),
+                        type_name=sys.intern(type_name.strip()),
                         description=description,
                     )
                 )
@@ -438,7 +1226,7 @@ def parse_comment_lines(comment_lines: Sequence[str]) -> ParsedComment:
             if return_match:
                 type_name = return_match.group(1).rstrip(":")
                 description = return_match.group(2).lstrip("-: ").strip()
-                parsed.returns.append(ReturnDoc(type_name=type_name.strip(), description=description))
+                parsed.returns.append(ReturnDoc(type_name=sys.intern(type_name.strip()), description=description))
                 context = "return"
                 continue
 
@@ -446,7 +1234,7 @@ def parse_comment_lines(comment_lines: Sequence[str]) -> ParsedComment:
             if treturn_match:
                 type_name = treturn_match.group(1).rstrip(":")
                 description = treturn_match.group(2).lstrip("-: ").strip()
-                parsed.returns.append(ReturnDoc(type_name=type_name.strip(), description=description))
+                parsed.returns.append(ReturnDoc(type_name=sys.intern(type_name.strip()), description=description))
                 context = "return"
                 continue
 
@@ -522,12 +1310,6 @@ def parse_file_metadata(lines: Sequence[str], first_function_index: int) -> Tupl
     return module, section, summary
 
 
-def sanitize_signature_args(args: str) -> str:
-    parts = [part.strip() for part in args.split(",")]
-    parts = [part for part in parts if part]
-    return ", ".join(parts)
-
-
 _LIST_LINE_RE = re.compile(r"^\s*[-*+]\s|^\s*\d+[.)]\s")
 
 
@@ -600,6 +1382,85 @@ def anchor_for_function(function_doc: FunctionDoc) -> str:
     return slugify(f"{function_doc.name}-{function_doc.line}")
 
 
+def function_symbol(function_doc: FunctionDoc) -> str:
+    return f"function:{anchor_for_function(function_doc)}"
+
+
+def hook_symbol(kind: str, hook_name: str) -> str:
+    return f"hook:{kind}:{hook_name}"
+
+
+def page_letter(name: str) -> str:
+    """Bucket a symbol by the first character of its short name; '#' collects the rest."""
+    first = re.split(r"[.:]", name)[-1][:1].upper()
+    return first if first.isascii() and first.isalnum() else "#"
+
+
+def letter_label(letter: str) -> str:
+    return "Other" if letter == "#" else letter
+
+
+def letter_page_path(page: Path, letter: str) -> Path:
+    slug = "other" if letter == "#" else letter.lower()
+    return page.with_suffix("") / f"letter-{slug}.md"
+
+
+def split_by_letter(page: Path, sized_names: Sequence[Tuple[str, int]], budget: int) -> Optional[Dict[str, Path]]:
+    """Return letter -> sub-page when the entries of page exceed budget bytes, else None."""
+    if budget <= 0 or sum(size for _, size in sized_names) <= budget:
+        return None
+    letters = sorted({page_letter(name) for name, _ in sized_names}, key=lambda letter: (letter == "#", letter))
+    if len(letters) < 2:
+        return None
+    return {letter: letter_page_path(page, letter) for letter in letters}
+
+
+def render_letter_index(
+    lines: List[str],
+    current_doc: Path,
+    parts: Dict[str, Path],
+    list_heading: str,
+    items: Sequence[Tuple[str, str, str]],
+) -> None:
+    """Append the sub-page table and a symbol list linking into the sub-pages; items are (name, label, anchor)."""
+    counts: Dict[str, int] = defaultdict(int)
+    for name, _, _ in items:
+        counts[page_letter(name)] += 1
+
+    lines.append("## Pages")
+    lines.append("")
+    lines.append("| Letter | Entries |")
+    lines.append("| --- | --- |")
+    for letter, part in parts.items():
+        lines.append(f"| [{letter_label(letter)}]({relative_doc_link(current_doc, part)}) | {counts[letter]} |")
+    lines.append("")
+
+    lines.append(f"## {list_heading}")
+    lines.append("")
+    for name, label, anchor in items:
+        lines.append(f"- [`{label}`]({relative_doc_link(current_doc, parts[page_letter(name)])}#{anchor})")
+    lines.append("")
+
+
+def nav_page_lines(
+    label: str,
+    page: Path,
+    indent: int,
+    page_splits: Optional[Dict[Path, Dict[str, Path]]] = None,
+) -> List[str]:
+    parts = (page_splits or {}).get(page)
+    if not parts:
+        return [f'{" " * indent}- {yaml_quote(label)}: {normalize_nav_path(page.as_posix())}']
+
+    lines = [
+        f'{" " * indent}- {yaml_quote(label)}:',
+        f'{" " * (indent + 4)}- "Overview": {normalize_nav_path(page.as_posix())}',
+    ]
+    for letter, part in parts.items():
+        lines.append(f'{" " * (indent + 4)}- {yaml_quote(letter_label(letter))}: {normalize_nav_path(part.as_posix())}')
+    return lines
+
+
 def _library_summary(entries: Sequence[Tuple["FileDoc", "FunctionDoc"]]) -> Optional[str]:
     for file_doc, _ in entries:
         if file_doc.summary:
@@ -693,6 +1554,99 @@ def build_meta_index(file_docs: Sequence[FileDoc]) -> Dict[str, List[Tuple[FileD
     return {meta_type: index[meta_type] for meta_type in META_TYPES if meta_type in index}
 
 
+def render_function_block(function_doc: FunctionDoc) -> str:
+    """Render the anchor, heading, description, realm, parameters, returns and usage of one function."""
+    lines: List[str] = []
+    lines.append(f'<a id="{anchor_for_function(function_doc)}"></a>')
+    lines.append(f"### `{function_doc.signature}`")
+    lines.append("")
+
+    if function_doc.description:
+        lines.append(function_doc.description)
+        lines.append("")
+
+    if function_doc.realm:
+        lines.append(f"Realm: `{function_doc.realm}`")
+        lines.append("")
+
+    if function_doc.params:
+        lines.append("**Parameters**")
+        lines.append("")
+        lines.append("| Name | Type | Description |")
+        lines.append("| --- | --- | --- |")
+        for param in function_doc.params:
+            lines.append(
+                "| `{}` | `{}` | {} |".format(
+                    escape_table_cell(param.name),
+                    escape_table_cell(param.type_name),
+                    escape_table_cell(param.description or "-"),
+                )
+            )
+        lines.append("")
+
+    if function_doc.returns:
+        lines.append("**Returns**")
+        lines.append("")
+        for return_doc in function_doc.returns:
+            if return_doc.description:
+                lines.append(f"- `{return_doc.type_name}`: {return_doc.description}")
+            else:
+                lines.append(f"- `{return_doc.type_name}`")
+        lines.append("")
+
+    if function_doc.usage:
+        lines.append("**Usage**")
+        lines.append("")
+        for snippet in function_doc.usage:
+            lines.append("```lua")
+            lines.append(snippet.rstrip())
+            lines.append("```")
+            lines.append("")
+
+    return "\n".join(lines).rstrip("\n")
+
+
+def _snippet_section(function_doc: FunctionDoc) -> str:
+    # Snippet section names must start with a lowercase letter.
+    return f"fn-{anchor_for_function(function_doc)}"
+
+
+class FunctionBlocks:
+    """Renders each FunctionDoc once and hands the block to every page that lists it.
+
+    With snippet includes enabled, API pages wrap each block in a pymdownx.snippets section
+    and library pages pull it in from there instead of repeating the Markdown.
+    """
+
+    def __init__(self, includes: bool = False, shared: Optional[set[int]] = None) -> None:
+        self.includes = includes
+        # id()s of the functions listed on more than one page; only their blocks are kept.
+        # None keeps every block.
+        self.shared = shared
+        # Keyed by id(): FunctionDoc is an unhashable dataclass and outlives this cache via the model.
+        self._blocks: Dict[int, str] = {}
+
+    def render(self, function_doc: FunctionDoc) -> str:
+        block = self._blocks.get(id(function_doc))
+        if block is None:
+            block = render_function_block(function_doc)
+            if self.shared is None or id(function_doc) in self.shared:
+                self._blocks[id(function_doc)] = block
+        return block
+
+    def define(self, function_doc: FunctionDoc) -> str:
+        block = self.render(function_doc)
+        if not self.includes:
+            return block
+        section = _snippet_section(function_doc)
+        return f"<!-- --8<-- [start:{section}] -->\n{block}\n<!-- --8<-- [end:{section}] -->"
+
+    def include(self, file_doc: FileDoc, function_doc: FunctionDoc) -> str:
+        if not self.includes:
+            return self.render(function_doc)
+        return f'--8<-- "{file_doc.output_relative.as_posix()}:{_snippet_section(function_doc)}"'
+
+
 def render_meta_index(
     meta_index: Dict[str, List[Tuple[FileDoc, FunctionDoc]]],
     meta_pages: Dict[str, Path],
@@ -731,7 +1685,9 @@ def render_meta_page(
     meta_type: str,
     output_relative: Path,
     entries: Sequence[Tuple[FileDoc, FunctionDoc]],
+    blocks: Optional[FunctionBlocks] = None,
 ) -> str:
+    blocks = blocks or FunctionBlocks()
     title = META_TYPE_TITLES.get(meta_type, pretty_nav_label(meta_type))
     realms = sorted({fn.realm for _, fn in entries if fn.realm})
     realm_str = ", ".join(f"`{r}`" for r in realms)
@@ -758,58 +1714,14 @@ def render_meta_page(
 
     for file_doc, function_doc in entries:
         source_rel = file_doc.source_path.relative_to(root).as_posix()
-        lines.append(f'<a id="{anchor_for_function(function_doc)}"></a>')
-        lines.append(f"### `{function_doc.signature}`")
+        lines.append(blocks.render(function_doc))
+        lines.append("")
+        lines.append(f"Source: `{source_rel}:{function_doc.line}`")
+        lines.append("")
+        lines.append("---")
         lines.append("")
 
-        if function_doc.description:
-            lines.append(function_doc.description)
-            lines.append("")
-
-        if function_doc.realm:
-            lines.append(f"Realm: `{function_doc.realm}`")
-            lines.append("")
-
-        if function_doc.params:
-            lines.append("**Parameters**")
-            lines.append("")
-            lines.append("| Name | Type | Description |")
-            lines.append("| --- | --- | --- |")
-            for param in function_doc.params:
-                lines.append(
-                    "| `{}` | `{}` | {} |".format(
-                        escape_table_cell(param.name),
-                        escape_table_cell(param.type_name),
-                        escape_table_cell(param.description or "-"),
-                    )
-                )
-            lines.append("")
-
-        if function_doc.returns:
-            lines.append("**Returns**")
-            lines.append("")
-            for return_doc in function_doc.returns:
-                if return_doc.description:
-                    lines.append(f"- `{return_doc.type_name}`: {return_doc.description}")
-                else:
-                    lines.append(f"- `{return_doc.type_name}`")
-            lines.append("")
-
-        if function_doc.usage:
-            lines.append("**Usage**")
-            lines.append("")
-            for snippet in function_doc.usage:
-                lines.append("```lua")
-                lines.append(snippet.rstrip())
-                lines.append("```")
-                lines.append("")
-
-        lines.append(f"Source: `{source_rel}:{function_doc.line}`")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-
-    return "\n".join(lines).rstrip() + "\n"
+    return "\n".join(lines).rstrip() + "\n"
 
 
 def render_libraries_index(
@@ -881,9 +1793,18 @@ def render_library_page(
     library_name: str,
     output_relative: Path,
     entries: Sequence[Tuple[FileDoc, FunctionDoc]],
+    blocks: Optional[FunctionBlocks] = None,
+    parts: Optional[Dict[str, Path]] = None,
+    letter: Optional[str] = None,
 ) -> str:
+    """Render a library page, or with parts its letter index, or with letter one of its sub-pages."""
+    blocks = blocks or FunctionBlocks()
     lines: List[str] = []
-    lines.append(f"# {library_name}")
+    if letter is not None:
+        entries = [entry for entry in entries if page_letter(entry[1].name) == letter]
+        lines.append(f"# {library_name}: {letter_label(letter)}")
+    else:
+        lines.append(f"# {library_name}")
     lines.append("")
 
     summary = _library_summary(entries)
@@ -899,6 +1820,11 @@ def render_library_page(
     lines.append(stats)
     lines.append("")
 
+    if parts and letter is None:
+        items = [(fn.name, fn.signature, anchor_for_function(fn)) for _, fn in entries]
+        render_letter_index(lines, output_relative, parts, "Functions", items)
+        return "\n".join(lines).rstrip() + "\n"
+
     lines.append("## Functions")
     lines.append("")
     for file_doc, function_doc in entries:
@@ -910,56 +1836,9 @@ def render_library_page(
     lines.append("")
 
     for file_doc, function_doc in entries:
-        anchor = anchor_for_function(function_doc)
         source_rel = file_doc.source_path.relative_to(root).as_posix()
-
-        lines.append(f'<a id="{anchor}"></a>')
-        lines.append(f"### `{function_doc.signature}`")
+        lines.append(blocks.include(file_doc, function_doc))
         lines.append("")
-
-        if function_doc.description:
-            lines.append(function_doc.description)
-            lines.append("")
-
-        if function_doc.realm:
-            lines.append(f"Realm: `{function_doc.realm}`")
-            lines.append("")
-
-        if function_doc.params:
-            lines.append("**Parameters**")
-            lines.append("")
-            lines.append("| Name | Type | Description |")
-            lines.append("| --- | --- | --- |")
-            for param in function_doc.params:
-                description = param.description or "-"
-                lines.append(
-                    "| `{}` | `{}` | {} |".format(
-                        escape_table_cell(param.name),
-                        escape_table_cell(param.type_name),
-                        escape_table_cell(description),
-                    )
-                )
-            lines.append("")
-
-        if function_doc.returns:
-            lines.append("**Returns**")
-            lines.append("")
-            for return_doc in function_doc.returns:
-                if return_doc.description:
-                    lines.append(f"- `{return_doc.type_name}`: {return_doc.description}")
-                else:
-                    lines.append(f"- `{return_doc.type_name}`")
-            lines.append("")
-
-        if function_doc.usage:
-            lines.append("**Usage**")
-            lines.append("")
-            for snippet in function_doc.usage:
-                lines.append("```lua")
-                lines.append(snippet.rstrip())
-                lines.append("```")
-                lines.append("")
-
         lines.append(f"Source: `{source_rel}:{function_doc.line}`")
         lines.append("")
         lines.append("---")
@@ -984,17 +1863,21 @@ def build_libraries_nav_tree(library_pages: Dict[str, Path]) -> Dict[str, object
     return root
 
 
-def render_namespace_nav_lines(node: Dict[str, object], indent: int) -> List[str]:
+def render_namespace_nav_lines(
+    node: Dict[str, object],
+    indent: int,
+    page_splits: Optional[Dict[Path, Dict[str, Path]]] = None,
+) -> List[str]:
     lines: List[str] = []
     dirs: Dict[str, Dict[str, object]] = node["dirs"]
     pages: List[Tuple[str, str]] = node["pages"]
 
     for dir_name in sorted(dirs.keys(), key=nav_sort_key):
         lines.append(f'{" " * indent}- {yaml_quote(dir_name)}:')
-        lines.extend(render_namespace_nav_lines(dirs[dir_name], indent + 4))
+        lines.extend(render_namespace_nav_lines(dirs[dir_name], indent + 4, page_splits))
 
     for page_label, page_path in sorted(pages, key=lambda item: nav_sort_key(item[0])):
-        lines.append(f'{" " * indent}- {yaml_quote(page_label)}: {page_path}')
+        lines.extend(nav_page_lines(page_label, Path(page_path), indent, page_splits))
 
     return lines
 
@@ -1005,12 +1888,16 @@ def build_libraries_nav_lines(
     uncovered_file_docs: Sequence[FileDoc] = (),
     api_subdir: str = DEFAULT_API_SUBDIR,
     indent: int = 6,
+    page_splits: Optional[Dict[Path, Dict[str, Path]]] = None,
+    panel_audit: bool = False,
 ) -> List[str]:
     if not library_pages and not uncovered_file_docs:
         return []
 
     lines = [f'{" " * indent}- "Overview": {normalize_nav_path(f"{libraries_subdir}/index.md")}']
-    lines.extend(render_namespace_nav_lines(build_libraries_nav_tree(library_pages), indent))
+    if panel_audit:
+        lines.append(f'{" " * indent}- "Panels": {normalize_nav_path(f"{api_subdir}/{PANEL_AUDIT_PAGE}")}')
+    lines.extend(render_namespace_nav_lines(build_libraries_nav_tree(library_pages), indent, page_splits))
 
     if uncovered_file_docs:
         api_tree = build_api_nav_tree(uncovered_file_docs, api_subdir)
@@ -1041,6 +1928,10 @@ def api_entries_without_meta(file_docs: Sequence[FileDoc]) -> List[FileDoc]:
         functions = [function for function in file_doc.functions if not function.meta_type]
         if not functions:
             continue
+        if len(functions) == len(file_doc.functions):
+            # Nothing to drop; share the scanned FileDoc rather than copying it.
+            result.append(file_doc)
+            continue
 
         result.append(
             FileDoc(
@@ -1058,57 +1949,10 @@ def api_entries_without_meta(file_docs: Sequence[FileDoc]) -> List[FileDoc]:
     return result
 
 
-def collect_hook_occurrences(source_dirs: Sequence[Path]) -> List[HookOccurrence]:
+def collect_hook_occurrences(scanned_files: Sequence[ScannedFile]) -> List[HookOccurrence]:
     occurrences: List[HookOccurrence] = []
-    for source_dir in source_dirs:
-        if not source_dir.exists():
-            continue
-
-        for lua_file in sorted(source_dir.rglob("*.lua")):
-            lines = read_text(lua_file).splitlines()
-            for line_number, line in enumerate(lines, start=1):
-                gm_match = GM_HOOK_DEF_RE.match(line)
-                if gm_match:
-                    occurrences.append(
-                        HookOccurrence(
-                            kind="gm",
-                            hook_name=gm_match.group(1),
-                            source_path=lua_file,
-                            line=line_number,
-                        )
-                    )
-
-                module_match = MODULE_HOOK_DEF_RE.match(line)
-                if module_match:
-                    occurrences.append(
-                        HookOccurrence(
-                            kind="module",
-                            hook_name=module_match.group(1),
-                            source_path=lua_file,
-                            line=line_number,
-                        )
-                    )
-
-                for match in HOOK_RUN_RE.finditer(line):
-                    occurrences.append(
-                        HookOccurrence(
-                            kind="run",
-                            hook_name=match.group(1),
-                            source_path=lua_file,
-                            line=line_number,
-                        )
-                    )
-
-                for match in HOOK_ADD_RE.finditer(line):
-                    occurrences.append(
-                        HookOccurrence(
-                            kind="add",
-                            hook_name=match.group(1),
-                            source_path=lua_file,
-                            line=line_number,
-                        )
-                    )
-
+    for scanned in scanned_files:
+        occurrences.extend(scanned.hooks)
     return occurrences
 
 
@@ -1182,6 +2026,38 @@ def render_hooks_overview(
     return "\n".join(lines).rstrip() + "\n"
 
 
+def render_hook_occurrences(
+    root: Path,
+    items: Sequence[HookOccurrence],
+    current_doc: Path,
+    source_to_api_page: Dict[str, Path],
+) -> List[str]:
+    result: List[str] = []
+    for item in items:
+        source_rel = item.source_path.relative_to(root).as_posix()
+        source_key = str(item.source_path.resolve())
+        api_target = source_to_api_page.get(source_key)
+        if api_target:
+            link = relative_doc_link(current_doc, api_target)
+            result.append(f"- [`{source_rel}`]({link}) (line {item.line})")
+        else:
+            result.append(f"- `{source_rel}:{item.line}`")
+    return result
+
+
+def hook_section_occurrences(
+    kind: str,
+    hook_name: str,
+    all_grouped_hooks: Dict[str, Dict[str, List[HookOccurrence]]],
+) -> List[HookOccurrence]:
+    """Every occurrence listed under hook_name on the kind page."""
+    items = list(all_grouped_hooks[kind].get(hook_name, []))
+    if kind in ("gm", "module"):
+        items.extend(all_grouped_hooks["run"].get(hook_name, []))
+        items.extend(all_grouped_hooks["add"].get(hook_name, []))
+    return items
+
+
 def render_hook_kind_page(
     root: Path,
     kind: str,
@@ -1189,10 +2065,20 @@ def render_hook_kind_page(
     source_to_api_page: Dict[str, Path],
     hooks_subdir: str,
     all_grouped_hooks: Optional[Dict[str, Dict[str, List[HookOccurrence]]]] = None,
+    symbol_pages: Optional[Dict[str, Path]] = None,
+    parts: Optional[Dict[str, Path]] = None,
+    letter: Optional[str] = None,
 ) -> str:
-    current_doc = Path(hooks_subdir) / f"{kind}.md"
+    """Render a hook kind page, or with parts its letter index, or with letter one of its sub-pages."""
+    kind_doc = Path(hooks_subdir) / f"{kind}.md"
+    current_doc = parts[letter] if parts and letter is not None else kind_doc
+    symbol_pages = symbol_pages or {}
     lines: List[str] = []
-    lines.append(f"# {HOOK_KIND_TITLE[kind]}")
+    if letter is not None:
+        grouped_by_name = {name: items for name, items in grouped_by_name.items() if page_letter(name) == letter}
+        lines.append(f"# {HOOK_KIND_TITLE[kind]}: {letter_label(letter)}")
+    else:
+        lines.append(f"# {HOOK_KIND_TITLE[kind]}")
     lines.append("")
     lines.append(f"Unique hook names: **{len(grouped_by_name)}**")
     lines.append(f"Occurrences: **{sum(len(items) for items in grouped_by_name.values())}**")
@@ -1203,6 +2089,11 @@ def render_hook_kind_page(
         lines.append("")
         return "\n".join(lines).rstrip() + "\n"
 
+    if parts and letter is None:
+        items = [(hook_name, hook_name, slugify(hook_name)) for hook_name in grouped_by_name]
+        render_letter_index(lines, current_doc, parts, "Hook List", items)
+        return "\n".join(lines).rstrip() + "\n"
+
     lines.append("## Hook List")
     lines.append("")
     for hook_name in grouped_by_name:
@@ -1212,17 +2103,7 @@ def render_hook_kind_page(
     lines.append("")
 
     def render_occurrences(items: List[HookOccurrence]) -> List[str]:
-        result: List[str] = []
-        for item in items:
-            source_rel = item.source_path.relative_to(root).as_posix()
-            source_key = str(item.source_path.resolve())
-            api_target = source_to_api_page.get(source_key)
-            if api_target:
-                link = relative_doc_link(current_doc, api_target)
-                result.append(f"- [`{source_rel}`]({link}) (line {item.line})")
-            else:
-                result.append(f"- `{source_rel}:{item.line}`")
-        return result
+        return render_hook_occurrences(root, items, current_doc, source_to_api_page)
 
     for hook_name, items in grouped_by_name.items():
         lines.append(f"## {hook_name}")
@@ -1250,14 +2131,16 @@ def render_hook_kind_page(
                     lines.append("")
         else:
             if all_grouped_hooks is not None:
-                if hook_name in all_grouped_hooks.get("gm", {}):
-                    anchor = slugify(hook_name)
-                    lines.append(f"Defined in: [GM Definitions](gm.md#{anchor})")
-                    lines.append("")
-                elif hook_name in all_grouped_hooks.get("module", {}):
-                    anchor = slugify(hook_name)
-                    lines.append(f"Defined in: [MODULE Definitions](module.md#{anchor})")
+                for defined_kind, label in (("gm", "GM Definitions"), ("module", "MODULE Definitions")):
+                    if hook_name not in all_grouped_hooks.get(defined_kind, {}):
+                        continue
+                    target = symbol_pages.get(
+                        hook_symbol(defined_kind, hook_name), Path(hooks_subdir) / f"{defined_kind}.md"
+                    )
+                    link = relative_doc_link(current_doc, target)
+                    lines.append(f"Defined in: [{label}]({link}#{slugify(hook_name)})")
                     lines.append("")
+                    break
 
             lines.extend(render_occurrences(items))
             lines.append("")
@@ -1265,744 +2148,4700 @@ def render_hook_kind_page(
     return "\n".join(lines).rstrip() + "\n"
 
 
-def build_hooks_nav_lines(hooks_subdir: str, indent: int = 6) -> List[str]:
-    return [
-        f'{" " * indent}- "Overview": {normalize_nav_path(f"{hooks_subdir}/index.md")}',
-        f'{" " * indent}- "GM Definitions": {normalize_nav_path(f"{hooks_subdir}/gm.md")}',
-        f'{" " * indent}- "MODULE Definitions": {normalize_nav_path(f"{hooks_subdir}/module.md")}',
-        f'{" " * indent}- "hook.Run Calls": {normalize_nav_path(f"{hooks_subdir}/run.md")}',
-        f'{" " * indent}- "hook.Add Registrations": {normalize_nav_path(f"{hooks_subdir}/add.md")}',
-    ]
+def _function_body_metrics(content: str, position: int) -> Tuple[int, int, int]:
+    """Return (lines, complexity, loops) of the function whose `function` keyword is at position.
+
+    Complexity counts one plus every branch, loop and short-circuit operator, nested
+    functions included; it is a static estimate, not a profile.
+    """
+    depth = 0
+    complexity = 1
+    loops = 0
+    end = len(content)
+    for token in iter_lua_tokens(content, position):
+        value = token.value
+        if token.kind == "name":
+            if value in ("function", "if", "do", "repeat"):
+                depth += 1
+            elif value in ("end", "until"):
+                depth -= 1
+                if depth == 0:
+                    end = token.end
+                    break
+            if value in ("if", "elseif", "and", "or"):
+                complexity += 1
+            elif value in ("for", "while", "repeat"):
+                complexity += 1
+                loops += 1
+        elif value in ("&&", "||"):
+            complexity += 1
+    return content.count("\n", position, end) + 1, complexity, loops
+
+
+def _listener_body(content: str, line_start: int, occurrence: HookOccurrence) -> Tuple[Optional[int], Optional[str]]:
+    """Find the listener at occurrence on its line: (position of its inline `function`, or the callback expression)."""
+    _, line_end = _line_bounds(content, line_start)
+    tokens = list(iter_lua_tokens(content, line_start, line_end))
+    values = [token.value for token in tokens]
+    if occurrence.kind != "add":
+        owner = occurrence.kind.upper()
+        for index, value in enumerate(values):
+            if value == "function" and values[index + 1 : index + 4] == [owner, ":", occurrence.hook_name]:
+                return tokens[index].start, None
+        return None, None
+
+    for index, value in enumerate(values):
+        if value != "hook" or values[index + 1 : index + 4] != [".", "Add", "("] or index + 4 >= len(tokens):
+            continue
+        if _string_value(tokens[index + 4]) != occurrence.hook_name:
+            continue
+        # Skip `, identifier,` to the callback; the arguments may span lines and contain calls.
+        rest = iter_lua_tokens(content, tokens[index + 4].end)
+        depth = 0
+        commas = 0
+        token = None
+        for token in rest:
+            if commas == 2:
+                break
+            if token.value in ("(", "{", "["):
+                depth += 1
+            elif token.value in (")", "}", "]"):
+                if depth == 0:
+                    return None, None
+                depth -= 1
+            elif token.value == "," and depth == 0:
+                commas += 1
+        if token is None or commas < 2:
+            return None, None
+        if token.value == "function":
+            return token.start, None
+        callback: List[str] = []
+        depth = 0
+        while token is not None and not (depth == 0 and token.value in (")", ",")):
+            if token.value in ("(", "{", "["):
+                depth += 1
+            elif token.value in (")", "}", "]"):
+                depth -= 1
+            callback.append(token.value)
+            token = next(rest, None)
+        return None, "".join(callback) or None
+    return None, None
+
+
+def _line_starts(content: str) -> List[int]:
+    starts = [0]
+    position = content.find("\n")
+    while position >= 0:
+        starts.append(position + 1)
+        position = content.find("\n", position + 1)
+    return starts
+
+
+def _listener_realms(source_path: Path) -> Tuple[str, ...]:
+    realm = infer_realm_from_filename(source_path)
+    # Unprefixed files (boot.lua, module roots) are treated as shared.
+    return (realm,) if realm in ("client", "server") else ("client", "server")
+
+
+def load_hot_hook_budget(path: Optional[Path]) -> Dict[str, Dict[str, int]]:
+    """Read the budget file: default limits at the top level, overrides under "hooks" keyed "Name" or "Name@realm"."""
+    budget: Dict[str, Dict[str, int]] = {"": dict(DEFAULT_HOT_HOOK_LIMITS)}
+    if path is None or not path.exists():
+        return budget
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except ValueError as exc:
+        raise SystemExit(f"Invalid hot hook budget {path}: {exc}")
+    for limit in DEFAULT_HOT_HOOK_LIMITS:
+        if limit in payload:
+            budget[""][limit] = int(payload[limit])
+    for key, limits in payload.get("hooks", {}).items():
+        budget[key] = {limit: int(value) for limit, value in limits.items() if limit in DEFAULT_HOT_HOOK_LIMITS}
+    return budget
 
 
-def remove_stale_generated_markdown(
-    section_dir: Path,
-    expected_files: set[str],
-    dry_run: bool,
-) -> None:
-    if not section_dir.exists():
-        return
+def _hot_hook_limits(budget: Dict[str, Dict[str, int]], hook_name: str, realm: str) -> Dict[str, int]:
+    limits = dict(budget[""])
+    limits.update(budget.get(hook_name, {}))
+    limits.update(budget.get(f"{hook_name}@{realm}", {}))
+    return limits
 
-    stale_files = sorted(
-        (
-            path
-            for path in section_dir.rglob("*.md")
-            if str(path.resolve()) not in expected_files
-        ),
-        key=lambda path: path.as_posix().casefold(),
-    )
 
-    for stale_file in stale_files:
-        if dry_run:
-            print(f"[dry-run] Would remove stale generated file: {stale_file}")
-            continue
+def build_hot_hooks_report(
+    root: Path,
+    grouped_hooks: Dict[str, Dict[str, List[HookOccurrence]]],
+    budget: Dict[str, Dict[str, int]],
+) -> Dict[str, object]:
+    """Listener fan-out and body size of every per-frame hook, per realm, checked against budget."""
+    occurrences: Dict[str, List[HookOccurrence]] = defaultdict(list)
+    for kind in HOT_HOOK_LISTENER_KINDS:
+        for hook_name, items in grouped_hooks.get(kind, {}).items():
+            if hook_name in HOT_HOOKS:
+                occurrences[hook_name].extend(items)
+
+    # Only the files that register hot listeners are read again.
+    metrics: Dict[Tuple[Path, int, str], Dict[str, object]] = {}
+    by_source: Dict[Path, List[HookOccurrence]] = defaultdict(list)
+    for items in occurrences.values():
+        for item in items:
+            by_source[item.source_path].append(item)
+    for source_path, items in sorted(by_source.items()):
+        content = read_text(source_path)
+        starts = _line_starts(content)
+        for item in items:
+            position, callback = _listener_body(content, starts[min(item.line, len(starts)) - 1], item)
+            entry: Dict[str, object] = {"lines": None, "complexity": None, "loops": None, "callback": callback}
+            if position is not None:
+                entry["lines"], entry["complexity"], entry["loops"] = _function_body_metrics(content, position)
+            metrics[(source_path, item.line, item.kind)] = entry
+
+    hooks: List[Dict[str, object]] = []
+    violations: List[str] = []
+    for hook_name in sorted(occurrences, key=nav_sort_key):
+        cadence, hook_realms = HOT_HOOKS[hook_name]
+        callers = len(grouped_hooks.get("run", {}).get(hook_name, []))
+        for realm in hook_realms:
+            listeners = []
+            for item in sorted(occurrences[hook_name], key=lambda entry: (entry.source_path.as_posix(), entry.line)):
+                if realm not in _listener_realms(item.source_path):
+                    continue
+                listeners.append(
+                    {
+                        "kind": item.kind,
+                        "source": _path_to_record(root, item.source_path),
+                        "line": item.line,
+                        **metrics[(item.source_path, item.line, item.kind)],
+                    }
+                )
+            if not listeners:
+                continue
 
-        stale_file.unlink()
-        print(f"Removed stale generated file: {stale_file}")
+            complexity = sum(entry["complexity"] or 0 for entry in listeners)
+            limits = _hot_hook_limits(budget, hook_name, realm)
+            over: List[str] = []
+            if limits["listeners"] and len(listeners) > limits["listeners"]:
+                over.append(f"{len(listeners)} listeners, budget {limits['listeners']}")
+            if limits["complexity"] and complexity > limits["complexity"]:
+                over.append(f"complexity {complexity}, budget {limits['complexity']}")
+            violations.extend(f"{hook_name} ({realm}): {message}" for message in over)
+            hooks.append(
+                {
+                    "name": hook_name,
+                    "realm": realm,
+                    "cadence": cadence,
+                    "listeners": len(listeners),
+                    "callers": callers,
+                    "lines": sum(entry["lines"] or 0 for entry in listeners),
+                    "complexity": complexity,
+                    "loops": sum(entry["loops"] or 0 for entry in listeners),
+                    "unmeasured": sum(1 for entry in listeners if entry["lines"] is None),
+                    "budget": limits,
+                    "over_budget": over,
+                    "entries": listeners,
+                }
+            )
 
-    if not dry_run and section_dir.exists():
-        for directory in sorted(
-            (path for path in section_dir.rglob("*") if path.is_dir()),
-            key=lambda path: len(path.parts),
-            reverse=True,
-        ):
-            try:
-                directory.rmdir()
-            except OSError:
-                pass
+    return {"version": HOT_HOOKS_VERSION, "hooks": hooks, "violations": violations}
 
 
-def escape_table_cell(value: str) -> str:
-    escaped = value.replace("|", "\\|")
-    return escaped.replace("\n", "<br>")
+def render_hot_hooks_page(
+    report: Dict[str, object],
+    hooks_subdir: str,
+    source_to_api_page: Dict[str, Path],
+    symbol_pages: Dict[str, Path],
+    root: Path,
+) -> str:
+    current_doc = Path(hooks_subdir) / HOT_HOOKS_PAGE
+    hooks = report["hooks"]
+    lines: List[str] = []
+    lines.append("# Hot Hooks")
+    lines.append("")
+    lines.append(
+        "Engine hooks that run every frame or tick, with every `GM:`, `MODULE:` and `hook.Add` listener "
+        "registered for them per realm. Lines and complexity are static estimates of each inline listener body "
+        "(complexity counts one plus each branch, loop and `and`/`or`); listeners passed by reference are not measured."
+    )
+    lines.append("")
+    if report["violations"]:
+        lines.append("!!! warning \"Over budget\"")
+        lines.append("")
+        for violation in report["violations"]:
+            lines.append(f"    - {violation}")
+        lines.append("")
 
+    if not hooks:
+        lines.append("No listeners for per-frame hooks detected.")
+        lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
 
-def build_file_doc(
-    root: Path,
-    source_dir: Path,
-    api_subdir: str,
-    file_path: Path,
-) -> Optional[FileDoc]:
-    content = read_text(file_path)
-    lines = content.splitlines()
+    lines.append("| Hook | Realm | Runs | Listeners | Lines | Complexity | Loops | Budget |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for hook in hooks:
+        limits = hook["budget"]
+        budget = " / ".join(f"{limits[name]} {name}" for name in DEFAULT_HOT_HOOK_LIMITS if limits[name]) or "-"
+        status = " (over)" if hook["over_budget"] else ""
+        lines.append(
+            f"| [`{hook['name']}`](#{slugify(hook['name'] + '-' + hook['realm'])}) | {hook['realm']} | "
+            f"{HOT_HOOK_CADENCES[hook['cadence']]} | {hook['listeners']}{status} | {hook['lines']} | "
+            f"{hook['complexity']} | {hook['loops']} | {budget} |"
+        )
+    lines.append("")
 
-    functions: List[FunctionDoc] = []
-    first_function_index = len(lines)
-    meta_aliases: Dict[str, str] = {}
+    for hook in hooks:
+        lines.append(f"## {hook['name']} ({hook['realm']})")
+        lines.append("")
+        for kind in ("gm", "module"):
+            target = symbol_pages.get(hook_symbol(kind, hook["name"]))
+            if target is not None:
+                lines.append(f"Hook page: [{HOOK_KIND_TITLE[kind]}]({relative_doc_link(current_doc, target)}#{slugify(hook['name'])})")
+                lines.append("")
+                break
+        if hook["callers"]:
+            lines.append(f"Also fired by {hook['callers']} `hook.Run` call(s).")
+            lines.append("")
+        lines.append("| Listener | Source | Lines | Complexity | Loops |")
+        lines.append("| --- | --- | --- | --- | --- |")
+        for entry in hook["entries"]:
+            label = {"gm": "GM", "module": "MODULE", "add": "hook.Add"}[entry["kind"]]
+            if entry["callback"]:
+                label += f" → `{escape_table_cell(entry['callback'])}`"
+            source = f"{entry['source']}:{entry['line']}"
+            api_target = source_to_api_page.get(str((root / entry["source"]).resolve()))
+            if api_target:
+                source = f"[`{source}`]({relative_doc_link(current_doc, api_target)})"
+            else:
+                source = f"`{source}`"
+            measured = [entry[name] if entry[name] is not None else "-" for name in ("lines", "complexity", "loops")]
+            lines.append(f"| {label} | {source} | {measured[0]} | {measured[1]} | {measured[2]} |")
+        lines.append("")
 
-    for index, line in enumerate(lines):
-        update_meta_aliases(line, meta_aliases)
+    return "\n".join(lines).rstrip() + "\n"
 
-        parsed_def = find_function_definition(line)
-        if not parsed_def:
-            continue
 
-        if index < first_function_index:
-            first_function_index = index
+@dataclass(slots=True)
+class CallGraphNode:
+    """A function body (or a file's main chunk) with the calls and net sends made directly in it."""
 
-        function_name, raw_args = parsed_def
-        doc_lines = collect_doc_lines_above(lines, index)
-        if not doc_lines:
+    name: Optional[str]
+    source_path: Path
+    line: int
+    # Offsets of the `function` keyword and past its `end`; -1 for the chunk and callbacks passed by name.
+    start: int = -1
+    end: int = -1
+    # Why the engine runs it every frame or on a timer, when it does.
+    root: Optional[str] = None
+    # The hook it listens to: GM/MODULE/SCHEMA definitions and hook.Add callbacks.
+    listens: Optional[str] = None
+    calls: List[str] = field(default_factory=list)
+    hook_runs: List[str] = field(default_factory=list)
+    sends: List[int] = field(default_factory=list)
+
+    @property
+    def label(self) -> str:
+        return self.name or (f"hook.Add(\"{self.listens}\")" if self.listens else self.root or "function")
+
+
+def _normalize_callee(name: str) -> str:
+    return name.replace(":", ".")
+
+
+def scan_lua_call_graph(content: str, source_path: Path) -> List[CallGraphNode]:
+    """Collect the functions of a Lua file with their direct calls, hook.Run names and net send lines.
+
+    A single token pass tracks function/block nesting and open call arguments, so
+    callbacks passed inline to hook.Add and timers are attributed to their hook or timer.
+    """
+    starts = _line_starts(content)
+    tokens = list(iter_lua_tokens(content))
+    chunk = CallGraphNode(name=None, source_path=source_path, line=1)
+    nodes = [chunk]
+    functions = [chunk]
+    # One entry per open block: the function it opens, or None for if/do/repeat.
+    blocks: List[Optional[CallGraphNode]] = []
+    # Open brackets: [callee, argument index, first string argument, first token of the argument].
+    frames: List[list] = []
+    chain = ""
+    chain_start = chain_end = -2
+    skip_until = -1
+
+    def line_of(position: int) -> int:
+        return bisect.bisect_right(starts, position)
+
+    for index, token in enumerate(tokens):
+        if index <= skip_until:
+            continue
+        value = token.value
+        if token.kind == "name" and value not in LUA_KEYWORDS:
+            if chain_end == index - 2 and tokens[index - 1].value in (".", ":"):
+                chain += tokens[index - 1].value + value
+            else:
+                chain, chain_start = value, index
+            chain_end = index
             continue
 
-        parsed_comment = parse_comment_lines(doc_lines)
-        if not parsed_comment.has_content:
+        if value == "(":
+            callee = chain if chain_end == index - 1 else None
+            if callee:
+                if callee in NET_SEND_CALLS:
+                    functions[-1].sends.append(line_of(token.start))
+                else:
+                    functions[-1].calls.append(callee)
+            frames.append([callee, 0, None, index + 1])
+        elif value in ("{", "["):
+            frames.append([None, 0, None, index + 1])
+        elif value in (",", ")", "}", "]"):
+            if frames and frames[-1][0] and chain_end == index - 1 and chain_start == frames[-1][3]:
+                # A function passed by name: hook.Add("Think", "id", OnThink), timer.Simple(1, Flush).
+                callee, argument, hook_name, _ = frames[-1]
+                root = listens = None
+                if callee == "hook.Add" and argument == 2 and hook_name:
+                    listens, root = hook_name, hook_name if hook_name in HOT_HOOKS else None
+                elif callee in NET_TIMER_CALLS:
+                    root = callee
+                if root or listens:
+                    nodes.append(
+                        CallGraphNode(
+                            name=None, source_path=source_path, line=line_of(token.start),
+                            root=root, listens=listens, calls=[chain],
+                        )
+                    )
+            if value == ",":
+                if frames:
+                    frames[-1][1] += 1
+                    frames[-1][3] = index + 1
+            elif frames:
+                frames.pop()
+        elif token.kind == "string":
+            if frames and frames[-1][1] == 0 and frames[-1][2] is None and frames[-1][3] == index:
+                frames[-1][2] = _string_value(token)
+                if frames[-1][0] == "hook.Run" and frames[-1][2]:
+                    functions[-1].hook_runs.append(frames[-1][2])
+        elif value == "function":
+            node = CallGraphNode(name=None, source_path=source_path, line=line_of(token.start), start=token.start)
+            following = index + 1
+            if following < len(tokens) and tokens[following].kind == "name":
+                # `function a.b:c(` or `local function c(`: read the name and skip its tokens.
+                name = tokens[following].value
+                while (
+                    following + 2 < len(tokens)
+                    and tokens[following + 1].value in (".", ":")
+                    and tokens[following + 2].kind == "name"
+                ):
+                    name += tokens[following + 1].value + tokens[following + 2].value
+                    following += 2
+                skip_until = following
+                node.name = name
+            elif index > 0 and tokens[index - 1].value == "=" and chain_end == index - 2:
+                node.name = chain
+            elif frames and frames[-1][0]:
+                callee, argument, hook_name, _ = frames[-1]
+                if callee == "hook.Add" and argument == 2 and hook_name:
+                    node.listens = hook_name
+                elif callee in NET_TIMER_CALLS:
+                    node.root = callee
+
+            if node.name:
+                owner, separator, method = node.name.rpartition(":" if ":" in node.name else ".")
+                if separator == ":" and owner in NET_HOOK_OWNERS:
+                    node.listens = method
+                elif owner in NET_FRAME_OWNERS and method in NET_FRAME_METHODS:
+                    node.root = node.name
+                elif separator == "." and method in ("Think", "Paint", "PaintOver"):
+                    # `panel.Paint = function(this, w, h)` overrides a panel's per-frame method.
+                    node.root = node.name
+            if node.listens in HOT_HOOKS:
+                node.root = node.name or node.listens
+            nodes.append(node)
+            functions.append(node)
+            blocks.append(node)
+        elif value in ("if", "do", "repeat"):
+            blocks.append(None)
+        elif value in ("end", "until"):
+            closed = blocks.pop() if blocks else None
+            if closed is not None and len(functions) > 1:
+                closed.end = token.end
+                functions.pop()
+    return nodes
+
+
+def scan_project_call_graph(scanned_files: Sequence[ScannedFile]) -> List[CallGraphNode]:
+    nodes: List[CallGraphNode] = []
+    for scanned in scanned_files:
+        # Files without a send or hook listener can still sit on a path, so every file is read.
+        nodes.extend(scan_lua_call_graph(read_text(scanned.source_path), scanned.source_path))
+    return nodes
+
+
+def find_hot_net_sends(scanned_files: Sequence[ScannedFile]) -> Dict[Tuple[Path, int], Dict[str, object]]:
+    """Map (source, line) of each net send reachable from a per-frame hook or a timer to the call path.
+
+    Calls are resolved by name only: `self:`/`MODULE:`/`PANEL:` methods within the caller's file,
+    then its directory, bare names within the file, then globally, dotted names globally, and `hook.Run("Name")`
+    to every listener of Name. Calls through variables and metatables are not followed.
+    """
+    nodes = scan_project_call_graph(scanned_files)
+
+    global_defs: Dict[str, List[CallGraphNode]] = defaultdict(list)
+    local_defs: Dict[Tuple[Path, str], List[CallGraphNode]] = defaultdict(list)
+    file_defs: Dict[Tuple[Path, str], List[CallGraphNode]] = defaultdict(list)
+    listeners: Dict[str, List[CallGraphNode]] = defaultdict(list)
+    for node in nodes:
+        if node.listens:
+            listeners[node.listens].append(node)
+        if not node.name:
             continue
+        normalized = _normalize_callee(node.name)
+        owner, _, method = normalized.rpartition(".")
+        file_defs[(node.source_path, method)].append(node)
+        if owner in NET_LOCAL_OWNERS:
+            local_defs[(node.source_path.parent, method)].append(node)
+        else:
+            global_defs[normalized].append(node)
+
+    def callees(node: CallGraphNode) -> Iterator[CallGraphNode]:
+        for call in node.calls:
+            normalized = _normalize_callee(call)
+            owner, _, method = normalized.rpartition(".")
+            if owner in NET_LOCAL_OWNERS:
+                yield from file_defs.get((node.source_path, method), ()) or local_defs.get(
+                    (node.source_path.parent, method), ()
+                )
+            elif owner:
+                yield from global_defs.get(normalized, ())
+            else:
+                local = [item for item in file_defs.get((node.source_path, method), ()) if item.name == call]
+                yield from local or global_defs.get(normalized, ())
+        for hook_name in node.hook_runs:
+            yield from listeners.get(hook_name, ())
+
+    parents: Dict[int, Optional[CallGraphNode]] = {}
+    queue: deque = deque()
+    for node in nodes:
+        if node.root:
+            parents[id(node)] = None
+            queue.append(node)
+    hot: Dict[Tuple[Path, int], Dict[str, object]] = {}
+    while queue:
+        node = queue.popleft()
+        if node.sends:
+            path: List[CallGraphNode] = []
+            step: Optional[CallGraphNode] = node
+            while step is not None:
+                path.append(step)
+                step = parents[id(step)]
+            path.reverse()
+            for line in node.sends:
+                hot.setdefault(
+                    (node.source_path, line),
+                    {
+                        "root": path[0].root,
+                        "path": [
+                            {"function": step.label, "source": step.source_path, "line": step.line} for step in path
+                        ],
+                    },
+                )
+        for callee in callees(node):
+            if id(callee) not in parents:
+                parents[id(callee)] = node
+                queue.append(callee)
+    return hot
 
-        args = sanitize_signature_args(raw_args)
-        signature = f"{function_name}({args})"
-        realm = parsed_comment.realm or infer_realm_from_filename(file_path)
-        meta_type = infer_meta_type(function_name, meta_aliases)
-        functions.append(
-            FunctionDoc(
-                name=function_name,
-                signature=signature,
-                line=index + 1,
-                description=parsed_comment.description,
-                realm=realm,
-                params=parsed_comment.params,
-                returns=parsed_comment.returns,
-                usage=parsed_comment.usage,
-                meta_type=meta_type,
-            )
-        )
 
-    if not functions:
+def _net_send_direction(target: Optional[str]) -> Optional[str]:
+    if target is None:
         return None
+    return "server" if target == "server" else "client"
 
-    module, section, summary = parse_file_metadata(lines, first_function_index)
-    source_group = source_dir.name
-    relative_path = file_path.relative_to(source_dir)
-    output_relative = Path(api_subdir) / source_group / relative_path.with_suffix(".md")
 
-    return FileDoc(
-        source_path=file_path,
-        source_group=source_group,
-        relative_path=relative_path,
-        output_relative=output_relative,
-        module=module,
-        section=section,
-        summary=summary,
-        functions=functions,
+def build_net_catalog(root: Path, scanned_files: Sequence[ScannedFile]) -> Dict[str, object]:
+    """Every ax.net message with its senders and receivers, orphans on either side and sends on hot paths."""
+    hot = find_hot_net_sends(scanned_files)
+    occurrences = sorted(
+        (item for scanned in scanned_files for item in scanned.net),
+        key=lambda item: (item.source_path.as_posix(), item.line),
     )
+    senders: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    receivers: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    dynamic: List[Dict[str, object]] = []
+    for item in occurrences:
+        entry: Dict[str, object] = {
+            "source": _path_to_record(root, item.source_path),
+            "line": item.line,
+            "realm": infer_realm_from_filename(item.source_path),
+        }
+        if item.direction == "send":
+            entry["target"] = item.target
+            path = hot.get((item.source_path, item.line))
+            entry["hot"] = (
+                None
+                if path is None
+                else {
+                    "root": path["root"],
+                    "path": [
+                        {**step, "source": _path_to_record(root, step["source"])} for step in path["path"]
+                    ],
+                }
+            )
+        if item.name is None:
+            dynamic.append({"direction": item.direction, "expression": item.expression, **entry})
+        elif item.direction == "send":
+            senders[item.name].append(entry)
+        else:
+            receivers[item.name].append(entry)
+
+    messages: List[Dict[str, object]] = []
+    orphan_sends: List[Dict[str, object]] = []
+    orphan_hooks: List[Dict[str, object]] = []
+    hot_sends: List[Dict[str, object]] = []
+    for name in sorted(set(senders) | set(receivers), key=nav_sort_key):
+        heard = {realm for entry in receivers[name] for realm in _listener_realms(root / entry["source"])}
+        sent = {_net_send_direction(entry["target"]) for entry in senders[name]}
+        for entry in senders[name]:
+            direction = _net_send_direction(entry["target"])
+            entry["orphan"] = not heard if direction is None else direction not in heard
+            if entry["orphan"]:
+                orphan_sends.append({"name": name, "source": entry["source"], "line": entry["line"]})
+            if entry["hot"]:
+                hot_sends.append({"name": name, "source": entry["source"], "line": entry["line"], **entry["hot"]})
+        for entry in receivers[name]:
+            realms = _listener_realms(root / entry["source"])
+            entry["orphan"] = not (None in sent or any(realm in sent for realm in realms))
+            if entry["orphan"]:
+                orphan_hooks.append({"name": name, "source": entry["source"], "line": entry["line"]})
+        messages.append({"name": name, "senders": senders[name], "receivers": receivers[name]})
+
+    return {
+        "version": NET_CATALOG_VERSION,
+        "totals": {
+            "messages": len(messages),
+            "sends": sum(len(items) for items in senders.values()),
+            "receivers": sum(len(items) for items in receivers.values()),
+            "dynamic": len(dynamic),
+            "orphan_sends": len(orphan_sends),
+            "orphan_hooks": len(orphan_hooks),
+            "hot_sends": len(hot_sends),
+        },
+        "messages": messages,
+        "dynamic": dynamic,
+        "orphan_sends": orphan_sends,
+        "orphan_hooks": orphan_hooks,
+        "hot_sends": hot_sends,
+    }
 
 
-def render_file_markdown(file_doc: FileDoc, root: Path) -> str:
-    display_name = file_doc.module or file_doc.relative_path.with_suffix("").as_posix()
-    source_rel = file_doc.source_path.relative_to(root).as_posix()
-    functions = sorted(file_doc.functions, key=lambda item: (nav_sort_key(item.name), item.line))
+def render_net_catalog_page(
+    catalog: Dict[str, object],
+    hooks_subdir: str,
+    source_to_api_page: Dict[str, Path],
+    root: Path,
+) -> str:
+    current_doc = Path(hooks_subdir) / NET_CATALOG_PAGE
+    totals = catalog["totals"]
 
-    lines: List[str] = []
-    lines.append(f"# {display_name}")
-    lines.append("")
-    lines.append(f"Source: `{source_rel}`")
-    if file_doc.summary:
-        lines.append("")
-        lines.append(file_doc.summary)
-    if file_doc.section:
-        lines.append("")
-        lines.append(f"Section: `{file_doc.section}`")
+    def source_link(entry: Dict[str, object]) -> str:
+        source = f"{entry['source']}:{entry['line']}"
+        api_target = source_to_api_page.get(str((root / entry["source"]).resolve()))
+        if api_target:
+            return f"[`{source}`]({relative_doc_link(current_doc, api_target)})"
+        return f"`{source}`"
+
+    def hot_path(entry: Dict[str, object]) -> str:
+        return " → ".join(f"`{escape_table_cell(step['function'])}`" for step in entry["path"])
 
+    lines: List[str] = []
+    lines.append("# Network Messages")
     lines.append("")
-    lines.append(f"Documented functions: **{len(functions)}**")
+    lines.append(
+        f"Every `ax.net` message: {totals['messages']} names, {totals['sends']} sends and "
+        f"{totals['receivers']} `ax.net:Hook` receivers. Recipients are read from the call (`Start(nil, ...)` "
+        "broadcasts, `Start(target, ...)` goes to a player or list of players, client `Start(name, ...)` goes to the "
+        "server) and realms from the file prefix; unprefixed and `sh_` files count for both realms."
+    )
     lines.append("")
-    lines.append("## Functions")
+    lines.append(
+        "A send is *hot* when a call path reaches it from a per-frame hook, a panel or entity `Think`/`Paint`, "
+        "or a timer callback. Paths are resolved statically by function name, so calls through variables "
+        "and metatables are missed and same-named functions can add false positives."
+    )
     lines.append("")
 
-    for function in functions:
-        anchor = slugify(f"{function.name}-{function.line}")
-        lines.append(f"- [`{function.signature}`](#{anchor})")
+    if catalog["orphan_sends"] or catalog["orphan_hooks"]:
+        lines.append("!!! warning \"Orphans\"")
+        lines.append("")
+        for entry in catalog["orphan_sends"]:
+            lines.append(f"    - `{entry['name']}` is sent at `{entry['source']}:{entry['line']}` but never received there")
+        for entry in catalog["orphan_hooks"]:
+            lines.append(f"    - `{entry['name']}` is received at `{entry['source']}:{entry['line']}` but never sent to it")
+        if catalog["dynamic"]:
+            lines.append("")
+            lines.append("    Messages with computed names (listed below) may account for some of these.")
+        lines.append("")
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    if catalog["hot_sends"]:
+        lines.append("## Hot Sends")
+        lines.append("")
+        lines.append("| Message | Source | Reached from |")
+        lines.append("| --- | --- | --- |")
+        for entry in catalog["hot_sends"]:
+            lines.append(f"| [`{entry['name']}`](#{slugify(entry['name'])}) | {source_link(entry)} | {hot_path(entry)} |")
+        lines.append("")
 
-    for function in functions:
-        anchor = slugify(f"{function.name}-{function.line}")
-        lines.append(f'<a id="{anchor}"></a>')
-        lines.append(f"### `{function.signature}`")
+    if catalog["dynamic"]:
+        lines.append("## Computed Names")
+        lines.append("")
+        lines.append("| Call | Name expression | Source | Realm |")
+        lines.append("| --- | --- | --- | --- |")
+        for entry in catalog["dynamic"]:
+            call = "Hook" if entry["direction"] == "receive" else NET_TARGET_TITLE.get(entry["target"], "send")
+            lines.append(
+                f"| {call} | `{escape_table_cell(entry['expression'] or '?')}` | {source_link(entry)} | {entry['realm'] or '-'} |"
+            )
         lines.append("")
 
-        if function.description:
-            lines.append(function.description)
-            lines.append("")
+    if not catalog["messages"]:
+        lines.append("No `ax.net` messages detected.")
+        lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
 
-        if function.realm:
-            lines.append(f"Realm: `{function.realm}`")
-            lines.append("")
+    lines.append("## Messages")
+    lines.append("")
+    lines.append("| Message | Senders | Receivers | Flags |")
+    lines.append("| --- | --- | --- | --- |")
+    for message in catalog["messages"]:
+        flags = []
+        if any(entry["orphan"] for entry in message["senders"]):
+            flags.append("orphan send")
+        if any(entry["orphan"] for entry in message["receivers"]):
+            flags.append("orphan hook")
+        if any(entry["hot"] for entry in message["senders"]):
+            flags.append("hot")
+        lines.append(
+            f"| [`{message['name']}`](#{slugify(message['name'])}) | {len(message['senders'])} | "
+            f"{len(message['receivers'])} | {', '.join(flags) or '-'} |"
+        )
+    lines.append("")
 
-        if function.params:
-            lines.append("**Parameters**")
-            lines.append("")
-            lines.append("| Name | Type | Description |")
-            lines.append("| --- | --- | --- |")
-            for param in function.params:
-                description = param.description or "-"
+    for message in catalog["messages"]:
+        # Message names are dotted; pin the anchor the tables link to (attr_list).
+        lines.append(f"### {message['name']} {{#{slugify(message['name'])}}}")
+        lines.append("")
+        if message["senders"]:
+            lines.append("| Sent | Source | Realm | Notes |")
+            lines.append("| --- | --- | --- | --- |")
+            for entry in message["senders"]:
+                notes = []
+                if entry["orphan"]:
+                    notes.append("no receiver")
+                if entry["hot"]:
+                    notes.append(f"hot: {hot_path(entry['hot'])}")
                 lines.append(
-                    "| `{}` | `{}` | {} |".format(
-                        escape_table_cell(param.name),
-                        escape_table_cell(param.type_name),
-                        escape_table_cell(description),
-                    )
+                    f"| {NET_TARGET_TITLE.get(entry['target'], '?')} | {source_link(entry)} | "
+                    f"{entry['realm'] or '-'} | {'; '.join(notes) or '-'} |"
                 )
             lines.append("")
-
-        if function.returns:
-            lines.append("**Returns**")
-            lines.append("")
-            for return_doc in function.returns:
-                if return_doc.description:
-                    lines.append(
-                        f"- `{return_doc.type_name}`: {return_doc.description}"
-                    )
-                else:
-                    lines.append(f"- `{return_doc.type_name}`")
+        if message["receivers"]:
+            lines.append("Received at:")
             lines.append("")
-
-        if function.usage:
-            lines.append("**Usage**")
+            for entry in message["receivers"]:
+                suffix = " (never sent to this realm)" if entry["orphan"] else ""
+                lines.append(f"- {source_link(entry)}{suffix}")
             lines.append("")
-            for snippet in function.usage:
-                lines.append("```lua")
-                lines.append(snippet.rstrip())
-                lines.append("```")
-                lines.append("")
-
-        lines.append("---")
-        lines.append("")
 
     return "\n".join(lines).rstrip() + "\n"
 
 
-def render_api_index(
-    file_docs: Sequence[FileDoc],
-    api_subdir: str,
-    libraries_subdir: str,
-    meta_subdir: str,
-    hooks_subdir: str,
-) -> str:
-    grouped: Dict[str, List[FileDoc]] = defaultdict(list)
-    for file_doc in file_docs:
-        grouped[file_doc.source_group].append(file_doc)
+def build_net_id_table(scanned_files: Sequence[ScannedFile]) -> Dict[str, object]:
+    """Number every literal ax.net message name and estimate what sending the number instead saves.
 
-    lines: List[str] = []
-    lines.append("# Source Reference")
+    IDs follow the sorted names from 1; 0 is left for messages that still send their name, so
+    an ID fits in the bit length of the highest one. The hash covers the ordered names.
+    """
+    sends: Dict[str, int] = defaultdict(int)
+    names = set()
+    dynamic = 0
+    for scanned in scanned_files:
+        for item in scanned.net:
+            if item.name is None:
+                dynamic += 1
+                continue
+            names.add(item.name)
+            if item.direction == "send":
+                sends[item.name] += 1
+    ordered = sorted(names)
+    bits = max(1, len(ordered).bit_length())
+    digest = hashlib.sha256("\n".join(ordered).encode("utf-8")).hexdigest()[:16]
+
+    messages = []
+    for message_id, name in enumerate(ordered, start=1):
+        # net.WriteString writes the bytes and a terminating zero.
+        name_bits = (len(name.encode("utf-8")) + 1) * 8
+        messages.append(
+            {
+                "name": name,
+                "id": message_id,
+                "name_bits": name_bits,
+                "saved_bits": name_bits - bits,
+                "send_sites": sends.get(name, 0),
+            }
+        )
+    return {
+        "version": NET_IDS_VERSION,
+        "hash": digest,
+        "bits": bits,
+        "dynamic_sites": dynamic,
+        "messages": messages,
+    }
+
+
+def _lua_string(value: str) -> str:
+    # Names come from Lua literals with their escapes intact; only a bare quote needs one.
+    return '"' + re.sub(r'(?<!\\)"', '\\"', value) + '"'
+
+
+def render_net_id_lua(table: Dict[str, object]) -> str:
+    lines = [
+        "-- Generated by tools/generate_docs.py --net-ids from every literal ax.net:Start and ax.net:Hook name.",
+        "-- Do not edit; regenerate after adding or renaming a message.",
+        "-- ID 0 is reserved for messages sent by name (computed or unlisted names).",
+        "",
+        "ax.net = ax.net or {}",
+        f"ax.net.idHash = {_lua_string(table['hash'])}",
+        f"ax.net.idBits = {table['bits']}",
+        "ax.net.ids = {",
+    ]
+    for message in table["messages"]:
+        lines.append(f"    [{_lua_string(message['name'])}] = {message['id']},")
+    lines.append("}")
+    lines.append("ax.net.names = {")
+    for message in table["messages"]:
+        lines.append(f"    {_lua_string(message['name'])},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def render_net_id_page(table: Dict[str, object], net_ids_source: str) -> str:
+    messages = table["messages"]
+    lines: List[str] = []
+    lines.append("# Network Message IDs")
     lines.append("")
-    lines.append("File-organized view of all documented Lua source, generated from LDOC annotations.")
+    lines.append(
+        f"`{net_ids_source}` maps each of the {len(messages)} literal `ax.net` message names to an ID of "
+        f"{table['bits']} bit(s) (hash `{table['hash']}`). Sending the ID in place of `net.WriteString(name)` saves "
+        "the name bytes and its terminator, less the ID width, on every send."
+    )
     lines.append("")
-    lines.append("For concept-first browsing, use [Libraries](../{}/index.md).".format(libraries_subdir))
-    lines.append("For metatable extensions, use [Metatables](../{}/index.md).".format(meta_subdir))
-    lines.append("For hook discovery, use [Hooks](../{}/index.md).".format(hooks_subdir))
+    if table["dynamic_sites"]:
+        lines.append(
+            f"{table['dynamic_sites']} call site(s) compute their message name at runtime; they keep sending the name "
+            "after a 0 ID."
+        )
+        lines.append("")
+    if not messages:
+        lines.append("No `ax.net` messages detected.")
+        lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
+
+    average = sum(message["saved_bits"] for message in messages) / len(messages) / 8
+    lines.append(f"Average saving: {average:.1f} bytes per send.")
     lines.append("")
-    lines.append(f"Total documented functions: **{sum(len(file_doc.functions) for file_doc in file_docs)}**")
-    lines.append(f"Pages: **{len(file_docs)}**")
+    lines.append("| Message | ID | Name bytes | Saved per send | Send sites |")
+    lines.append("| --- | --- | --- | --- | --- |")
+    for message in sorted(messages, key=lambda item: (-item["saved_bits"], item["name"])):
+        lines.append(
+            f"| `{message['name']}` | {message['id']} | {message['name_bits'] // 8} | "
+            f"{message['saved_bits'] / 8:.1f} B | {message['send_sites']} |"
+        )
     lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
 
-    for group_name in sorted(grouped):
-        lines.append(f"## {group_name.title()}")
-        lines.append("")
 
-        entries = sorted(
-            grouped[group_name],
-            key=lambda item: nav_sort_key(item.module or item.relative_path.with_suffix("").as_posix()),
-        )
-        for entry in entries:
-            link = entry.output_relative.relative_to(api_subdir).as_posix()
-            label = entry.module or entry.relative_path.with_suffix("").as_posix()
-            count = len(entry.functions)
-            suffix = "function" if count == 1 else "functions"
-            lines.append(f"- [`{label}`]({link}) ({count} documented {suffix})")
+def _iter_body_operations(content: str, start: int, end: int) -> Iterator[Tuple[str, str, Optional[str], int, int]]:
+    """Yield (kind, name, constant argument, offset, loop depth) for the work done in content[start:end].
+
+    kind is "call" (name is the callee, the constant argument its first argument when that is a
+    lone string literal), "table" for a table constructor, "concat" for `..` and "loop" for a loop head.
+    """
+    tokens = list(iter_lua_tokens(content, start, end))
+    # One entry per open block: whether it is a loop body.
+    blocks: List[bool] = []
+    loops = 0
+    pending_loop = False
+    chain = ""
+    chain_start = 0
+    chain_end = -2
+    for index, token in enumerate(tokens):
+        value = token.value
+        if token.kind == "name" and value not in LUA_KEYWORDS:
+            if chain_end == index - 2 and tokens[index - 1].value in (".", ":"):
+                chain += tokens[index - 1].value + value
+            else:
+                chain, chain_start = value, token.start
+            chain_end = index
+            continue
+
+        if value == "(" and chain_end == index - 1:
+            constant = None
+            if index + 2 < len(tokens) and tokens[index + 2].value in (",", ")"):
+                constant = _string_value(tokens[index + 1])
+            yield "call", chain, constant, chain_start, loops
+        elif value == "{":
+            yield "table", value, None, token.start, loops
+        elif value == "..":
+            yield "concat", value, None, token.start, loops
+        elif value in ("for", "while"):
+            yield "loop", value, None, token.start, loops
+            pending_loop = True
+        elif value == "do":
+            blocks.append(pending_loop)
+            loops += pending_loop
+            pending_loop = False
+        elif value == "repeat":
+            yield "loop", value, None, token.start, loops
+            blocks.append(True)
+            loops += 1
+        elif value in ("if", "function"):
+            blocks.append(False)
+        elif value in ("end", "until") and blocks:
+            loops -= blocks.pop()
+
+
+def _lint_hot_body(content: str, start: int, end: int) -> List[Tuple[str, int, str]]:
+    """Return (rule, offset, detail) for every hot-path trap in the function body content[start:end]."""
+    findings: List[Tuple[str, int, str]] = []
+    for kind, name, constant, offset, depth in _iter_body_operations(content, start, end):
+        if kind == "table":
+            findings.append(("table-constructor", offset, "{...}"))
+        elif kind == "concat":
+            if depth:
+                findings.append(("concat-in-loop", offset, ".."))
+        elif kind != "call":
+            continue
+        elif name in HOT_LINT_RESOURCE_CALLS:
+            findings.append(("per-call-resource", offset, f"{name}()"))
+        elif name in HOT_LINT_SEARCH_CALLS or name.startswith(("ents.FindIn", "ents.FindBy", "ents.FindAlong")):
+            findings.append(("entity-search", offset, f"{name}()"))
+        elif name == "FindMetaTable":
+            findings.append(("find-metatable", offset, "FindMetaTable()"))
+        elif name == "Color":
+            findings.append(("per-call-color", offset, "Color()"))
+        elif name in HOT_LINT_SETTING_CALLS and constant:
+            findings.append(("constant-setting-get", offset, f"{name}(\"{constant}\")"))
+    return findings
+
+
+def _lint_suppressions(content: str, starts: List[int]) -> Tuple[Optional[set], Dict[int, Optional[set]]]:
+    """Read `ax-lint:` comments: (rules ignored file-wide, line -> rules ignored there); None means every rule."""
+    file_rules: Optional[set] = set()
+    line_rules: Dict[int, Optional[set]] = {}
+    for match in HOT_LINT_SUPPRESS_RE.finditer(content):
+        rules = {rule for rule in re.split(r"[\s,]+", match.group(2)) if rule} or None
+        if match.group(1) == "ignore-file":
+            file_rules = None if rules is None or file_rules is None else file_rules | rules
+            continue
+        line = bisect.bisect_right(starts, match.start())
+        # A comment on its own line covers the next line; a trailing one covers its own.
+        if not content[starts[line - 1] : match.start()].strip():
+            line += 1
+        existing = line_rules.get(line, set())
+        line_rules[line] = None if rules is None or existing is None else existing | rules
+    return file_rules, line_rules
+
+
+def build_hot_lint_report(root: Path, scanned_files: Sequence[ScannedFile]) -> Dict[str, object]:
+    """Lint the bodies of functions the engine runs every frame: hot hook listeners and entity/panel frame methods."""
+    nodes = scan_project_call_graph(scanned_files)
+    named: Dict[str, List[CallGraphNode]] = defaultdict(list)
+    for node in nodes:
+        if node.name and node.start >= 0:
+            named[_normalize_callee(node.name)].append(node)
+
+    # (source, body offset) -> (body, what runs it); a body registered twice is linted once.
+    bodies: Dict[Tuple[Path, int], Tuple[CallGraphNode, str]] = {}
+    for node in nodes:
+        if not node.root or node.root in NET_TIMER_CALLS:
+            continue
+        if node.start >= 0:
+            targets = [node]
+        else:
+            # Registered by name: prefer a definition in the same file.
+            candidates = [item for call in node.calls for item in named.get(_normalize_callee(call), ())]
+            targets = [item for item in candidates if item.source_path == node.source_path] or candidates
+        for target in targets:
+            if target.end > target.start:
+                bodies.setdefault((target.source_path, target.start), (target, node.root))
+
+    findings: List[Dict[str, object]] = []
+    by_source: Dict[Path, List[Tuple[CallGraphNode, str]]] = defaultdict(list)
+    for (source_path, _), body in sorted(bodies.items(), key=lambda item: (item[0][0].as_posix(), item[0][1])):
+        by_source[source_path].append(body)
+    for source_path, items in by_source.items():
+        content = read_text(source_path)
+        starts = _line_starts(content)
+        file_rules, line_rules = _lint_suppressions(content, starts)
+        seen = set()
+        for node, hook in items:
+            for rule, offset, detail in _lint_hot_body(content, node.start, node.end):
+                if (rule, offset) in seen:
+                    continue
+                seen.add((rule, offset))
+                line = bisect.bisect_right(starts, offset)
+                ignored = line_rules.get(line, set())
+                suppressed = file_rules is None or rule in file_rules or ignored is None or rule in ignored
+                findings.append(
+                    {
+                        "rule": rule,
+                        "level": HOT_LINT_RULES[rule][0],
+                        "message": f"{detail} in `{node.label}`" + ("" if hook in node.label else f", run by {hook}"),
+                        "source": _path_to_record(root, source_path),
+                        "line": line,
+                        "column": offset - starts[line - 1] + 1,
+                        "function": node.label,
+                        "hook": hook,
+                        "suppressed": suppressed,
+                    }
+                )
+
+    findings.sort(key=lambda item: (item["source"], item["line"], item["column"], item["rule"]))
+    active = [item for item in findings if not item["suppressed"]]
+    return {
+        "version": HOT_LINT_VERSION,
+        "bodies": len(bodies),
+        "counts": {level: sum(1 for item in active if item["level"] == level) for level in HOT_LINT_LEVELS},
+        "suppressed": len(findings) - len(active),
+        "findings": findings,
+    }
+
+
+def hot_lint_failures(report: Dict[str, object], fail_on: str) -> int:
+    """Count the unsuppressed findings at or above the fail_on level ("none" never fails)."""
+    if fail_on not in HOT_LINT_LEVELS:
+        return 0
+    return sum(report["counts"][level] for level in HOT_LINT_LEVELS[HOT_LINT_LEVELS.index(fail_on) :])
+
+
+def hot_lint_sarif(report: Dict[str, object]) -> Dict[str, object]:
+    """The lint findings as a SARIF 2.1.0 log, suppressed findings marked as such."""
+    results = []
+    for item in report["findings"]:
+        result: Dict[str, object] = {
+            "ruleId": item["rule"],
+            "level": item["level"],
+            "message": {"text": item["message"]},
+            "locations": [
+                {
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": item["source"]},
+                        "region": {"startLine": item["line"], "startColumn": item["column"]},
+                    }
+                }
+            ],
+            "properties": {"function": item["function"], "hook": item["hook"]},
+        }
+        if item["suppressed"]:
+            result["suppressions"] = [{"kind": "inSource"}]
+        results.append(result)
+    return {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [
+            {
+                "tool": {
+                    "driver": {
+                        "name": "parallax-hot-lint",
+                        "rules": [
+                            {
+                                "id": rule,
+                                "shortDescription": {"text": description},
+                                "defaultConfiguration": {"level": level},
+                            }
+                            for rule, (level, description) in HOT_LINT_RULES.items()
+                        ],
+                    }
+                },
+                "results": results,
+            }
+        ],
+    }
+
+
+def render_hot_lint_page(
+    report: Dict[str, object],
+    hooks_subdir: str,
+    source_to_api_page: Dict[str, Path],
+    root: Path,
+) -> str:
+    current_doc = Path(hooks_subdir) / HOT_LINT_PAGE
+    active = [item for item in report["findings"] if not item["suppressed"]]
+    lines: List[str] = []
+    lines.append("# Hot Path Lint")
+    lines.append("")
+    lines.append(
+        f"Known GMod performance traps in the {report['bodies']} function bodies the engine runs every frame: "
+        "per-frame hook listeners (`GM:`, `MODULE:`, `hook.Add`) and `Think`/`Paint`/`Draw` methods of panels, "
+        "entities and weapons. Silence a finding with `-- ax-lint: ignore rule-name` on its line or the line "
+        "above, or `-- ax-lint: ignore-file rule-name` anywhere in the file; leave out the rule to silence all."
+    )
+    lines.append("")
+    lines.append("| Rule | Level | Findings | What it flags |")
+    lines.append("| --- | --- | --- | --- |")
+    for rule, (level, description) in HOT_LINT_RULES.items():
+        count = sum(1 for item in active if item["rule"] == rule)
+        lines.append(f"| `{rule}` | {level} | {count} | {description} |")
+    lines.append("")
+    if report["suppressed"]:
+        lines.append(f"{report['suppressed']} finding(s) suppressed in source.")
         lines.append("")
+    if not active:
+        lines.append("No findings.")
+        lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
 
+    by_source: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    for item in active:
+        by_source[item["source"]].append(item)
+    for source, items in by_source.items():
+        api_target = source_to_api_page.get(str((root / source).resolve()))
+        heading = f"[`{source}`]({relative_doc_link(current_doc, api_target)})" if api_target else f"`{source}`"
+        lines.append(f"## {heading}")
+        lines.append("")
+        lines.append("| Line | Level | Rule | Finding |")
+        lines.append("| --- | --- | --- | --- |")
+        for item in items:
+            lines.append(
+                f"| {item['line']} | {item['level']} | `{item['rule']}` | {escape_table_cell(item['message'])} |"
+            )
+        lines.append("")
     return "\n".join(lines).rstrip() + "\n"
 
 
-def extract_markdown_title(path: Path) -> str:
-    content = read_text(path)
-    for line in content.splitlines():
-        match = HEADER_RE.match(line)
-        if match:
-            return match.group(1).strip()
-    return path.stem.replace("_", " ").replace("-", " ").strip().title()
+def _paint_cost(content: str, start: int, end: int) -> Tuple[Dict[str, int], List[Tuple[str, int]]]:
+    """Static cost of a paint body (draw calls, text measurement and allocations, weighted by loop nesting)
+    and the (method, loop depth) of each `self:` call it makes."""
+    counts = {"draw": 0, "measure": 0, "alloc": 0}
+    loops = 0
+    depth = 0
+    score = 0
+    self_calls: List[Tuple[str, int]] = []
+    for kind, name, _, _, level in _iter_body_operations(content, start, end):
+        if kind == "loop":
+            loops += 1
+            depth = max(depth, level + 1)
+            continue
+        if kind == "call" and name.startswith("self:"):
+            self_calls.append((name[len("self:") :], level))
+        if kind != "call":
+            category = "alloc"
+        elif name in PANEL_MEASURE_CALLS:
+            category = "measure"
+        elif name in PANEL_ALLOC_CALLS:
+            category = "alloc"
+        elif name.startswith("draw.") or re.split(r"[.:]", name)[-1].startswith("Draw"):
+            category = "draw"
+        else:
+            continue
+        counts[category] += 1
+        score += PANEL_COST_WEIGHTS[category] * PANEL_LOOP_FACTOR**level
+    metrics = {"lines": content.count("\n", start, end) + 1, **counts, "loops": loops, "depth": depth, "score": score}
+    return metrics, self_calls
+
+
+def _paint_path_cost(
+    content: str,
+    node: CallGraphNode,
+    methods: Dict[str, CallGraphNode],
+    active: Optional[set] = None,
+) -> Dict[str, object]:
+    """Cost of a paint method plus the same-panel helpers it calls through `self:`, recursively."""
+    active = active or set()
+    total, self_calls = _paint_cost(content, node.start, node.end)
+    helpers: List[str] = []
+    active.add(id(node))
+    for method, level in self_calls:
+        callee = methods.get(method)
+        if callee is None or id(callee) in active:
+            continue
+        nested = _paint_path_cost(content, callee, methods, active)
+        for key in ("lines", "draw", "measure", "alloc", "loops"):
+            total[key] += nested[key]
+        total["score"] += nested["score"] * PANEL_LOOP_FACTOR**level
+        total["depth"] = max(total["depth"], level + nested["depth"])
+        helpers.extend(name for name in [callee.name, *nested["helpers"]] if name not in helpers)
+    active.discard(id(node))
+    return {**total, "helpers": helpers}
+
+
+def _scan_vgui_registrations(content: str) -> List[Tuple[str, str, Optional[str], int]]:
+    """Return (class, table, base, offset) for each `vgui.Register("Class", TABLE[, "Base"])` with literal names."""
+    tokens = list(iter_lua_tokens(content))
+    registrations = []
+    for index in range(len(tokens) - 6):
+        if tokens[index].value != "vgui" or [token.value for token in tokens[index + 1 : index + 4]] != [".", "Register", "("]:
+            continue
+        class_name = _string_value(tokens[index + 4])
+        table = tokens[index + 6]
+        if not class_name or tokens[index + 5].value != "," or table.kind != "name":
+            continue
+        base = None
+        if index + 8 < len(tokens) and tokens[index + 7].value == ",":
+            base = _string_value(tokens[index + 8])
+        registrations.append((class_name, table.value, base, tokens[index].start))
+    return registrations
+
+
+def build_panel_audit(root: Path, scanned_files: Sequence[ScannedFile]) -> Dict[str, object]:
+    """Catalog vgui.Register panels with their overridden methods and rank every paint method by static cost."""
+    panels: List[Dict[str, object]] = []
+    paints: List[Dict[str, object]] = []
+    for scanned in scanned_files:
+        content = read_text(scanned.source_path)
+        if "Paint" not in content and "vgui.Register" not in content:
+            continue
+        source = _path_to_record(root, scanned.source_path)
+        starts = _line_starts(content)
+        nodes = [node for node in scan_lua_call_graph(content, scanned.source_path) if node.name and node.end > node.start]
+        registrations = _scan_vgui_registrations(content) if "vgui.Register" in content else []
+
+        class_methods = set()
+        # A file can reuse one PANEL table for several classes; each owns the methods since the previous registration.
+        previous: Dict[str, int] = {}
+        for class_name, table, base, offset in registrations:
+            lower = previous.get(table, -1)
+            previous[table] = offset
+            methods: Dict[str, CallGraphNode] = {}
+            for node in nodes:
+                owner, _, method = node.name.rpartition(":" if ":" in node.name else ".")
+                if owner == table and lower < node.start < offset:
+                    methods[method] = node
+            for method in PANEL_PAINT_METHODS:
+                node = methods.get(method)
+                if node is None:
+                    continue
+                class_methods.add(id(node))
+                paints.append(
+                    {
+                        "class": class_name,
+                        "method": method,
+                        "function": node.name,
+                        "inline": False,
+                        "source": source,
+                        "line": node.line,
+                        **_paint_path_cost(content, node, methods),
+                    }
+                )
+            panels.append(
+                {
+                    "class": class_name,
+                    "base": base or "Panel",
+                    "source": source,
+                    "line": bisect.bisect_right(starts, offset),
+                    "overrides": {method: methods[method].line for method in PANEL_METHODS if method in methods},
+                }
+            )
 
+        # `child.Paint = function(this, w, h)` overrides paint on one instance.
+        for node in nodes:
+            owner, separator, method = node.name.rpartition(".")
+            if id(node) in class_methods or separator != "." or ":" in node.name or method not in PANEL_PAINT_METHODS:
+                continue
+            enclosing = next((item[0] for item in registrations if item[3] > node.start), None)
+            paints.append(
+                {
+                    "class": enclosing,
+                    "method": method,
+                    "function": node.name,
+                    "inline": True,
+                    "source": source,
+                    "line": node.line,
+                    **_paint_path_cost(content, node, {}),
+                }
+            )
 
-def yaml_quote(value: str) -> str:
-    return '"' + value.replace('"', '\\"') + '"'
+    # Classes without their own Paint draw with the nearest base that has one.
+    by_class = {panel["class"]: panel for panel in panels}
+    paint_scores = {entry["class"]: entry["score"] for entry in paints if not entry["inline"] and entry["method"] == "Paint"}
+    for panel in panels:
+        current: Optional[Dict[str, object]] = panel
+        seen = set()
+        while current is not None and "Paint" not in current["overrides"] and current["class"] not in seen:
+            seen.add(current["class"])
+            current = by_class.get(current["base"])
+        panel["paint_from"] = current["class"] if current is not None and "Paint" in current["overrides"] else None
+        panel["paint_score"] = paint_scores.get(panel["paint_from"])
+
+    panels.sort(key=lambda panel: nav_sort_key(panel["class"]))
+    paints.sort(key=lambda entry: (-entry["score"], entry["source"], entry["line"]))
+    return {
+        "version": PANEL_AUDIT_VERSION,
+        "weights": {**PANEL_COST_WEIGHTS, "loop_factor": PANEL_LOOP_FACTOR},
+        "panels": panels,
+        "paints": paints,
+    }
 
 
-def build_mkdocs_yaml(
-    docs_dir_relative: str,
-    site_name: str,
-    site_description: str,
-    root_pages: Sequence[Tuple[str, str]],
-    manuals_nav_lines: Sequence[str],
-    libraries_nav_lines: Sequence[str],
-    meta_nav_lines: Sequence[str],
-    hooks_nav_lines: Sequence[str],
-    logo_path: Optional[str] = None,
-    favicon_path: Optional[str] = None,
-    extra_css_path: Optional[str] = None,
+def render_panel_audit_page(
+    report: Dict[str, object],
+    api_subdir: str,
+    source_to_api_page: Dict[str, Path],
+    root: Path,
 ) -> str:
+    current_doc = Path(api_subdir) / PANEL_AUDIT_PAGE
+    weights = report["weights"]
+    panels = report["panels"]
+    paints = report["paints"]
+
+    def source_link(entry: Dict[str, object]) -> str:
+        source = f"{entry['source']}:{entry['line']}"
+        api_target = source_to_api_page.get(str((root / entry["source"]).resolve()))
+        if api_target:
+            return f"[`{source}`]({relative_doc_link(current_doc, api_target)})"
+        return f"`{source}`"
+
     lines: List[str] = []
-    lines.append(f"site_name: {yaml_quote(site_name)}")
-    lines.append(f"site_description: {yaml_quote(site_description)}")
-    lines.append("site_author: Riggs")
-    lines.append("site_url: https://parallax-framework.github.io/")
-    lines.append("repo_url: https://github.com/Parallax-Framework/parallax")
-    lines.append("repo_name: Parallax-Framework/parallax")
-    lines.append(f"copyright: \"&copy; 2025-{datetime.now().year}, Parallax Contributors\"")
-    lines.append(f"docs_dir: {normalize_nav_path(docs_dir_relative)}")
-    lines.append("use_directory_urls: true")
-    lines.append("theme:")
-    lines.append("  name: material")
-    lines.append("  language: en")
-    if logo_path:
-        lines.append(f"  logo: {normalize_nav_path(logo_path)}")
-    if favicon_path:
-        lines.append(f"  favicon: {normalize_nav_path(favicon_path)}")
-    lines.append("  font:")
-    lines.append("    text: IBM Plex Sans")
-    lines.append("    code: IBM Plex Mono")
-    lines.append("  features:")
-    lines.append("    - navigation.footer")
-    lines.append("    - navigation.instant")
-    lines.append("    - navigation.instant.progress")
-    lines.append("    - navigation.tracking")
-    lines.append("    - navigation.sections")
-    lines.append("    - navigation.expand")
-    lines.append("    - navigation.indexes")
-    lines.append("    - navigation.top")
-    lines.append("    - search.suggest")
-    lines.append("    - search.highlight")
-    lines.append("    - content.code.copy")
-    lines.append("  palette:")
-    lines.append("    - scheme: slate")
-    lines.append("      primary: deep purple")
-    lines.append("      accent: purple")
-    lines.append("plugins:")
-    lines.append("  - search")
-    if extra_css_path:
-        lines.append("extra_css:")
-        lines.append(f"  - {normalize_nav_path(extra_css_path)}")
-    lines.append("extra:")
-    lines.append("  social:")
-    lines.append("    - icon: fontawesome/brands/github")
-    lines.append("      link: https://github.com/Parallax-Framework")
-    lines.append("    - icon: fontawesome/brands/discord")
-    lines.append("      link: https://discord.gg/yekEvSszW3")
-    lines.append("markdown_extensions:")
-    lines.append("  - admonition")
-    lines.append("  - attr_list")
-    lines.append("  - def_list")
-    lines.append("  - footnotes")
-    lines.append("  - tables")
-    lines.append("  - fenced_code")
-    lines.append("  - pymdownx.details")
-    lines.append("  - pymdownx.superfences")
-    lines.append("  - pymdownx.inlinehilite")
-    lines.append("  - pymdownx.snippets")
-    lines.append("  - pymdownx.highlight:")
-    lines.append("      anchor_linenums: true")
-    lines.append("  - pymdownx.tabbed:")
-    lines.append("      alternate_style: true")
-    lines.append("  - toc:")
-    lines.append("      permalink: true")
-    lines.append("nav:")
+    lines.append("# Panel Audit { .ax-sortable }")
+    lines.append("")
+    lines.append(
+        f"{len(panels)} panel classes registered with `vgui.Register` and {len(paints)} paint methods, including "
+        "`x.Paint = function` overrides on single instances. Each paint body is scored statically: "
+        f"{weights['draw']} per draw call (`draw.*` and any `Draw*` call), {weights['measure']} per text measurement "
+        f"(`surface.GetTextSize`, `ax.util:GetTextWidth`, `markup.Parse`, ...) and {weights['alloc']} per allocation "
+        f"(table constructors, `..`, `Color()`, `Vector()`, `string.format`, ...), each multiplied by "
+        f"{weights['loop_factor']} for every loop around it. Methods of the same panel called through `self:` are "
+        "folded into the caller's path, scaled by the loops around the call (`panels.json` names them); inherited "
+        "methods and other panels are not followed. Scores rank paths against each other; they are not timings. Click a column header to sort."
+    )
+    lines.append("")
 
-    for title, page in root_pages:
-        lines.append(f"  - {yaml_quote(title)}: {normalize_nav_path(page)}")
+    lines.append("## Paint Cost")
+    lines.append("")
+    if paints:
+        lines.append(
+            "| Score | Class | Method | Source | Lines | Draw calls | Text measures | Allocations | Loops | Loop depth "
+            "| Helpers |"
+        )
+        lines.append("| --- | --- | --- | --- | --- | --- | --- | --- | --- | --- | --- |")
+        for entry in paints:
+            method = f"`{escape_table_cell(entry['function'])}`" if entry["inline"] else entry["method"]
+            lines.append(
+                f"| {entry['score']} | {entry['class'] or '-'} | {method} | {source_link(entry)} | {entry['lines']} | "
+                f"{entry['draw']} | {entry['measure']} | {entry['alloc']} | {entry['loops']} | {entry['depth']} | "
+                f"{len(entry['helpers'])} |"
+            )
+    else:
+        lines.append("No paint methods detected.")
+    lines.append("")
+
+    lines.append("## Panels")
+    lines.append("")
+    if not panels:
+        lines.append("No `vgui.Register` calls detected.")
+        lines.append("")
+        return "\n".join(lines).rstrip() + "\n"
+
+    lines.append("| Class | Base | Paint | PaintOver | Think | PerformLayout | Paint score | Registered |")
+    lines.append("| --- | --- | --- | --- | --- | --- | --- | --- |")
+    for panel in panels:
+        overrides = panel["overrides"]
+        cells = [f"line {overrides[method]}" if method in overrides else "-" for method in PANEL_METHODS]
+        if "Paint" not in overrides and panel["paint_from"]:
+            cells[0] = f"from {panel['paint_from']}"
+        score = panel["paint_score"] if panel["paint_score"] is not None else "-"
+        lines.append(
+            f"| `{panel['class']}` | `{panel['base']}` | {' | '.join(cells)} | {score} | {source_link(panel)} |"
+        )
+    lines.append("")
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def build_hooks_nav_lines(
+    hooks_subdir: str,
+    indent: int = 6,
+    page_splits: Optional[Dict[Path, Dict[str, Path]]] = None,
+    hot_hooks: bool = False,
+    net_catalog: bool = False,
+    net_ids: bool = False,
+    hot_lint: bool = False,
+) -> List[str]:
+    lines = [f'{" " * indent}- "Overview": {normalize_nav_path(f"{hooks_subdir}/index.md")}']
+    if hot_hooks:
+        lines.append(f'{" " * indent}- "Hot Hooks": {normalize_nav_path(f"{hooks_subdir}/{HOT_HOOKS_PAGE}")}')
+    if net_catalog:
+        lines.append(f'{" " * indent}- "Network Messages": {normalize_nav_path(f"{hooks_subdir}/{NET_CATALOG_PAGE}")}')
+    if net_ids:
+        lines.append(f'{" " * indent}- "Network IDs": {normalize_nav_path(f"{hooks_subdir}/{NET_IDS_PAGE}")}')
+    if hot_lint:
+        lines.append(f'{" " * indent}- "Hot Path Lint": {normalize_nav_path(f"{hooks_subdir}/{HOT_LINT_PAGE}")}')
+    for kind, label in (
+        ("gm", "GM Definitions"),
+        ("module", "MODULE Definitions"),
+        ("run", "hook.Run Calls"),
+        ("add", "hook.Add Registrations"),
+    ):
+        lines.extend(nav_page_lines(label, Path(hooks_subdir) / f"{kind}.md", indent, page_splits))
+    return lines
+
+
+def remove_stale_generated_markdown(
+    section_dir: Path,
+    expected_files: set[str],
+    dry_run: bool,
+) -> None:
+    if not section_dir.exists():
+        return
+
+    stale_files = sorted(
+        (
+            path
+            for path in section_dir.rglob("*.md")
+            if str(path.resolve()) not in expected_files
+        ),
+        key=lambda path: path.as_posix().casefold(),
+    )
+
+    for stale_file in stale_files:
+        if dry_run:
+            print(f"[dry-run] Would remove stale generated file: {stale_file}")
+            continue
+
+        stale_file.unlink()
+        print(f"Removed stale generated file: {stale_file}")
+
+    if not dry_run and section_dir.exists():
+        for directory in sorted(
+            (path for path in section_dir.rglob("*") if path.is_dir()),
+            key=lambda path: len(path.parts),
+            reverse=True,
+        ):
+            try:
+                directory.rmdir()
+            except OSError:
+                pass
+
+
+def escape_table_cell(value: str) -> str:
+    escaped = value.replace("|", "\\|")
+    return escaped.replace("\n", "<br>")
+
+
+def scan_lua_file(
+    root: Path,
+    source_dir: Path,
+    api_subdir: str,
+    file_path: Path,
+) -> ScannedFile:
+    return scan_lua_source(read_text(file_path), source_dir, api_subdir, file_path)
+
+
+def _long_bracket_end(content: str, position: int, level: int) -> int:
+    closer = "]" + "=" * level + "]"
+    stop = content.find(closer, position)
+    return len(content) if stop < 0 else stop + len(closer)
+
+
+def _comment_end(content: str, position: int) -> Tuple[int, Optional[str]]:
+    """Return where the comment at position ends, plus its body if it is a block comment."""
+    if content.startswith("/*", position):
+        stop = content.find("*/", position + 2)
+        if stop < 0:
+            return len(content), content[position + 2 :]
+        return stop + 2, content[position + 2 : stop]
+
+    if content.startswith("--", position):
+        bracket = LONG_BRACKET_RE.match(content, position + 2)
+        if bracket:
+            closer = "]" + bracket.group(1) + "]"
+            stop = content.find(closer, bracket.end())
+            if stop < 0:
+                return len(content), content[bracket.end() :]
+            return stop + len(closer), content[bracket.end() : stop]
+
+    stop = content.find("\n", position)
+    return (len(content) if stop < 0 else stop), None
+
+
+def _string_end(content: str, position: int) -> int:
+    return SHORT_STRING_RES[content[position]].match(content, position).end()
+
+
+def _string_value(token: Optional[LuaToken]) -> Optional[str]:
+    if token is None or token.kind != "string":
+        return None
+    value = token.value
+    if len(value) < 2 or value[0] not in "\"'" or value[-1] != value[0]:
+        return None
+    return value[1:-1]
+
+
+def iter_lua_tokens(
+    content: str,
+    position: int = 0,
+    end: Optional[int] = None,
+    include_comments: bool = False,
+) -> Iterator[LuaToken]:
+    """Yield the tokens of content[position:end], skipping whitespace and, by default, comments."""
+    if end is None:
+        end = len(content)
+    match_token = LUA_TOKEN_RE.match
+    while position < end:
+        match = match_token(content, position)
+        kind = match.lastgroup
+        if kind == "space":
+            position = match.end()
+            continue
+        if kind == "comment":
+            stop, _ = _comment_end(content, position)
+            if include_comments:
+                yield LuaToken("comment", content[position:stop], position, stop)
+            position = stop
+            continue
+        if kind == "long":
+            stop = _long_bracket_end(content, match.end(), match.end() - position - 2)
+            kind = "string"
+        elif kind == "quote":
+            stop = _string_end(content, position)
+            kind = "string"
+        else:
+            stop = match.end()
+        yield LuaToken(kind, content[position:stop], position, stop)
+        position = stop
+
+
+def _line_bounds(content: str, position: int) -> Tuple[int, int]:
+    line_end = content.find("\n", position)
+    return content.rfind("\n", 0, position) + 1, len(content) if line_end < 0 else line_end
+
+
+def _assignment_target(content: str, line_start: int, position: int) -> Optional[str]:
+    """Return NAME for a line that reads `NAME = function`, NAME being a dotted or colon path."""
+    tokens = list(iter_lua_tokens(content, line_start, position))
+    if len(tokens) < 2 or tokens[-1].value != "=" or len(tokens) % 2:
+        return None
+    for index, token in enumerate(tokens[:-1]):
+        if index % 2 == 0:
+            if token.kind != "name" or token.value in LUA_KEYWORDS:
+                return None
+        elif token.value not in (".", ":"):
+            return None
+    return "".join(token.value for token in tokens[:-1])
+
+
+def _scan_function(content: str, start: int, line: int, events: List[LuaEvent]) -> None:
+    """Record the definition started by the `function` keyword at start, if it is one."""
+    line_start, _ = _line_bounds(content, start)
+    prefix = content[line_start:start].strip()
+    # Definitions open a line or follow `NAME =`; anything else is a callback.
+    if prefix and not prefix.endswith("="):
+        return
+
+    head = _read_function_head(content, start + len("function"))
+    if head is None:
+        return
+    name, params = head
+    if name:
+        # `local function` stays private.
+        if prefix:
+            return
+        owner, _, hook_name = name.partition(":")
+        if owner in ("GM", "MODULE") and hook_name and ":" not in hook_name:
+            events.append(LuaEvent(line, owner.lower(), hook_name, None))
+    else:
+        name = _assignment_target(content, line_start, start) or ""
+        if not name:
+            return
+
+    events.append(LuaEvent(line, "def", name, tuple(params)))
+
+
+def _read_function_head(content: str, position: int) -> Optional[Tuple[str, List[str]]]:
+    """Return the (possibly empty) name and the parameters of the function head at position."""
+    match = FUNCTION_HEAD_RE.match(content, position)
+    if match:
+        params = [part.strip() for part in match.group(2).split(",")]
+        if params == [""]:
+            params = []
+        if all(PARAM_NAME_RE.fullmatch(param) for param in params):
+            return "".join((match.group(1) or "").split()), params
+
+    tokens = iter_lua_tokens(content, position)
+    name = ""
+    token = next(tokens, None)
+    if token is not None and token.kind == "name":
+        name = token.value
+        token = next(tokens, None)
+        while token is not None and token.value in (".", ":"):
+            part = next(tokens, None)
+            if part is None or part.kind != "name":
+                return None
+            name += token.value + part.value
+            token = next(tokens, None)
+    if token is None or token.value != "(":
+        return None
+
+    params = []
+    token = next(tokens, None)
+    if token is not None and token.value != ")":
+        while True:
+            if token is None or (token.kind != "name" and token.value != "..."):
+                return None
+            params.append(token.value)
+            token = next(tokens, None)
+            if token is None or token.value == ")":
+                break
+            if token.value != ",":
+                return None
+            token = next(tokens, None)
+    if token is None:
+        return None
+    return name, params
+
+
+def _scan_hook_call(content: str, position: int) -> Optional[Tuple[str, str]]:
+    """Return (kind, name) for `hook.Run("Name"` or `hook.Add("Name"` right after `hook`."""
+    tokens = iter_lua_tokens(content, position)
+    dot = next(tokens, None)
+    if dot is None or dot.value != ".":
+        return None
+    method = next(tokens, None)
+    if method is None or method.value not in ("Run", "Add"):
+        return None
+    paren = next(tokens, None)
+    if paren is None or paren.value != "(":
+        return None
+    hook_name = _string_value(next(tokens, None))
+    if not hook_name:
+        return None
+    return method.value.lower(), hook_name
+
+
+def _scan_net_call(content: str, start: int, position: int) -> Optional[Tuple[str, Tuple[Tuple[Optional[str], str], ...]]]:
+    """Return (method, leading arguments) for the `ax.net:Method(` call whose `.net:` is at start.
+
+    Each argument is (string literal value or None, source text).
+    """
+    if content[start - 2 : start] != "ax" or (start > 2 and (content[start - 3].isalnum() or content[start - 3] in "_.")):
+        return None
+    line_start, _ = _line_bounds(content, start)
+    # `function ax.net:Start(` defines the method.
+    if content[line_start : start - 2].rstrip().endswith("function"):
+        return None
+    tokens = iter_lua_tokens(content, position)
+    method = next(tokens, None)
+    if method is None or method.value not in NET_METHODS:
+        return None
+    paren = next(tokens, None)
+    if paren is None or paren.value != "(":
+        return None
+
+    wanted = NET_METHODS[method.value]
+    arguments: List[Tuple[Optional[str], str]] = []
+    parts: List[LuaToken] = []
+    depth = 0
+    for token in tokens:
+        value = token.value
+        if depth == 0 and value in (",", ")"):
+            text = " ".join(content[parts[0].start : parts[-1].end].split()) if parts else ""
+            arguments.append((_string_value(parts[0]) if len(parts) == 1 else None, text))
+            if value == ")" or len(arguments) == wanted:
+                break
+            parts = []
+            continue
+        if value in ("(", "{", "["):
+            depth += 1
+        elif value in (")", "}", "]"):
+            depth -= 1
+        parts.append(token)
+    if not arguments:
+        return None
+    return method.value, tuple(arguments)
+
+
+def _net_occurrence(
+    method: str,
+    arguments: Tuple[Tuple[Optional[str], str], ...],
+    file_path: Path,
+    line: int,
+) -> NetOccurrence:
+    """Read the message name and recipients of an `ax.net` call from its arguments and the file realm.
+
+    Server `Start(target, name, ...)` sends to a player, a list of players or, with nil, everyone;
+    client `Start(name, ...)` sends to the server. Shared files are told apart by which argument is a string.
+    """
+    missing: Tuple[Optional[str], str] = (None, "")
+    first = arguments[0]
+    second = arguments[1] if len(arguments) > 1 else missing
+    target: Optional[str] = None
+    if method == "Hook":
+        name_argument = first
+    elif method in NET_SEND_TARGETS:
+        name_argument, target = second, NET_SEND_TARGETS[method]
+    else:
+        realm = infer_realm_from_filename(file_path)
+        if realm == "client" or (realm != "server" and first[0] is not None):
+            name_argument, target = first, "server"
+        elif first[1] == "nil":
+            name_argument, target = second, "broadcast"
+        elif realm == "server" or second[0] is not None:
+            name_argument, target = second, "player"
+        else:
+            name_argument = first
+    name = name_argument[0]
+    return NetOccurrence(
+        direction="receive" if method == "Hook" else "send",
+        name=sys.intern(name) if name else None,
+        expression="" if name else name_argument[1],
+        target=_intern_optional(target),
+        source_path=file_path,
+        line=line,
+    )
+
+
+def _scan_meta_alias(content: str, line_start: int, line_end: int) -> Optional[Tuple[str, str]]:
+    """Return (alias, meta type) for `X = ax.<type>.meta` or `X = FindMetaTable("<Type>")`."""
+    tokens = list(iter_lua_tokens(content, line_start, line_end))
+    index = 1 if tokens and tokens[0].value == "local" else 0
+    if len(tokens) < index + 3:
+        return None
+    alias, equals = tokens[index], tokens[index + 1]
+    if alias.kind != "name" or alias.value in LUA_KEYWORDS or equals.value != "=":
+        return None
+
+    values = [token.value for token in tokens[index + 2 :]]
+    if values[:2] == ["ax", "."] and values[3:5] == [".", "meta"] and values[2] in META_TYPES:
+        return alias.value, values[2]
+
+    for offset, value in enumerate(values):
+        if value != "FindMetaTable" or values[offset + 1 : offset + 2] != ["("]:
+            continue
+        argument_index = index + 2 + offset + 2
+        if values[offset + 3 : offset + 4] != [")"] or argument_index >= len(tokens):
+            continue
+        meta_type = META_TYPE_NAMES.get(_string_value(tokens[argument_index]) or "")
+        if meta_type:
+            return alias.value, meta_type
+    return None
+
+
+def scan_lua_events(content: str) -> Tuple[List[LuaEvent], Dict[int, LongComment]]:
+    """Scan a Lua source in one pass.
+
+    Comments and strings are stepped over whole, so nothing inside them is
+    reported, and definitions are read token by token even when their signature
+    spans several lines. Block comments are returned keyed by their last line.
+    """
+    events: List[LuaEvent] = []
+    long_comments: Dict[int, LongComment] = {}
+    counted = 0
+    line = 0
+    alias_line = -1
+
+    for match in LUA_SCAN_RE.finditer(content):
+        kind = match.lastgroup
+        if kind == "skip":
+            continue
+        start = match.start()
+        line += content.count("\n", counted, start)
+        counted = start
+
+        if kind == "comment":
+            text = match.group()
+            if text.startswith("/*"):
+                body = text[2:-2]
+            else:
+                level = len(match.group("level"))
+                body = text[level + 4 : -(level + 2)]
+            line_start, _ = _line_bounds(content, start)
+            _, line_end = _line_bounds(content, match.end())
+            end_line = line + text.count("\n")
+            long_comments[end_line] = LongComment(
+                start_line=line,
+                end_line=end_line,
+                body=body,
+                standalone=not content[line_start:start].strip() and not content[match.end() : line_end].strip(),
+            )
+        elif kind == "meta" or match.group() == "FindMetaTable":
+            if line != alias_line:
+                alias_line = line
+                alias = _scan_meta_alias(content, *_line_bounds(content, start))
+                if alias:
+                    events.append(LuaEvent(line, "alias", alias[0], alias[1]))
+        elif kind == "net":
+            call = _scan_net_call(content, start, match.end())
+            if call:
+                events.append(LuaEvent(line, "net", call[0], call[1]))
+        elif match.group() == "hook":
+            call = _scan_hook_call(content, match.end())
+            if call:
+                events.append(LuaEvent(line, call[0], call[1], None))
+        else:
+            _scan_function(content, start, line, events)
+
+    return events, long_comments
+
+
+def scan_lua_source(
+    content: str,
+    source_dir: Path,
+    api_subdir: str,
+    file_path: Path,
+) -> ScannedFile:
+    lines = content.split("\n")
+    events, long_comments = scan_lua_events(content)
+
+    functions: List[FunctionDoc] = []
+    hooks: List[HookOccurrence] = []
+    net: List[NetOccurrence] = []
+    first_function_index = len(lines)
+    meta_aliases: Dict[str, str] = {}
+
+    for event in events:
+        if event.kind == "alias":
+            meta_aliases[event.name] = sys.intern(event.value)
+            continue
+
+        if event.kind == "net":
+            net.append(_net_occurrence(event.name, event.value, file_path, event.line + 1))
+            continue
+
+        if event.kind != "def":
+            hooks.append(
+                HookOccurrence(
+                    kind=sys.intern(event.kind),
+                    hook_name=sys.intern(event.name),
+                    source_path=file_path,
+                    line=event.line + 1,
+                )
+            )
+            continue
+
+        index = event.line
+        if index < first_function_index:
+            first_function_index = index
+
+        function_name = event.name
+        doc_lines = collect_doc_lines_above(lines, index, long_comments)
+        if not doc_lines:
+            continue
+
+        parsed_comment = parse_comment_lines(doc_lines)
+        if not parsed_comment.has_content:
+            continue
+
+        signature = f"{function_name}({', '.join(event.value)})"
+        realm = parsed_comment.realm or infer_realm_from_filename(file_path)
+        meta_type = infer_meta_type(function_name, meta_aliases)
+        functions.append(
+            FunctionDoc(
+                name=function_name,
+                signature=signature,
+                line=index + 1,
+                description=parsed_comment.description,
+                realm=realm,
+                params=tuple(parsed_comment.params),
+                returns=tuple(parsed_comment.returns),
+                usage=tuple(parsed_comment.usage),
+                meta_type=meta_type,
+            )
+        )
+
+    file_doc: Optional[FileDoc] = None
+    if functions:
+        module, section, summary = parse_file_metadata(lines, first_function_index)
+        source_group = sys.intern(source_dir.name)
+        relative_path = file_path.relative_to(source_dir)
+        output_relative = Path(api_subdir) / source_group / relative_path.with_suffix(".md")
+
+        file_doc = FileDoc(
+            source_path=file_path,
+            source_group=source_group,
+            relative_path=relative_path,
+            output_relative=output_relative,
+            module=module,
+            section=section,
+            summary=summary,
+            functions=functions,
+        )
+
+    return ScannedFile(
+        source_path=file_path,
+        file_doc=file_doc,
+        meta_aliases=meta_aliases,
+        hooks=hooks,
+        net=net,
+    )
+
+
+def _path_to_record(root: Path, path: Path) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def _path_from_record(root: Path, value: str) -> Path:
+    path = Path(value)
+    return path if path.is_absolute() else root / path
+
+
+def function_doc_to_record(function_doc: FunctionDoc) -> Dict[str, object]:
+    return {
+        "name": function_doc.name,
+        "signature": function_doc.signature,
+        "line": function_doc.line,
+        "description": function_doc.description,
+        "realm": function_doc.realm,
+        "params": [[param.name, param.type_name, param.description] for param in function_doc.params],
+        "returns": [[return_doc.type_name, return_doc.description] for return_doc in function_doc.returns],
+        "usage": list(function_doc.usage),
+        "meta_type": function_doc.meta_type,
+    }
+
+
+def _intern_optional(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+def function_doc_from_record(record: Dict[str, object]) -> FunctionDoc:
+    return FunctionDoc(
+        name=record["name"],
+        signature=record["signature"],
+        line=record["line"],
+        description=record["description"],
+        realm=_intern_optional(record["realm"]),
+        params=tuple(
+            ParamDoc(name=sys.intern(name), type_name=sys.intern(type_name), description=description)
+            for name, type_name, description in record["params"]
+        ),
+        returns=tuple(ReturnDoc(type_name=sys.intern(type_name), description=description) for type_name, description in record["returns"]),
+        usage=tuple(record["usage"]),
+        meta_type=_intern_optional(record["meta_type"]),
+    )
+
+
+def scanned_file_to_record(root: Path, scanned: ScannedFile) -> Dict[str, object]:
+    file_record: Optional[Dict[str, object]] = None
+    file_doc = scanned.file_doc
+    if file_doc:
+        file_record = {
+            "source_group": file_doc.source_group,
+            "relative_path": file_doc.relative_path.as_posix(),
+            "output_relative": file_doc.output_relative.as_posix(),
+            "module": file_doc.module,
+            "section": file_doc.section,
+            "summary": file_doc.summary,
+            "functions": [function_doc_to_record(function_doc) for function_doc in file_doc.functions],
+        }
+
+    return {
+        "source_path": _path_to_record(root, scanned.source_path),
+        "file_doc": file_record,
+        "meta_aliases": dict(scanned.meta_aliases),
+        "hooks": [[hook.kind, hook.hook_name, hook.line] for hook in scanned.hooks],
+        "net": [[item.direction, item.name, item.expression, item.target, item.line] for item in scanned.net],
+    }
+
+
+def scanned_file_from_record(root: Path, record: Dict[str, object]) -> ScannedFile:
+    source_path = _path_from_record(root, record["source_path"])
+    file_doc: Optional[FileDoc] = None
+    file_record = record["file_doc"]
+    if file_record:
+        file_doc = FileDoc(
+            source_path=source_path,
+            source_group=sys.intern(file_record["source_group"]),
+            relative_path=Path(file_record["relative_path"]),
+            output_relative=Path(file_record["output_relative"]),
+            module=file_record["module"],
+            section=file_record["section"],
+            summary=file_record["summary"],
+            functions=[function_doc_from_record(item) for item in file_record["functions"]],
+        )
+
+    return ScannedFile(
+        source_path=source_path,
+        file_doc=file_doc,
+        meta_aliases={alias: sys.intern(meta_type) for alias, meta_type in record["meta_aliases"].items()},
+        hooks=[
+            HookOccurrence(kind=sys.intern(kind), hook_name=sys.intern(hook_name), source_path=source_path, line=line)
+            for kind, hook_name, line in record["hooks"]
+        ],
+        net=[
+            NetOccurrence(
+                direction=sys.intern(direction),
+                name=_intern_optional(name),
+                expression=expression,
+                target=_intern_optional(target),
+                source_path=source_path,
+                line=line,
+            )
+            for direction, name, expression, target, line in record["net"]
+        ],
+    )
+
+
+def generator_digest() -> str:
+    return hashlib.sha256(Path(__file__).resolve().read_bytes()).hexdigest()
+
+
+def fingerprint_options(layout: DocsLayout) -> Dict[str, object]:
+    """The layout settings that change generated output, with paths relative to the root."""
+    root = layout.root
+    return {
+        "source_dirs": [_path_to_record(root, path) for path in layout.source_dirs],
+        "docs_dir": layout.docs_dir_relative,
+        "sections": layout.generated_sections,
+        "manuals": [_path_to_record(root, layout.manuals_source_dir), layout.manuals_subdir],
+        "mkdocs_file": _path_to_record(root, layout.mkdocs_path),
+        "site": [layout.site_name, layout.site_description],
+        "symbol_index": _path_to_record(root, layout.symbol_index_path) if layout.symbol_index_path else None,
+        "symbol_db": _path_to_record(root, layout.symbol_db_path) if layout.symbol_db_path else None,
+        "hot_hooks": _path_to_record(root, layout.hot_hooks_budget_path) if layout.hot_hooks_budget_path else None,
+        "net_catalog": layout.net_catalog,
+        "net_ids": _path_to_record(root, layout.net_ids_path) if layout.net_ids_path else None,
+        "hot_lint": layout.hot_lint,
+        "panel_audit": layout.panel_audit,
+        "search_index": layout.search_index,
+        "snippet_includes": layout.snippet_includes,
+        "page_budget": layout.page_budget,
+        "manuals_mode": layout.manuals_mode,
+        # mkdocs.yml carries the copyright year.
+        "year": datetime.now().year,
+    }
+
+
+def iter_fingerprint_inputs(layout: DocsLayout, manifest: GeneratedManifest) -> Iterator[Path]:
+    """Yield every file whose content can change the generated docs, in a stable order."""
+    for source_dir in layout.source_dirs:
+        if source_dir.exists():
+            yield from sorted(source_dir.rglob("*.lua"))
+
+    if layout.manuals_source_dir.exists():
+        yield from sorted(layout.manuals_source_dir.rglob("*.md"))
+
+    if layout.hot_hooks_budget_path is not None and layout.hot_hooks_budget_path.exists():
+        yield layout.hot_hooks_budget_path
+
+    # Handwritten docs (home page, assets) are whatever the generator did not write itself.
+    if layout.docs_dir.exists():
+        generated = manifest.previous.keys()
+        for path in sorted(layout.docs_dir.rglob("*")):
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            if manifest.key(path) not in generated:
+                yield path
+
+
+def compute_input_fingerprint(layout: DocsLayout, manifest: GeneratedManifest) -> Tuple[str, int]:
+    hasher = hashlib.sha256()
+    hasher.update(f"{FINGERPRINT_VERSION}:{generator_digest()}\n".encode("utf-8"))
+    hasher.update(json.dumps(fingerprint_options(layout), sort_keys=True).encode("utf-8") + b"\n")
+    count = 0
+    for path in iter_fingerprint_inputs(layout, manifest):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        hasher.update(f"{_path_to_record(layout.root, path)}\0{digest}\n".encode("utf-8"))
+        count += 1
+    return hasher.hexdigest(), count
+
+
+def load_fingerprint(path: Path) -> Optional[str]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if payload.get("version") != FINGERPRINT_VERSION:
+        return None
+    return payload.get("fingerprint")
+
+
+def save_fingerprint(path: Path, fingerprint: str, inputs: int) -> None:
+    payload = {"version": FINGERPRINT_VERSION, "fingerprint": fingerprint, "inputs": inputs}
+    atomic_write_bytes(path, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+
+
+def check_fingerprint(layout: DocsLayout, fingerprint_path: Path, write: bool = False) -> int:
+    """Compare the current inputs with the last generation, or store them; returns the process exit code."""
+    manifest = GeneratedManifest(layout.root, layout.docs_dir)
+    manifest.load()
+    fingerprint, inputs = compute_input_fingerprint(layout, manifest)
+    if write:
+        save_fingerprint(fingerprint_path, fingerprint, inputs)
+        print(f"Wrote fingerprint ({inputs} files, {fingerprint[:12]}): {_path_to_record(layout.root, fingerprint_path)}")
+        return 0
+
+    stored = load_fingerprint(fingerprint_path)
+    if stored == fingerprint:
+        print(f"Docs inputs unchanged ({inputs} files, fingerprint {fingerprint[:12]}); nothing to regenerate.")
+        return 0
+    if stored is None:
+        print(f"No stored fingerprint at {_path_to_record(layout.root, fingerprint_path)}; docs need generating.")
+    else:
+        print(f"Docs inputs changed ({inputs} files, fingerprint {stored[:12]} -> {fingerprint[:12]}); docs need regenerating.")
+    return 1
+
+
+class ScanCache:
+    """On-disk cache of ScannedFile records keyed by path, size, mtime and content hash."""
+
+    def __init__(self, root: Path, cache_path: Optional[Path]) -> None:
+        self.root = root
+        self.cache_path = cache_path
+        self.stamp = f"{SCAN_CACHE_VERSION}:{generator_digest()}"
+        self.entries: Dict[str, Dict[str, object]] = {}
+        self.updated: Dict[str, Dict[str, object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self) -> None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if payload.get("stamp") != self.stamp:
+            return
+
+        self.entries = payload.get("entries", {})
+
+    def lookup(self, source_dir: Path, api_subdir: str, file_path: Path) -> Tuple[Optional[ScannedFile], Optional[bytes]]:
+        """Return a cached scan for the file, or the file's bytes when it has to be parsed."""
+        key = _path_to_record(self.root, file_path)
+        context = [_path_to_record(self.root, source_dir), api_subdir]
+        stat = file_path.stat()
+        entry = self.entries.get(key)
+        if entry is not None and entry["context"] != context:
+            entry = None
+
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            self.hits += 1
+            self.updated[key] = entry
+            return scanned_file_from_record(self.root, entry["scan"]), None
+
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry["sha256"] == digest:
+            self.hits += 1
+            entry = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            self.updated[key] = entry
+            return scanned_file_from_record(self.root, entry["scan"]), None
+
+        self.misses += 1
+        self.updated[key] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "context": context,
+            "scan": None,
+        }
+        return None, data
+
+    def store(self, scanned: ScannedFile) -> None:
+        key = _path_to_record(self.root, scanned.source_path)
+        self.updated[key]["scan"] = scanned_file_to_record(self.root, scanned)
+
+    def save(self) -> None:
+        if self.cache_path is None or (self.misses == 0 and self.updated == self.entries):
+            return
+
+        payload = {"stamp": self.stamp, "entries": self.updated}
+        atomic_write_bytes(self.cache_path, json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+class RunProfiler:
+    """Wall time and tracemalloc peak per phase, for --profile.
+
+    Disabled profilers are no-ops, so callers can time phases unconditionally.
+    Phases with the same name accumulate; scan workers in other processes are
+    timed, but their allocations are not traced.
+    """
+
+    def __init__(self, enabled: bool = False, top: int = DEFAULT_PROFILE_TOP) -> None:
+        self.enabled = enabled
+        self.top = top
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.file_seconds: Dict[str, float] = {}
+        self.page_bytes: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            entry = self.phases.setdefault(name, {"seconds": 0.0, "peak_bytes": 0, "calls": 0})
+            entry["seconds"] += elapsed
+            entry["peak_bytes"] = max(entry["peak_bytes"], peak)
+            entry["calls"] += 1
+
+    def record_file(self, path: Path, seconds: float) -> None:
+        if self.enabled:
+            self.file_seconds[str(path)] = seconds
+
+    def record_page(self, path: Path, size: int) -> None:
+        if self.enabled:
+            self.page_bytes[str(path)] = size
+
+    def report(self, root: Path) -> Dict[str, object]:
+        def display(path: str) -> str:
+            return _path_to_record(root, Path(path))
+
+        slowest = sorted(self.file_seconds.items(), key=lambda item: item[1], reverse=True)[: self.top]
+        largest = sorted(self.page_bytes.items(), key=lambda item: item[1], reverse=True)[: self.top]
+        return {
+            "total_seconds": round(time.perf_counter() - self.started, 6),
+            "peak_bytes": tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0,
+            "phases": [
+                {"name": name, "seconds": round(entry["seconds"], 6), "peak_bytes": int(entry["peak_bytes"]), "calls": int(entry["calls"])}
+                for name, entry in self.phases.items()
+            ],
+            "parsed_files": len(self.file_seconds),
+            "slowest_files": [{"path": display(path), "seconds": round(seconds, 6)} for path, seconds in slowest],
+            "rendered_pages": len(self.page_bytes),
+            "largest_pages": [{"path": display(path), "bytes": size} for path, size in largest],
+        }
+
+
+def print_profile_report(report: Dict[str, object]) -> None:
+    print("")
+    print(f"{'Phase':<24} {'Wall (s)':>10} {'Peak MiB':>10} {'Calls':>7}")
+    for phase in report["phases"]:
+        print(f"{phase['name']:<24} {phase['seconds']:>10.3f} {phase['peak_bytes'] / 1048576:>10.1f} {phase['calls']:>7}")
+    print(f"{'total':<24} {report['total_seconds']:>10.3f}")
+
+    if report["slowest_files"]:
+        print("")
+        print(f"Slowest files to parse ({report['parsed_files']} parsed):")
+        for entry in report["slowest_files"]:
+            print(f"  {entry['seconds'] * 1000:>9.1f} ms  {entry['path']}")
+
+    if report["largest_pages"]:
+        print("")
+        print(f"Largest rendered pages ({report['rendered_pages']} rendered):")
+        for entry in report["largest_pages"]:
+            print(f"  {entry['bytes'] / 1024:>9.1f} KiB {entry['path']}")
+
+
+def _scan_job(job: Tuple[Path, str, Path, Optional[bytes]]) -> ScannedFile:
+    source_dir, api_subdir, file_path, data = job
+    content = decode_source(data) if data is not None else read_text(file_path)
+    return scan_lua_source(content, source_dir, api_subdir, file_path)
+
+
+def _timed_scan_job(job: Tuple[Path, str, Path, Optional[bytes]]) -> Tuple[ScannedFile, float]:
+    started = time.perf_counter()
+    scanned = _scan_job(job)
+    return scanned, time.perf_counter() - started
+
+
+def default_job_count() -> int:
+    return os.cpu_count() or 1
+
+
+def scan_source_dirs(
+    root: Path,
+    source_dirs: Sequence[Path],
+    api_subdir: str,
+    cache: Optional[ScanCache] = None,
+    jobs: int = 1,
+    profiler: Optional[RunProfiler] = None,
+) -> List[ScannedFile]:
+    tasks: List[Tuple[Path, Path]] = []
+    for source_dir in source_dirs:
+        if not source_dir.exists():
+            print(f"Skipping missing source path: {source_dir}")
+            continue
+
+        for lua_file in sorted(source_dir.rglob("*.lua")):
+            tasks.append((source_dir, lua_file))
+
+    results: List[Optional[ScannedFile]] = [None] * len(tasks)
+    pending: List[int] = []
+    pending_jobs: List[Tuple[Path, str, Path, Optional[bytes]]] = []
+    for index, (source_dir, lua_file) in enumerate(tasks):
+        data: Optional[bytes] = None
+        if cache is not None:
+            cached, data = cache.lookup(source_dir, api_subdir, lua_file)
+            if cached is not None:
+                results[index] = cached
+                continue
+
+        pending.append(index)
+        pending_jobs.append((source_dir, api_subdir, lua_file, data))
+
+    # Results are slotted back by task index, so the merged order (and every page
+    # rendered from it) is identical whatever the worker count.
+    profiling = profiler is not None and profiler.enabled
+    job = _timed_scan_job if profiling else _scan_job
+    if jobs > 1 and len(pending_jobs) >= MIN_PARALLEL_SCAN_FILES:
+        workers = min(jobs, len(pending_jobs))
+        chunksize = max(1, len(pending_jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parsed = list(pool.map(job, pending_jobs, chunksize=chunksize))
+    else:
+        parsed = [job(pending_job) for pending_job in pending_jobs]
+
+    if profiling:
+        for timed in parsed:
+            profiler.record_file(timed[0].source_path, timed[1])
+        parsed = [timed[0] for timed in parsed]
+
+    for index, scanned in zip(pending, parsed):
+        results[index] = scanned
+        if cache is not None:
+            cache.store(scanned)
+
+    return [scanned for scanned in results if scanned is not None]
+
+
+def render_file_markdown(file_doc: FileDoc, root: Path, blocks: Optional[FunctionBlocks] = None) -> str:
+    blocks = blocks or FunctionBlocks()
+    display_name = file_doc.module or file_doc.relative_path.with_suffix("").as_posix()
+    source_rel = file_doc.source_path.relative_to(root).as_posix()
+    functions = sorted(file_doc.functions, key=lambda item: (nav_sort_key(item.name), item.line))
+
+    lines: List[str] = []
+    lines.append(f"# {display_name}")
+    lines.append("")
+    lines.append(f"Source: `{source_rel}`")
+    if file_doc.summary:
+        lines.append("")
+        lines.append(file_doc.summary)
+    if file_doc.section:
+        lines.append("")
+        lines.append(f"Section: `{file_doc.section}`")
+
+    lines.append("")
+    lines.append(f"Documented functions: **{len(functions)}**")
+    lines.append("")
+    lines.append("## Functions")
+    lines.append("")
+
+    for function in functions:
+        anchor = slugify(f"{function.name}-{function.line}")
+        lines.append(f"- [`{function.signature}`](#{anchor})")
+
+    lines.append("")
+    lines.append("---")
+    lines.append("")
+
+    for function in functions:
+        lines.append(blocks.define(function))
+        lines.append("")
+        lines.append("---")
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def render_api_index(
+    file_docs: Sequence[FileDoc],
+    api_subdir: str,
+    libraries_subdir: str,
+    meta_subdir: str,
+    hooks_subdir: str,
+) -> str:
+    grouped: Dict[str, List[FileDoc]] = defaultdict(list)
+    for file_doc in file_docs:
+        grouped[file_doc.source_group].append(file_doc)
+
+    lines: List[str] = []
+    lines.append("# Source Reference")
+    lines.append("")
+    lines.append("File-organized view of all documented Lua source, generated from LDOC annotations.")
+    lines.append("")
+    lines.append("For concept-first browsing, use [Libraries](../{}/index.md).".format(libraries_subdir))
+    lines.append("For metatable extensions, use [Metatables](../{}/index.md).".format(meta_subdir))
+    lines.append("For hook discovery, use [Hooks](../{}/index.md).".format(hooks_subdir))
+    lines.append("")
+    lines.append(f"Total documented functions: **{sum(len(file_doc.functions) for file_doc in file_docs)}**")
+    lines.append(f"Pages: **{len(file_docs)}**")
+    lines.append("")
+
+    for group_name in sorted(grouped):
+        lines.append(f"## {group_name.title()}")
+        lines.append("")
+
+        entries = sorted(
+            grouped[group_name],
+            key=lambda item: nav_sort_key(item.module or item.relative_path.with_suffix("").as_posix()),
+        )
+        for entry in entries:
+            link = entry.output_relative.relative_to(api_subdir).as_posix()
+            label = entry.module or entry.relative_path.with_suffix("").as_posix()
+            count = len(entry.functions)
+            suffix = "function" if count == 1 else "functions"
+            lines.append(f"- [`{label}`]({link}) ({count} documented {suffix})")
+        lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+class TitleCache:
+    """Markdown titles keyed by path, reused while the file's size and mtime are unchanged."""
+
+    def __init__(self, root: Path, cache_path: Optional[Path] = None) -> None:
+        self.root = root
+        self.cache_path = cache_path
+        self.entries: Dict[str, List[object]] = {}
+        self.used: Dict[str, List[object]] = {}
+
+    def load(self) -> None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            self.entries = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def title(self, path: Path) -> str:
+        key = _path_to_record(self.root, path)
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry is None or entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            entry = [stat.st_size, stat.st_mtime_ns, extract_markdown_title(path)]
+        self.used[key] = entry
+        return entry[2]
+
+    def save(self) -> None:
+        if self.cache_path is None or self.used == self.entries:
+            return
+        atomic_write_bytes(self.cache_path, json.dumps(self.used, separators=(",", ":")).encode("utf-8"))
+        self.entries = dict(self.used)
+
+
+def extract_markdown_title(path: Path) -> str:
+    content = read_text(path)
+    for line in content.splitlines():
+        match = HEADER_RE.match(line)
+        if match:
+            return match.group(1).strip()
+    return path.stem.replace("_", " ").replace("-", " ").strip().title()
+
+
+def yaml_quote(value: str) -> str:
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+def build_mkdocs_yaml(
+    docs_dir_relative: str,
+    site_name: str,
+    site_description: str,
+    root_pages: Sequence[Tuple[str, str]],
+    manuals_nav_lines: Sequence[str],
+    libraries_nav_lines: Sequence[str],
+    meta_nav_lines: Sequence[str],
+    hooks_nav_lines: Sequence[str],
+    logo_path: Optional[str] = None,
+    favicon_path: Optional[str] = None,
+    extra_css_path: Optional[str] = None,
+    extra_javascript_paths: Sequence[str] = (),
+    snippets_base_path: Optional[str] = None,
+) -> str:
+    lines: List[str] = []
+    lines.append(f"site_name: {yaml_quote(site_name)}")
+    lines.append(f"site_description: {yaml_quote(site_description)}")
+    lines.append("site_author: Riggs")
+    lines.append("site_url: https://parallax-framework.github.io/")
+    lines.append("repo_url: https://github.com/Parallax-Framework/parallax")
+    lines.append("repo_name: Parallax-Framework/parallax")
+    lines.append(f"copyright: \"&copy; 2025-{datetime.now().year}, Parallax Contributors\"")
+    lines.append(f"docs_dir: {normalize_nav_path(docs_dir_relative)}")
+    lines.append("use_directory_urls: true")
+    lines.append("theme:")
+    lines.append("  name: material")
+    lines.append("  language: en")
+    if logo_path:
+        lines.append(f"  logo: {normalize_nav_path(logo_path)}")
+    if favicon_path:
+        lines.append(f"  favicon: {normalize_nav_path(favicon_path)}")
+    lines.append("  font:")
+    lines.append("    text: IBM Plex Sans")
+    lines.append("    code: IBM Plex Mono")
+    lines.append("  features:")
+    lines.append("    - navigation.footer")
+    lines.append("    - navigation.instant")
+    lines.append("    - navigation.instant.progress")
+    lines.append("    - navigation.tracking")
+    lines.append("    - navigation.sections")
+    lines.append("    - navigation.expand")
+    lines.append("    - navigation.indexes")
+    lines.append("    - navigation.top")
+    lines.append("    - search.suggest")
+    lines.append("    - search.highlight")
+    lines.append("    - content.code.copy")
+    lines.append("  palette:")
+    lines.append("    - scheme: slate")
+    lines.append("      primary: deep purple")
+    lines.append("      accent: purple")
+    lines.append("plugins:")
+    lines.append("  - search")
+    if extra_css_path:
+        lines.append("extra_css:")
+        lines.append(f"  - {normalize_nav_path(extra_css_path)}")
+    if extra_javascript_paths:
+        lines.append("extra_javascript:")
+        for javascript_path in extra_javascript_paths:
+            lines.append(f"  - {normalize_nav_path(javascript_path)}")
+    lines.append("extra:")
+    lines.append("  social:")
+    lines.append("    - icon: fontawesome/brands/github")
+    lines.append("      link: https://github.com/Parallax-Framework")
+    lines.append("    - icon: fontawesome/brands/discord")
+    lines.append("      link: https://discord.gg/yekEvSszW3")
+    lines.append("markdown_extensions:")
+    lines.append("  - admonition")
+    lines.append("  - attr_list")
+    lines.append("  - def_list")
+    lines.append("  - footnotes")
+    lines.append("  - tables")
+    lines.append("  - fenced_code")
+    lines.append("  - pymdownx.details")
+    lines.append("  - pymdownx.superfences")
+    lines.append("  - pymdownx.inlinehilite")
+    if snippets_base_path:
+        lines.append("  - pymdownx.snippets:")
+        lines.append("      base_path:")
+        lines.append(f"        - {normalize_nav_path(snippets_base_path)}")
+        lines.append("      check_paths: true")
+    else:
+        lines.append("  - pymdownx.snippets")
+    lines.append("  - pymdownx.highlight:")
+    lines.append("      anchor_linenums: true")
+    lines.append("  - pymdownx.tabbed:")
+    lines.append("      alternate_style: true")
+    lines.append("  - toc:")
+    lines.append("      permalink: true")
+    lines.append("nav:")
+
+    for title, page in root_pages:
+        lines.append(f"  - {yaml_quote(title)}: {normalize_nav_path(page)}")
+
+    if manuals_nav_lines:
+        lines.append("  - Manuals:")
+        lines.extend(manuals_nav_lines)
+
+    if libraries_nav_lines:
+        lines.append("  - API:")
+        lines.extend(libraries_nav_lines)
+
+    if meta_nav_lines:
+        lines.append("  - Metatables:")
+        lines.extend(meta_nav_lines)
+
+    if hooks_nav_lines:
+        lines.append("  - Hooks:")
+        lines.extend(hooks_nav_lines)
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+class GeneratedManifest:
+    """Record of every file the generator produced, used to find stale outputs by set difference."""
+
+    def __init__(self, root: Path, docs_dir: Path) -> None:
+        self.root = root
+        self.docs_dir = docs_dir
+        self.path = docs_dir / MANIFEST_FILE
+        self.previous: Dict[str, str] = {}
+        self.current: Dict[str, str] = {}
+        # (size, mtime_ns) of the source behind each mirrored manual, so its digest is only recomputed on change.
+        self.previous_stamps: Dict[str, List[int]] = {}
+        self.stamps: Dict[str, List[int]] = {}
+        self.loaded = False
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if payload.get("version") != MANIFEST_VERSION:
+            return
+
+        self.previous = dict(payload.get("files", {}))
+        self.previous_stamps = dict(payload.get("stamps", {}))
+        self.loaded = True
+
+    def key(self, path: Path) -> str:
+        return _path_to_record(self.root, path)
+
+    def forget_under(self, directory: Path) -> None:
+        prefix = self.key(directory).rstrip("/") + "/"
+        for key in [key for key in self.current if key.startswith(prefix)]:
+            del self.current[key]
+            self.stamps.pop(key, None)
+
+    def resume(self) -> None:
+        """Start a partial pass from the loaded manifest: previous outputs stay unless dropped."""
+        self.current = dict(self.previous)
+        self.stamps = dict(self.previous_stamps)
+
+    def carry_over(self) -> None:
+        """Start a partial pass: outputs that are not rewritten keep their previous record."""
+        self.previous = dict(self.current)
+        self.previous_stamps = dict(self.stamps)
+
+    def record_mirror(self, output: Path, source: Path) -> None:
+        """Record a mirrored file under its source's digest, hashing the source only when its size or mtime moved."""
+        key = self.key(output)
+        source_stat = source.stat()
+        stamp = [source_stat.st_size, source_stat.st_mtime_ns]
+        digest = self.previous.get(key) if self.previous_stamps.get(key) == stamp else None
+        self.current[key] = digest or _file_digest(source)
+        self.stamps[key] = stamp
+
+    def stale_paths(self) -> List[Path]:
+        docs_root = self.docs_dir.resolve()
+        stale: List[Path] = []
+        for key in self.previous.keys() - self.current.keys():
+            path = _path_from_record(self.root, key)
+            try:
+                # Resolve the parent only: symlinked manuals point outside the docs dir.
+                (path.parent.resolve() / path.name).relative_to(docs_root)
+            except ValueError:
+                continue
+            stale.append(path)
+        return sorted(stale, key=lambda path: path.as_posix().casefold())
+
+    def remove_stale(self, dry_run: bool) -> None:
+        docs_root = self.docs_dir.resolve()
+        emptied: set[Path] = set()
+        for stale_file in self.stale_paths():
+            if not os.path.lexists(stale_file):
+                continue
+
+            if dry_run:
+                print(f"[dry-run] Would remove stale generated file: {stale_file}")
+                continue
+
+            stale_file.unlink()
+            print(f"Removed stale generated file: {stale_file}")
+            emptied.add(stale_file.parent)
+
+        # Only directories that just lost a file can have become empty.
+        for directory in sorted(emptied, key=lambda path: len(path.parts), reverse=True):
+            while directory.resolve() != docs_root:
+                try:
+                    directory.rmdir()
+                except OSError:
+                    break
+                directory = directory.parent
+
+    def save(self, dry_run: bool) -> None:
+        if dry_run:
+            return
+
+        payload = {
+            "version": MANIFEST_VERSION,
+            "files": dict(sorted(self.current.items())),
+            "stamps": {key: stamp for key, stamp in sorted(self.stamps.items()) if key in self.current},
+        }
+        data = (json.dumps(payload, indent=2) + "\n").encode("utf-8")
+        if self.path.exists() and self.path.read_bytes() == data:
+            return
+
+        atomic_write_bytes(self.path, data)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write through a temp file and os.replace so readers never see a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Dot-prefixed so a leftover from a killed run is ignored by MkDocs.
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(
+    path: Path,
+    content: str,
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+) -> bool:
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+
+    recorded: Optional[str] = None
+    if manifest is not None:
+        key = manifest.key(path)
+        recorded = manifest.previous.get(key)
+        manifest.current[key] = digest
+
+    try:
+        existing_size: Optional[int] = path.stat().st_size
+    except FileNotFoundError:
+        existing_size = None
+
+    if existing_size is not None and existing_size == len(data):
+        if recorded is not None:
+            # The previous run wrote exactly this content; no need to read it back.
+            if recorded == digest:
+                return False
+        elif path.read_bytes() == data:
+            return False
+
+    if dry_run:
+        return True
+
+    atomic_write_bytes(path, data)
+    return True
+
+
+def _file_digest(path: Path) -> str:
+    hasher = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(STREAM_BLOCK_SIZE), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def write_stream_if_changed(
+    path: Path,
+    chunks: Iterable[str],
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+) -> bool:
+    """write_if_changed for content produced piece by piece.
+
+    Chunks go straight to a temp file while being hashed, so the whole output is
+    never held in memory; the temp file only replaces path if the digest changed.
+    """
+    hasher = hashlib.sha256()
+    size = 0
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    handle = None
+    try:
+        if not dry_run:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(temp_path, "wb")
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            hasher.update(data)
+            size += len(data)
+            if handle is not None:
+                handle.write(data)
+        if handle is not None:
+            handle.close()
+            handle = None
+
+        digest = hasher.hexdigest()
+        recorded: Optional[str] = None
+        if manifest is not None:
+            key = manifest.key(path)
+            recorded = manifest.previous.get(key)
+            manifest.current[key] = digest
+
+        unchanged = False
+        if path.exists() and path.stat().st_size == size:
+            if recorded is not None:
+                unchanged = recorded == digest
+            else:
+                unchanged = _file_digest(path) == digest
+
+        if dry_run:
+            return not unchanged
+        if unchanged:
+            temp_path.unlink()
+            return False
+        os.replace(temp_path, path)
+        return True
+    except BaseException:
+        if handle is not None:
+            handle.close()
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def ensure_docs_scaffold(docs_dir: Path, dry_run: bool) -> None:
+    if not docs_dir.exists():
+        if dry_run:
+            print(f"[dry-run] Would create directory: {docs_dir}")
+        else:
+            docs_dir.mkdir(parents=True, exist_ok=True)
+            print(f"Created docs directory: {docs_dir}")
+
+    defaults: List[Tuple[Path, str]] = [
+        (docs_dir / "index.md", DEFAULT_INDEX_CONTENT),
+        (docs_dir / "assets" / "stylesheets" / "extra.css", DEFAULT_EXTRA_CSS_CONTENT),
+    ]
+
+    for path, content in defaults:
+        if path.exists():
+            continue
+
+        if dry_run:
+            print(f"[dry-run] Would create file: {path}")
+            continue
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+        print(f"Created file: {path}")
+
+
+def _reflink(source: Path, target: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    try:
+        with open(source, "rb") as source_handle, open(target, "wb") as target_handle:
+            fcntl.ioctl(target_handle.fileno(), FICLONE, source_handle.fileno())
+        return True
+    except OSError:
+        try:
+            target.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def mirror_file(source: Path, target: Path, mode: str, dry_run: bool) -> bool:
+    """Make target mirror source without decoding it; returns False when it already does.
+
+    Links that the filesystem refuses (cross-device, no permission) fall back to a copy.
+    Copies carry the source mtime, so an unchanged size and mtime skip the next run.
+    """
+    source_stat = source.stat()
+    link_text = os.path.relpath(source, target.parent)
+    try:
+        target_stat: Optional[os.stat_result] = target.lstat()
+    except FileNotFoundError:
+        target_stat = None
+
+    if target_stat is not None:
+        if target.is_symlink():
+            if mode == "symlink" and os.readlink(target) == link_text:
+                return False
+        elif os.path.samestat(source_stat, target_stat):
+            if mode == "hardlink":
+                return False
+        elif (
+            mode not in ("hardlink", "symlink")
+            and target_stat.st_size == source_stat.st_size
+            and target_stat.st_mtime_ns == source_stat.st_mtime_ns
+        ):
+            return False
+
+    if dry_run:
+        return True
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    # Dot-prefixed so a leftover from a killed run is ignored by MkDocs.
+    temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        linked = False
+        if mode in ("hardlink", "symlink"):
+            try:
+                if mode == "hardlink":
+                    os.link(source, temp_path)
+                else:
+                    os.symlink(link_text, temp_path)
+                linked = True
+            except OSError:
+                pass
+        if not linked:
+            if not (mode in ("auto", "reflink") and _reflink(source, temp_path)):
+                shutil.copyfile(source, temp_path)
+            os.utime(temp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def sync_manuals_to_docs(
+    manuals_source_dir: Path,
+    manuals_docs_dir: Path,
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+    mode: str = "auto",
+) -> None:
+    if not manuals_source_dir.exists():
+        print(f"Skipping manuals sync, missing source path: {manuals_source_dir}")
+        return
+
+    source_files = sorted(
+        manuals_source_dir.rglob("*.md"),
+        key=lambda path: path.relative_to(manuals_source_dir).as_posix().casefold(),
+    )
+
+    expected_outputs: set[str] = set()
+    for source_file in source_files:
+        relative = source_file.relative_to(manuals_source_dir)
+        output_file = manuals_docs_dir / relative
+        expected_outputs.add(str(output_file.resolve()))
+        if manifest is not None:
+            manifest.record_mirror(output_file, source_file)
+
+        if mirror_file(source_file, output_file, mode, dry_run):
+            status = "[dry-run] Would sync manual" if dry_run else "Synced manual"
+            print(f"{status}: {output_file}")
+
+    # With a previous manifest, stale manuals fall out of the manifest set difference.
+    if manifest is None or not manifest.loaded:
+        remove_stale_generated_markdown(manuals_docs_dir, expected_outputs, dry_run)
+
+
+def build_manuals_nav_lines(
+    manuals_docs_dir: Path,
+    manuals_subdir: str,
+    indent: int = 6,
+    titles: Optional[TitleCache] = None,
+) -> List[str]:
+    if not manuals_docs_dir.exists():
+        return []
+    title_for = titles.title if titles is not None else extract_markdown_title
+
+    def file_sort_key(path: Path) -> Tuple[int, str]:
+        name = path.name.casefold()
+        return (0 if name == "readme.md" else 1, name)
+
+    def render_dir(directory: Path, level_indent: int) -> List[str]:
+        lines: List[str] = []
+
+        markdown_files = sorted(
+            (path for path in directory.glob("*.md") if path.is_file()),
+            key=file_sort_key,
+        )
+        for markdown_file in markdown_files:
+            relative = markdown_file.relative_to(manuals_docs_dir).as_posix()
+            nav_path = normalize_nav_path(f"{manuals_subdir}/{relative}")
+            title = "Overview" if markdown_file.name.casefold() == "readme.md" else title_for(markdown_file)
+            lines.append(f'{" " * level_indent}- {yaml_quote(title)}: {nav_path}')
+
+        subdirectories = sorted(
+            (path for path in directory.iterdir() if path.is_dir()),
+            key=lambda path: path.name.casefold(),
+        )
+        for subdirectory in subdirectories:
+            nested_lines = render_dir(subdirectory, level_indent + 4)
+            if not nested_lines:
+                continue
+
+            lines.append(f'{" " * level_indent}- {yaml_quote(pretty_nav_label(subdirectory.name))}:')
+            lines.extend(nested_lines)
+
+        return lines
+
+    return render_dir(manuals_docs_dir, indent)
+
+
+def collect_root_pages(docs_dir: Path, titles: Optional[TitleCache] = None) -> List[Tuple[str, str]]:
+    title_for = titles.title if titles is not None else extract_markdown_title
+    pages: List[Tuple[str, str]] = []
+
+    index_page = docs_dir / "index.md"
+    readme = docs_dir / "README.md"
+
+    if index_page.exists():
+        pages.append(("Home", "index.md"))
+    elif readme.exists():
+        pages.append(("Home", "README.md"))
+
+    root_pages = [
+        path
+        for path in docs_dir.glob("*.md")
+        if path.name not in {"README.md", "index.md"} and path.name.lower() != "index.md"
+    ]
+    titled_pages = [(title_for(path), path.name) for path in root_pages]
+    for title, page in sorted(titled_pages, key=lambda item: nav_sort_key(item[0])):
+        pages.append((title, page))
+
+    return pages
+
+
+@dataclass
+class DocsLayout:
+    root: Path
+    source_dirs: List[Path]
+    docs_dir: Path
+    docs_dir_relative: str
+    api_subdir: str
+    libraries_subdir: str
+    meta_subdir: str
+    hooks_subdir: str
+    manuals_source_dir: Path
+    manuals_subdir: str
+    mkdocs_path: Path
+    site_name: str
+    site_description: str
+    symbol_index_path: Optional[Path] = None
+    symbol_db_path: Optional[Path] = None
+    hot_hooks_budget_path: Optional[Path] = None
+    net_catalog: bool = False
+    net_ids_path: Optional[Path] = None
+    hot_lint: bool = False
+    panel_audit: bool = False
+    search_index: bool = False
+    snippet_includes: bool = False
+    page_budget: int = DEFAULT_PAGE_BUDGET_KB * 1024
+    manuals_mode: str = "auto"
+    title_cache_path: Optional[Path] = None
+
+    @property
+    def manuals_docs_dir(self) -> Path:
+        return self.docs_dir / self.manuals_subdir
+
+    @property
+    def generated_sections(self) -> Dict[str, str]:
+        return {
+            "api": self.api_subdir,
+            "libraries": self.libraries_subdir,
+            "meta": self.meta_subdir,
+            "hooks": self.hooks_subdir,
+        }
+
+
+def layout_from_args(args: argparse.Namespace) -> DocsLayout:
+    root = args.root.resolve()
+    source_inputs = args.source or list(DEFAULT_SOURCE_DIRS)
+    return DocsLayout(
+        root=root,
+        source_dirs=[normalize_path(root, source) for source in source_inputs],
+        docs_dir=normalize_path(root, args.docs_dir),
+        docs_dir_relative=args.docs_dir,
+        api_subdir=args.api_subdir,
+        libraries_subdir=args.libraries_subdir,
+        meta_subdir=args.meta_subdir,
+        hooks_subdir=args.hooks_subdir,
+        manuals_source_dir=normalize_path(root, args.manuals_source),
+        manuals_subdir=args.manuals_subdir,
+        mkdocs_path=normalize_path(root, args.mkdocs_file),
+        site_name=args.site_name,
+        site_description=args.site_description,
+        symbol_index_path=normalize_path(root, args.symbol_index) if args.symbol_index else None,
+        symbol_db_path=normalize_path(root, args.symbol_db) if args.symbol_db else None,
+        hot_hooks_budget_path=normalize_path(root, args.hot_hooks_budget) if args.hot_hooks else None,
+        net_catalog=args.net_catalog,
+        net_ids_path=normalize_path(root, args.net_ids) if args.net_ids else None,
+        hot_lint=args.hot_lint,
+        panel_audit=args.panel_audit,
+        search_index=args.search_index,
+        snippet_includes=args.snippet_includes,
+        page_budget=max(0, args.page_budget) * 1024,
+        manuals_mode=args.manuals_mode,
+        title_cache_path=None if args.no_cache else normalize_path(root, args.cache_dir) / TITLE_CACHE_FILE,
+    )
+
+
+@dataclass
+class DocsModel:
+    scanned_files: List[ScannedFile]
+    file_docs: List[FileDoc]
+    api_file_docs: List[FileDoc]
+    source_to_api_page: Dict[str, Path]
+    library_index: Dict[str, List[Tuple[FileDoc, FunctionDoc]]]
+    library_pages: Dict[str, Path]
+    uncovered_file_docs: List[FileDoc]
+    meta_index: Dict[str, List[Tuple[FileDoc, FunctionDoc]]]
+    meta_pages: Dict[str, Path]
+    grouped_hooks: Dict[str, Dict[str, List[HookOccurrence]]]
+    function_blocks: FunctionBlocks = field(default_factory=FunctionBlocks)
+    # Over-budget page -> letter -> sub-page; the page itself becomes their index.
+    page_splits: Dict[Path, Dict[str, Path]] = field(default_factory=dict)
+    # function_symbol()/hook_symbol() -> the page that renders it, after splitting.
+    symbol_pages: Dict[str, Path] = field(default_factory=dict)
+    # build_hot_hooks_report() output, when --hot-hooks is on.
+    hot_hooks: Optional[Dict[str, object]] = None
+    # build_net_catalog() output, when --net-catalog is on.
+    net_catalog: Optional[Dict[str, object]] = None
+    # build_net_id_table() output, when --net-ids is on.
+    net_ids: Optional[Dict[str, object]] = None
+    # build_hot_lint_report() output, when --hot-lint is on.
+    hot_lint: Optional[Dict[str, object]] = None
+    # build_panel_audit() output, when --panel-audit is on.
+    panel_audit: Optional[Dict[str, object]] = None
+
+
+@dataclass
+class PagePlan:
+    """A generated page, the source files it is built from, and how to render it."""
+
+    section: str
+    output_relative: Path
+    # None marks aggregate pages (indexes) that summarize the whole model.
+    sources: Optional[frozenset]
+    render: Callable[[], str]
+
+
+def source_key(path: Path) -> str:
+    return str(path.resolve())
+
+
+def library_page_path(libraries_subdir: str, library_name: str) -> Path:
+    return Path(libraries_subdir).joinpath(*library_name.split(".")).with_suffix(".md")
+
+
+def build_docs_model(
+    scanned_files: Sequence[ScannedFile],
+    layout: DocsLayout,
+    profiler: Optional[RunProfiler] = None,
+) -> DocsModel:
+    profiler = profiler or RunProfiler()
+    with profiler.phase("index: api"):
+        file_docs: List[FileDoc] = [scanned.file_doc for scanned in scanned_files if scanned.file_doc]
+        file_docs.sort(key=lambda item: item.output_relative.as_posix())
+
+        api_file_docs = api_entries_without_meta(file_docs)
+        source_to_api_page = {
+            source_key(file_doc.source_path): file_doc.output_relative for file_doc in api_file_docs
+        }
+
+    with profiler.phase("index: libraries"):
+        library_index = build_ax_library_index(api_file_docs)
+        library_pages = {
+            library_name: library_page_path(layout.libraries_subdir, library_name) for library_name in library_index
+        }
+        uncovered_file_docs = _uncovered_file_docs(api_file_docs, library_index)
+
+    with profiler.phase("index: meta"):
+        meta_index = build_meta_index(file_docs)
+        meta_pages = {meta_type: Path(layout.meta_subdir) / f"{meta_type}.md" for meta_type in meta_index}
+
+    with profiler.phase("index: hooks"):
+        grouped_hooks = group_hook_occurrences(collect_hook_occurrences(scanned_files))
+
+    model = DocsModel(
+        scanned_files=list(scanned_files),
+        file_docs=file_docs,
+        api_file_docs=api_file_docs,
+        source_to_api_page=source_to_api_page,
+        library_index=library_index,
+        library_pages=library_pages,
+        uncovered_file_docs=uncovered_file_docs,
+        meta_index=meta_index,
+        meta_pages=meta_pages,
+        grouped_hooks=grouped_hooks,
+        # Library functions also appear on their file's API page; every other block is rendered once.
+        function_blocks=FunctionBlocks(
+            layout.snippet_includes,
+            shared={id(function_doc) for entries in library_index.values() for _, function_doc in entries},
+        ),
+    )
+    with profiler.phase("index: pages"):
+        assign_symbol_pages(model, layout)
+    if layout.hot_hooks_budget_path is not None:
+        with profiler.phase("index: hot hooks"):
+            model.hot_hooks = build_hot_hooks_report(
+                layout.root, grouped_hooks, load_hot_hook_budget(layout.hot_hooks_budget_path)
+            )
+    if layout.net_catalog:
+        with profiler.phase("index: net catalog"):
+            model.net_catalog = build_net_catalog(layout.root, scanned_files)
+    if layout.net_ids_path is not None:
+        model.net_ids = build_net_id_table(scanned_files)
+    if layout.hot_lint:
+        with profiler.phase("index: hot lint"):
+            model.hot_lint = build_hot_lint_report(layout.root, scanned_files)
+    if layout.panel_audit:
+        with profiler.phase("index: panel audit"):
+            model.panel_audit = build_panel_audit(layout.root, scanned_files)
+    return model
+
+
+def assign_symbol_pages(model: DocsModel, layout: DocsLayout) -> None:
+    """Split over-budget library and hook pages by letter and record where every symbol lands."""
+    root = layout.root
+    blocks = model.function_blocks
+    for library_name, entries in model.library_index.items():
+        page = model.library_pages[library_name]
+        sized = [
+            (
+                function_doc.name,
+                len(blocks.include(file_doc, function_doc)) + len(file_doc.source_path.relative_to(root).as_posix()) + 32,
+            )
+            for file_doc, function_doc in entries
+        ]
+        parts = split_by_letter(page, sized, layout.page_budget)
+        if parts:
+            model.page_splits[page] = parts
+        for _, function_doc in entries:
+            model.symbol_pages[function_symbol(function_doc)] = parts[page_letter(function_doc.name)] if parts else page
+
+    for kind in HOOK_KIND_ORDER:
+        page = Path(layout.hooks_subdir) / f"{kind}.md"
+        # Estimated from the occurrence lines each section lists; links add roughly one more path.
+        sized = [
+            (
+                hook_name,
+                len(hook_name) * 2
+                + sum(
+                    2 * len(item.source_path.relative_to(root).as_posix()) + 24
+                    for item in hook_section_occurrences(kind, hook_name, model.grouped_hooks)
+                ),
+            )
+            for hook_name in model.grouped_hooks[kind]
+        ]
+        parts = split_by_letter(page, sized, layout.page_budget)
+        if parts:
+            model.page_splits[page] = parts
+        for hook_name in model.grouped_hooks[kind]:
+            model.symbol_pages[hook_symbol(kind, hook_name)] = parts[page_letter(hook_name)] if parts else page
+
+
+def _entry_sources(entries: Sequence[Tuple[FileDoc, FunctionDoc]]) -> frozenset:
+    return frozenset(source_key(file_doc.source_path) for file_doc, _ in entries)
+
+
+def _hook_page_sources(model: DocsModel, kind: str, letter: Optional[str] = None) -> frozenset:
+    return frozenset(
+        source_key(item.source_path)
+        for hook_name in model.grouped_hooks[kind]
+        if letter is None or page_letter(hook_name) == letter
+        for item in hook_section_occurrences(kind, hook_name, model.grouped_hooks)
+    )
+
+
+def plan_pages(model: DocsModel, layout: DocsLayout) -> List[PagePlan]:
+    root = layout.root
+    plans: List[PagePlan] = []
+    blocks = model.function_blocks
+
+    for file_doc in model.api_file_docs:
+        plans.append(
+            PagePlan(
+                section="api",
+                output_relative=file_doc.output_relative,
+                sources=frozenset({source_key(file_doc.source_path)}),
+                render=lambda file_doc=file_doc: render_file_markdown(file_doc, root, blocks),
+            )
+        )
+
+    for library_name, entries in model.library_index.items():
+        output_relative = model.library_pages[library_name]
+        parts = model.page_splits.get(output_relative)
+        plans.append(
+            PagePlan(
+                section="libraries",
+                output_relative=output_relative,
+                sources=_entry_sources(entries),
+                render=lambda library_name=library_name, output_relative=output_relative, entries=entries, parts=parts: render_library_page(
+                    root, library_name, output_relative, entries, blocks, parts
+                ),
+            )
+        )
+        for letter, part in (parts or {}).items():
+            plans.append(
+                PagePlan(
+                    section="libraries",
+                    output_relative=part,
+                    sources=_entry_sources([entry for entry in entries if page_letter(entry[1].name) == letter]),
+                    render=lambda library_name=library_name, part=part, entries=entries, parts=parts, letter=letter: render_library_page(
+                        root, library_name, part, entries, blocks, parts, letter
+                    ),
+                )
+            )
+
+    plans.append(
+        PagePlan(
+            section="libraries",
+            output_relative=Path(layout.libraries_subdir) / "index.md",
+            sources=None,
+            render=lambda: render_libraries_index(
+                model.library_index, model.library_pages, layout.libraries_subdir, model.uncovered_file_docs
+            ),
+        )
+    )
+
+    for meta_type, entries in model.meta_index.items():
+        output_relative = model.meta_pages[meta_type]
+        plans.append(
+            PagePlan(
+                section="meta",
+                output_relative=output_relative,
+                sources=_entry_sources(entries),
+                render=lambda meta_type=meta_type, output_relative=output_relative, entries=entries: render_meta_page(
+                    root, meta_type, output_relative, entries, blocks
+                ),
+            )
+        )
+
+    plans.append(
+        PagePlan(
+            section="meta",
+            output_relative=Path(layout.meta_subdir) / "index.md",
+            sources=None,
+            render=lambda: render_meta_index(model.meta_index, model.meta_pages, layout.meta_subdir),
+        )
+    )
+
+    plans.append(
+        PagePlan(
+            section="hooks",
+            output_relative=Path(layout.hooks_subdir) / "index.md",
+            sources=None,
+            render=lambda: render_hooks_overview(model.grouped_hooks, layout.hooks_subdir),
+        )
+    )
+
+    for kind in HOOK_KIND_ORDER:
+        output_relative = Path(layout.hooks_subdir) / f"{kind}.md"
+        parts = model.page_splits.get(output_relative)
+        for letter, page in [(None, output_relative), *(parts or {}).items()]:
+            plans.append(
+                PagePlan(
+                    section="hooks",
+                    output_relative=page,
+                    sources=_hook_page_sources(model, kind, letter),
+                    render=lambda kind=kind, parts=parts, letter=letter: render_hook_kind_page(
+                        root=root,
+                        kind=kind,
+                        grouped_by_name=model.grouped_hooks[kind],
+                        source_to_api_page=model.source_to_api_page,
+                        hooks_subdir=layout.hooks_subdir,
+                        all_grouped_hooks=model.grouped_hooks,
+                        symbol_pages=model.symbol_pages,
+                        parts=parts,
+                        letter=letter,
+                    ),
+                )
+            )
+
+    if model.hot_hooks is not None:
+        plans.append(
+            PagePlan(
+                section="hooks",
+                output_relative=Path(layout.hooks_subdir) / HOT_HOOKS_PAGE,
+                sources=None,
+                render=lambda: render_hot_hooks_page(
+                    model.hot_hooks, layout.hooks_subdir, model.source_to_api_page, model.symbol_pages, root
+                ),
+            )
+        )
+
+    if model.net_catalog is not None:
+        plans.append(
+            PagePlan(
+                section="hooks",
+                output_relative=Path(layout.hooks_subdir) / NET_CATALOG_PAGE,
+                sources=None,
+                render=lambda: render_net_catalog_page(
+                    model.net_catalog, layout.hooks_subdir, model.source_to_api_page, root
+                ),
+            )
+        )
+
+    if model.net_ids is not None:
+        plans.append(
+            PagePlan(
+                section="hooks",
+                output_relative=Path(layout.hooks_subdir) / NET_IDS_PAGE,
+                sources=None,
+                render=lambda: render_net_id_page(model.net_ids, _path_to_record(root, layout.net_ids_path)),
+            )
+        )
+
+    if model.hot_lint is not None:
+        plans.append(
+            PagePlan(
+                section="hooks",
+                output_relative=Path(layout.hooks_subdir) / HOT_LINT_PAGE,
+                sources=None,
+                render=lambda: render_hot_lint_page(model.hot_lint, layout.hooks_subdir, model.source_to_api_page, root),
+            )
+        )
+
+    if model.panel_audit is not None:
+        plans.append(
+            PagePlan(
+                section="api",
+                output_relative=Path(layout.api_subdir) / PANEL_AUDIT_PAGE,
+                sources=None,
+                render=lambda: render_panel_audit_page(
+                    model.panel_audit, layout.api_subdir, model.source_to_api_page, root
+                ),
+            )
+        )
+
+    plans.append(
+        PagePlan(
+            section="api",
+            output_relative=Path(layout.api_subdir) / "index.md",
+            sources=None,
+            render=lambda: render_api_index(
+                file_docs=model.api_file_docs,
+                api_subdir=layout.api_subdir,
+                libraries_subdir=layout.libraries_subdir,
+                meta_subdir=layout.meta_subdir,
+                hooks_subdir=layout.hooks_subdir,
+            ),
+        )
+    )
+
+    return plans
+
+
+def build_dependency_map(plans: Sequence[PagePlan]) -> Dict[str, set[Path]]:
+    """Map each source file to the generated pages it feeds."""
+    dependencies: Dict[str, set[Path]] = defaultdict(set)
+    for plan in plans:
+        if plan.sources is None:
+            continue
+        for source in plan.sources:
+            dependencies[source].add(plan.output_relative)
+    return dependencies
+
+
+def affected_pages(
+    previous_plans: Sequence[PagePlan],
+    plans: Sequence[PagePlan],
+    changed_sources: set[str],
+) -> set[Path]:
+    previous_dependencies = build_dependency_map(previous_plans)
+    dependencies = build_dependency_map(plans)
+    affected: set[Path] = set()
+    for source in changed_sources:
+        affected.update(previous_dependencies.get(source, ()))
+        affected.update(dependencies.get(source, ()))
+
+    previous_outputs = {plan.output_relative for plan in previous_plans}
+    for plan in plans:
+        if plan.sources is None or plan.output_relative not in previous_outputs:
+            affected.add(plan.output_relative)
+    return affected
+
+
+def write_pages(
+    plans: Sequence[PagePlan],
+    layout: DocsLayout,
+    dry_run: bool,
+    only: Optional[set[Path]] = None,
+    manifest: Optional[GeneratedManifest] = None,
+    profiler: Optional[RunProfiler] = None,
+) -> Dict[str, int]:
+    profiler = profiler or RunProfiler()
+    changed: Dict[str, int] = defaultdict(int)
+    for plan in plans:
+        if only is not None and plan.output_relative not in only:
+            continue
+
+        output_path = layout.docs_dir / plan.output_relative
+        with profiler.phase(f"render: {plan.section}"):
+            content = plan.render()
+            if layout.search_index:
+                content = SEARCH_EXCLUDE_FRONT_MATTER + content
+        if profiler.enabled:
+            profiler.record_page(output_path, len(content.encode("utf-8")))
+        with profiler.phase("write"):
+            written = write_if_changed(output_path, content, dry_run, manifest)
+        if written:
+            changed[plan.section] += 1
+            status = "[dry-run] Would write" if dry_run else "Wrote"
+            print(f"{status}: {output_path.relative_to(layout.root)}")
+    return changed
+
+
+def remove_stale_outputs(
+    plans: Sequence[PagePlan],
+    layout: DocsLayout,
+    manifest: GeneratedManifest,
+    dry_run: bool,
+) -> None:
+    if manifest.loaded:
+        manifest.remove_stale(dry_run)
+        return
 
-    if manuals_nav_lines:
-        lines.append("  - Manuals:")
-        lines.extend(manuals_nav_lines)
+    # First run without a manifest: fall back to walking the generated sections.
+    expected: Dict[str, set[str]] = defaultdict(set)
+    for plan in plans:
+        expected[plan.section].add(str((layout.docs_dir / plan.output_relative).resolve()))
 
-    if libraries_nav_lines:
-        lines.append("  - API:")
-        lines.extend(libraries_nav_lines)
+    for section in ("libraries", "meta", "hooks"):
+        section_dir = layout.docs_dir / layout.generated_sections[section]
+        remove_stale_generated_markdown(section_dir, expected[section], dry_run)
 
-    if meta_nav_lines:
-        lines.append("  - Metatables:")
-        lines.extend(meta_nav_lines)
 
-    if hooks_nav_lines:
-        lines.append("  - Hooks:")
-        lines.extend(hooks_nav_lines)
+def render_mkdocs_config(model: DocsModel, layout: DocsLayout, titles: Optional[TitleCache] = None) -> str:
+    docs_dir = layout.docs_dir
+    logo_relative = "assets/images/parallax-logo.png"
+    favicon_relative = "assets/images/favicon.png"
+    extra_css_relative = "assets/stylesheets/extra.css"
 
-    return "\n".join(lines).rstrip() + "\n"
+    return build_mkdocs_yaml(
+        docs_dir_relative=layout.docs_dir_relative,
+        site_name=layout.site_name,
+        site_description=layout.site_description,
+        root_pages=collect_root_pages(docs_dir, titles),
+        manuals_nav_lines=build_manuals_nav_lines(layout.manuals_docs_dir, layout.manuals_subdir, titles=titles),
+        libraries_nav_lines=build_libraries_nav_lines(
+            model.library_pages,
+            layout.libraries_subdir,
+            model.uncovered_file_docs,
+            layout.api_subdir,
+            page_splits=model.page_splits,
+            panel_audit=model.panel_audit is not None,
+        ),
+        meta_nav_lines=build_meta_nav_lines(model.meta_pages, layout.meta_subdir),
+        hooks_nav_lines=build_hooks_nav_lines(
+            layout.hooks_subdir,
+            page_splits=model.page_splits,
+            hot_hooks=model.hot_hooks is not None,
+            net_catalog=model.net_catalog is not None,
+            net_ids=model.net_ids is not None,
+            hot_lint=model.hot_lint is not None,
+        ),
+        logo_path=logo_relative if (docs_dir / logo_relative).exists() else None,
+        favicon_path=favicon_relative if (docs_dir / favicon_relative).exists() else None,
+        extra_css_path=extra_css_relative if (docs_dir / extra_css_relative).exists() else None,
+        extra_javascript_paths=[
+            path
+            for path, enabled in ((SEARCH_LOADER_PATH, layout.search_index), (TABLE_SORT_PATH, layout.panel_audit))
+            if enabled
+        ],
+        snippets_base_path=layout.docs_dir_relative if layout.snippet_includes else None,
+    )
 
 
-def write_if_changed(path: Path, content: str, dry_run: bool) -> bool:
-    existing = None
-    if path.exists():
-        existing = read_text(path)
-    if existing == content:
-        return False
-    if dry_run:
+def write_mkdocs_config(
+    model: DocsModel,
+    layout: DocsLayout,
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+    profiler: Optional[RunProfiler] = None,
+) -> bool:
+    profiler = profiler or RunProfiler()
+    titles = TitleCache(layout.root, layout.title_cache_path)
+    titles.load()
+    with profiler.phase("render: mkdocs.yml"):
+        content = render_mkdocs_config(model, layout, titles)
+    if not dry_run:
+        titles.save()
+    with profiler.phase("write"):
+        written = write_if_changed(layout.mkdocs_path, content, dry_run, manifest)
+    if written:
+        status = "[dry-run] Would write" if dry_run else "Wrote"
+        print(f"{status}: {layout.mkdocs_path.relative_to(layout.root)}")
         return True
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
-    return True
+    return False
 
 
-def ensure_docs_scaffold(docs_dir: Path, dry_run: bool) -> None:
-    if not docs_dir.exists():
-        if dry_run:
-            print(f"[dry-run] Would create directory: {docs_dir}")
+def _page_link(page: Optional[Path]) -> Optional[str]:
+    return page.as_posix() if page is not None else None
+
+
+def iter_symbol_records(model: DocsModel, layout: DocsLayout) -> Iterator[Dict[str, object]]:
+    """Yield the symbol index: a header, then functions, libraries, meta types and hooks."""
+    yield {
+        "kind": "index",
+        "version": SYMBOL_INDEX_VERSION,
+        "files": len(model.file_docs),
+        "functions": sum(len(file_doc.functions) for file_doc in model.file_docs),
+        "libraries": len(model.library_index),
+        "meta_types": len(model.meta_index),
+        "hooks": sum(len(occurrences) for by_name in model.grouped_hooks.values() for occurrences in by_name.values()),
+    }
+
+    for file_doc in model.file_docs:
+        source = _path_to_record(layout.root, file_doc.source_path)
+        api_page = model.source_to_api_page.get(source_key(file_doc.source_path))
+        for function_doc in file_doc.functions:
+            library = None if function_doc.meta_type else extract_ax_library_name(function_doc.name)
+            if function_doc.meta_type:
+                page = model.meta_pages.get(function_doc.meta_type)
+            else:
+                page = api_page
+            yield {
+                "kind": "function",
+                "name": function_doc.name,
+                "signature": function_doc.signature,
+                "realm": function_doc.realm,
+                "description": function_doc.description,
+                "params": [
+                    {"name": param.name, "type": param.type_name, "description": param.description}
+                    for param in function_doc.params
+                ],
+                "returns": [
+                    {"type": item.type_name, "description": item.description} for item in function_doc.returns
+                ],
+                "usage": list(function_doc.usage),
+                "meta_type": function_doc.meta_type,
+                "library": library if library in model.library_index else None,
+                "source": source,
+                "line": function_doc.line,
+                "page": _page_link(page),
+                "anchor": anchor_for_function(function_doc),
+            }
+
+    for library_name, entries in model.library_index.items():
+        yield {
+            "kind": "library",
+            "name": library_name,
+            "page": _page_link(model.library_pages.get(library_name)),
+            "functions": [function_doc.name for _, function_doc in entries],
+        }
+
+    for meta_type, entries in model.meta_index.items():
+        yield {
+            "kind": "meta",
+            "name": meta_type,
+            "page": _page_link(model.meta_pages.get(meta_type)),
+            "functions": [function_doc.name for _, function_doc in entries],
+        }
+
+    for hook_kind in HOOK_KIND_ORDER:
+        for hook_name, occurrences in model.grouped_hooks.get(hook_kind, {}).items():
+            for occurrence in occurrences:
+                yield {
+                    "kind": "hook",
+                    "hook_kind": hook_kind,
+                    "name": hook_name,
+                    "source": _path_to_record(layout.root, occurrence.source_path),
+                    "line": occurrence.line,
+                    "page": _page_link(model.symbol_pages.get(hook_symbol(hook_kind, hook_name))),
+                    "anchor": slugify(hook_name),
+                }
+
+
+def iter_symbol_index_chunks(model: DocsModel, layout: DocsLayout, json_array: bool = False) -> Iterator[str]:
+    """Serialize iter_symbol_records one record per line, as NDJSON or as a JSON array."""
+    separator = ""
+    if json_array:
+        yield "["
+        separator = "\n"
+    for record in iter_symbol_records(model, layout):
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        if json_array:
+            yield separator + line
+            separator = ",\n"
         else:
-            docs_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Created docs directory: {docs_dir}")
+            yield line + "\n"
+    if json_array:
+        yield "\n]\n"
 
-    defaults: List[Tuple[Path, str]] = [
-        (docs_dir / "index.md", DEFAULT_INDEX_CONTENT),
-        (docs_dir / "assets" / "stylesheets" / "extra.css", DEFAULT_EXTRA_CSS_CONTENT),
-    ]
 
-    for path, content in defaults:
-        if path.exists():
-            continue
+def site_url(page: Path) -> str:
+    """Map a docs-relative Markdown path to its URL under use_directory_urls."""
+    posix = page.with_suffix("").as_posix()
+    if posix == "index":
+        return ""
+    if posix.endswith("/index"):
+        return posix[: -len("index")]
+    return posix + "/"
 
-        if dry_run:
-            print(f"[dry-run] Would create file: {path}")
+
+def _search_summary(description: str) -> str:
+    summary = description.strip().split("\n", 1)[0]
+    if len(summary) > SEARCH_SUMMARY_CHARS:
+        summary = summary[: SEARCH_SUMMARY_CHARS - 1].rstrip() + "\u2026"
+    return summary
+
+
+def _search_key(name: str, length: int) -> str:
+    short = re.split(r"[.:]", name)[-1].lower()
+    key = "".join(char if char.isascii() and char.isalnum() else "_" for char in short[:length])
+    return key.ljust(length, "_")
+
+
+def build_search_entries(model: DocsModel, layout: DocsLayout) -> List[List[str]]:
+    """Return [name, kind, signature, realm, summary, url] rows for functions, meta methods and hooks."""
+    entries: List[List[str]] = []
+    for file_doc in model.file_docs:
+        api_page = model.source_to_api_page.get(source_key(file_doc.source_path))
+        for function_doc in file_doc.functions:
+            page = model.meta_pages.get(function_doc.meta_type) if function_doc.meta_type else api_page
+            if page is None:
+                continue
+            entries.append(
+                [
+                    function_doc.name,
+                    "m" if function_doc.meta_type else "f",
+                    function_doc.signature,
+                    function_doc.realm or "",
+                    _search_summary(function_doc.description),
+                    f"{site_url(page)}#{anchor_for_function(function_doc)}",
+                ]
+            )
+
+    grouped = model.grouped_hooks
+    seen: set[str] = set()
+    for kind in HOOK_KIND_ORDER:
+        for hook_name in grouped.get(kind, {}):
+            if hook_name in seen:
+                continue
+            seen.add(hook_name)
+            counts = ", ".join(
+                f"{len(grouped[other][hook_name])} {HOOK_KIND_TITLE[other]}"
+                for other in HOOK_KIND_ORDER
+                if hook_name in grouped.get(other, {})
+            )
+            page = model.symbol_pages.get(hook_symbol(kind, hook_name), Path(layout.hooks_subdir) / f"{kind}.md")
+            entries.append([hook_name, "h", hook_name, "", counts, f"{site_url(page)}#{slugify(hook_name)}"])
+    return entries
+
+
+def shard_search_entries(entries: Sequence[List[str]]) -> Tuple[Dict[str, List[List[str]]], List[str]]:
+    """Group entries by the first letter of their short name, splitting oversized letters by two."""
+    by_letter: Dict[str, List[List[str]]] = defaultdict(list)
+    for entry in entries:
+        by_letter[_search_key(entry[0], 1)].append(entry)
+
+    shards: Dict[str, List[List[str]]] = {}
+    split: List[str] = []
+    for letter, letter_entries in sorted(by_letter.items()):
+        if len(letter_entries) <= SEARCH_SHARD_MAX_ENTRIES:
+            shards[letter] = letter_entries
             continue
+        split.append(letter)
+        for entry in letter_entries:
+            shards.setdefault(_search_key(entry[0], 2), []).append(entry)
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
-        print(f"Created file: {path}")
+    for shard in shards.values():
+        shard.sort(key=lambda entry: (re.split(r"[.:]", entry[0])[-1].lower(), entry[0], entry[5]))
+    return dict(sorted(shards.items())), split
 
 
-def sync_manuals_to_docs(manuals_source_dir: Path, manuals_docs_dir: Path, dry_run: bool) -> None:
-    if not manuals_source_dir.exists():
-        print(f"Skipping manuals sync, missing source path: {manuals_source_dir}")
-        return
+def write_search_index(
+    model: DocsModel,
+    layout: DocsLayout,
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+) -> int:
+    shards, split = shard_search_entries(build_search_entries(model, layout))
+    index_dir = layout.docs_dir / SEARCH_INDEX_SUBDIR
+    outputs: List[Tuple[Path, str]] = [
+        (layout.docs_dir / SEARCH_LOADER_PATH, SYMBOL_SEARCH_JS),
+        (
+            index_dir / "manifest.json",
+            json.dumps(
+                {
+                    "version": SEARCH_INDEX_VERSION,
+                    "total": sum(len(shard) for shard in shards.values()),
+                    "split": split,
+                    "shards": {key: len(shard) for key, shard in shards.items()},
+                },
+                separators=(",", ":"),
+            )
+            + "\n",
+        ),
+    ]
+    for key, shard in shards.items():
+        outputs.append((index_dir / f"{key}.json", json.dumps(shard, ensure_ascii=False, separators=(",", ":")) + "\n"))
 
-    source_files = sorted(
-        manuals_source_dir.rglob("*.md"),
-        key=lambda path: path.relative_to(manuals_source_dir).as_posix().casefold(),
-    )
+    changed = 0
+    for path, content in outputs:
+        if write_if_changed(path, content, dry_run, manifest):
+            changed += 1
+    return changed
 
-    expected_outputs: set[str] = set()
-    for source_file in source_files:
-        relative = source_file.relative_to(manuals_source_dir)
-        output_file = manuals_docs_dir / relative
-        expected_outputs.add(str(output_file.resolve()))
 
-        content = read_text(source_file)
-        if write_if_changed(output_file, content, dry_run):
-            status = "[dry-run] Would sync manual" if dry_run else "Synced manual"
-            print(f"{status}: {output_file}")
+def open_symbol_db(path: Path) -> Tuple[sqlite3.Connection, bool]:
+    """Open (creating if needed) the symbol database; returns the connection and whether FTS5 is available."""
+    connection = sqlite3.connect(str(path))
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.executescript(SYMBOL_DB_SCHEMA)
+    try:
+        connection.executescript(SYMBOL_DB_FTS_SCHEMA)
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5; `query search` falls back to LIKE.
+        return connection, False
+    return connection, True
+
+
+def _symbol_db_stamp(layout: DocsLayout) -> str:
+    # Stored rows depend on the parser and on where sources and API pages live.
+    root = layout.root
+    context = [[_path_to_record(root, path) for path in layout.source_dirs], layout.api_subdir]
+    return f"{SYMBOL_DB_VERSION}:{generator_digest()}:{json.dumps(context)}"
+
 
-    if manuals_docs_dir.exists():
-        stale_files = sorted(
+def _insert_symbol_file(
+    connection: sqlite3.Connection,
+    root: Path,
+    scanned: ScannedFile,
+    stat: os.stat_result,
+    digest: str,
+) -> None:
+    file_doc = scanned.file_doc
+    cursor = connection.execute(
+        "INSERT INTO files (path, size, mtime_ns, content_hash, source_group, module, section, summary, api_page)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            _path_to_record(root, scanned.source_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            digest,
+            file_doc.source_group if file_doc else None,
+            file_doc.module if file_doc else None,
+            file_doc.section if file_doc else None,
+            file_doc.summary if file_doc else None,
+            file_doc.output_relative.as_posix() if file_doc else None,
+        ),
+    )
+    file_id = cursor.lastrowid
+
+    for function_doc in file_doc.functions if file_doc else ():
+        cursor = connection.execute(
+            "INSERT INTO functions (file_id, name, signature, line, realm, description, usage, meta_type, anchor)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (
-                path
-                for path in manuals_docs_dir.rglob("*.md")
-                if str(path.resolve()) not in expected_outputs
+                file_id,
+                function_doc.name,
+                function_doc.signature,
+                function_doc.line,
+                function_doc.realm,
+                function_doc.description,
+                json.dumps(list(function_doc.usage)),
+                function_doc.meta_type,
+                anchor_for_function(function_doc),
             ),
-            key=lambda path: path.as_posix().casefold(),
         )
+        function_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO params (function_id, position, name, type_name, description) VALUES (?, ?, ?, ?, ?)",
+            [
+                (function_id, position, param.name, param.type_name, param.description)
+                for position, param in enumerate(function_doc.params)
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO returns (function_id, position, type_name, description) VALUES (?, ?, ?, ?)",
+            [
+                (function_id, position, return_doc.type_name, return_doc.description)
+                for position, return_doc in enumerate(function_doc.returns)
+            ],
+        )
+        # Same membership rules as build_ax_library_index and build_meta_index.
+        if function_doc.meta_type:
+            if function_doc.meta_type in META_TYPES:
+                connection.execute(
+                    "INSERT INTO meta_members (meta_type, function_id) VALUES (?, ?)", (function_doc.meta_type, function_id)
+                )
+        else:
+            library_name = extract_ax_library_name(function_doc.name)
+            if library_name:
+                connection.execute(
+                    "INSERT INTO library_members (library, function_id) VALUES (?, ?)", (library_name, function_id)
+                )
 
-        for stale_file in stale_files:
-            if dry_run:
-                print(f"[dry-run] Would remove stale manual: {stale_file}")
-                continue
+    connection.executemany(
+        "INSERT INTO hooks (file_id, kind, hook_name, line) VALUES (?, ?, ?, ?)",
+        [(file_id, hook.kind, hook.hook_name, hook.line) for hook in scanned.hooks],
+    )
 
-            stale_file.unlink()
-            print(f"Removed stale manual: {stale_file}")
 
-    if not dry_run and manuals_docs_dir.exists():
-        for directory in sorted(
-            (path for path in manuals_docs_dir.rglob("*") if path.is_dir()),
-            key=lambda path: len(path.parts),
-            reverse=True,
-        ):
-            try:
-                directory.rmdir()
-            except OSError:
-                pass
+def write_symbol_db(model: DocsModel, layout: DocsLayout, dry_run: bool) -> Tuple[int, int]:
+    """Bring the symbol database in line with the model; returns (files upserted, files removed).
 
+    Every row is derived from a single source file, so a file whose size and mtime, or
+    failing that its content hash, still match its stored row is left alone.
+    """
+    path = layout.symbol_db_path
+    stamp = _symbol_db_stamp(layout)
+    if not dry_run:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    # A dry run works on a throwaway copy of the tables: a new in-memory database, or a rolled-back transaction.
+    connection, _ = open_symbol_db(path if path.exists() or not dry_run else Path(":memory:"))
+    try:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'stamp'").fetchone()
+        if row is None or row[0] != stamp:
+            connection.execute("DELETE FROM files")
+            connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('stamp', ?)", (stamp,))
+
+        stored = {
+            file_path: (file_id, size, mtime_ns, content_hash)
+            for file_id, file_path, size, mtime_ns, content_hash in connection.execute(
+                "SELECT id, path, size, mtime_ns, content_hash FROM files"
+            )
+        }
+        upserted = 0
+        seen: set[str] = set()
+        for scanned in model.scanned_files:
+            key = _path_to_record(layout.root, scanned.source_path)
+            seen.add(key)
+            stat = scanned.source_path.stat()
+            previous = stored.get(key)
+            if previous is not None and previous[1] == stat.st_size and previous[2] == stat.st_mtime_ns:
+                continue
 
-def build_manuals_nav_lines(manuals_docs_dir: Path, manuals_subdir: str, indent: int = 6) -> List[str]:
-    if not manuals_docs_dir.exists():
-        return []
+            digest = hashlib.sha256(scanned.source_path.read_bytes()).hexdigest()
+            if previous is not None:
+                if previous[3] == digest:
+                    connection.execute(
+                        "UPDATE files SET size = ?, mtime_ns = ? WHERE id = ?", (stat.st_size, stat.st_mtime_ns, previous[0])
+                    )
+                    continue
+                connection.execute("DELETE FROM files WHERE id = ?", (previous[0],))
+            _insert_symbol_file(connection, layout.root, scanned, stat, digest)
+            upserted += 1
 
-    def file_sort_key(path: Path) -> Tuple[int, str]:
-        name = path.name.casefold()
-        return (0 if name == "readme.md" else 1, name)
+        removed = [file_id for key, (file_id, _, _, _) in stored.items() if key not in seen]
+        connection.executemany("DELETE FROM files WHERE id = ?", [(file_id,) for file_id in removed])
+        if dry_run:
+            connection.rollback()
+        else:
+            connection.commit()
+        return upserted, len(removed)
+    finally:
+        connection.close()
 
-    def render_dir(directory: Path, level_indent: int) -> List[str]:
-        lines: List[str] = []
 
-        markdown_files = sorted(
-            (path for path in directory.glob("*.md") if path.is_file()),
-            key=file_sort_key,
+def _query_rows(connection: sqlite3.Connection, args: argparse.Namespace, fts: bool) -> Tuple[List[str], List[Tuple]]:
+    if args.query == "hook":
+        sql = (
+            "SELECT hooks.kind, hooks.hook_name, files.path, hooks.line FROM hooks"
+            " JOIN files ON files.id = hooks.file_id WHERE hooks.hook_name = ?"
         )
-        for markdown_file in markdown_files:
-            relative = markdown_file.relative_to(manuals_docs_dir).as_posix()
-            nav_path = normalize_nav_path(f"{manuals_subdir}/{relative}")
-            title = "Overview" if markdown_file.name.casefold() == "readme.md" else extract_markdown_title(markdown_file)
-            lines.append(f'{" " * level_indent}- {yaml_quote(title)}: {nav_path}')
+        params: List[object] = [args.name]
+        if args.kind:
+            sql += " AND hooks.kind = ?"
+            params.append(args.kind)
+        # Same section order as the hook pages.
+        order = " ".join(f"WHEN '{kind}' THEN {index}" for index, kind in enumerate(HOOK_KIND_ORDER))
+        sql += f" ORDER BY CASE hooks.kind {order} END, files.path, hooks.line"
+        return ["kind", "hook", "path", "line"], connection.execute(sql, params).fetchall()
+
+    columns = ["realm", "signature", "path", "line"]
+    select = "SELECT functions.realm, functions.signature, files.path, functions.line FROM functions JOIN files ON files.id = functions.file_id"
+    if args.query == "search":
+        if fts:
+            sql = f"{select} JOIN functions_fts ON functions_fts.rowid = functions.id WHERE functions_fts MATCH ? ORDER BY functions_fts.rank"
+            try:
+                return columns, connection.execute(sql, [args.text]).fetchall()
+            except sqlite3.OperationalError:
+                # Not valid FTS5 syntax (e.g. "ax.character"): quote every term so it is matched literally.
+                quoted = " ".join('"{}"'.format(term.replace('"', '""')) for term in args.text.split())
+                return columns, connection.execute(sql, [quoted]).fetchall()
+        else:
+            sql = f"{select} WHERE functions.name LIKE ? OR functions.description LIKE ? ORDER BY functions.name"
+            params = [f"%{args.text}%", f"%{args.text}%"]
+        return columns, connection.execute(sql, params).fetchall()
+
+    conditions: List[str] = []
+    params = []
+    if args.name:
+        # Methods are stored as ax.character:Create; let either separator match both.
+        conditions.append("replace(functions.name, ':', '.') GLOB ?")
+        params.append(args.name.replace(":", "."))
+    if args.library:
+        conditions.append("functions.id IN (SELECT function_id FROM library_members WHERE library = ?)")
+        params.append(args.library)
+    if args.meta:
+        conditions.append("functions.id IN (SELECT function_id FROM meta_members WHERE meta_type = ?)")
+        params.append(args.meta)
+    if args.realm:
+        conditions.append("functions.realm = ?")
+        params.append(args.realm)
+    sql = select + (" WHERE " + " AND ".join(conditions) if conditions else "") + " ORDER BY functions.name, files.path, functions.line"
+    return columns, connection.execute(sql, params).fetchall()
+
+
+def run_query(args: argparse.Namespace) -> int:
+    path = normalize_path(args.root.resolve(), args.db)
+    if not path.exists():
+        print(f"No symbol database at {path}; run the generator with --symbol-db first.")
+        return 1
+
+    connection, fts = open_symbol_db(path)
+    try:
+        columns, rows = _query_rows(connection, args, fts)
+    except sqlite3.OperationalError as exc:
+        print(f"Query failed: {exc}")
+        return 1
+    finally:
+        connection.close()
+
+    if args.limit > 0:
+        rows = rows[: args.limit]
+    if args.json:
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2))
+        return 0
+
+    for row in rows:
+        *fields, source, line = row
+        print("  ".join(str(value) if value is not None else "-" for value in fields) + f"  {source}:{line}")
+    if not rows:
+        print("No matches.")
+    return 0
+
+
+def write_model_exports(
+    model: DocsModel,
+    layout: DocsLayout,
+    dry_run: bool,
+    manifest: Optional[GeneratedManifest] = None,
+    profiler: Optional[RunProfiler] = None,
+) -> None:
+    """Write the optional machine-readable outputs built from the model."""
+    profiler = profiler or RunProfiler()
+    if layout.symbol_index_path is not None:
+        path = layout.symbol_index_path
+        with profiler.phase("export: symbol index"):
+            chunks = iter_symbol_index_chunks(model, layout, json_array=path.suffix == ".json")
+            written = write_stream_if_changed(path, chunks, dry_run, manifest)
+        if written:
+            status = "[dry-run] Would write" if dry_run else "Wrote"
+            print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if model.hot_hooks is not None:
+        path = layout.docs_dir / layout.hooks_subdir / HOT_HOOKS_JSON
+        with profiler.phase("export: hot hooks"):
+            written = write_if_changed(path, json.dumps(model.hot_hooks, indent=2) + "\n", dry_run, manifest)
+        if written:
+            status = "[dry-run] Would write" if dry_run else "Wrote"
+            print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if model.net_catalog is not None:
+        path = layout.docs_dir / layout.hooks_subdir / NET_CATALOG_JSON
+        with profiler.phase("export: net catalog"):
+            written = write_if_changed(path, json.dumps(model.net_catalog, indent=2) + "\n", dry_run, manifest)
+        if written:
+            status = "[dry-run] Would write" if dry_run else "Wrote"
+            print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if model.net_ids is not None:
+        with profiler.phase("export: net ids"):
+            outputs = (
+                (layout.net_ids_path, render_net_id_lua(model.net_ids)),
+                (layout.docs_dir / layout.hooks_subdir / NET_IDS_JSON, json.dumps(model.net_ids, indent=2) + "\n"),
+            )
+            for path, content in outputs:
+                if write_if_changed(path, content, dry_run, manifest):
+                    status = "[dry-run] Would write" if dry_run else "Wrote"
+                    print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if model.hot_lint is not None:
+        path = layout.docs_dir / layout.hooks_subdir / HOT_LINT_SARIF
+        with profiler.phase("export: hot lint"):
+            content = json.dumps(hot_lint_sarif(model.hot_lint), indent=2) + "\n"
+            written = write_if_changed(path, content, dry_run, manifest)
+        if written:
+            status = "[dry-run] Would write" if dry_run else "Wrote"
+            print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if model.panel_audit is not None:
+        with profiler.phase("export: panel audit"):
+            outputs = (
+                (layout.docs_dir / layout.api_subdir / PANEL_AUDIT_JSON, json.dumps(model.panel_audit, indent=2) + "\n"),
+                (layout.docs_dir / TABLE_SORT_PATH, TABLE_SORT_JS),
+            )
+            for path, content in outputs:
+                if write_if_changed(path, content, dry_run, manifest):
+                    status = "[dry-run] Would write" if dry_run else "Wrote"
+                    print(f"{status}: {_path_to_record(layout.root, path)}")
+
+    if layout.symbol_db_path is not None:
+        path = layout.symbol_db_path
+        with profiler.phase("export: symbol db"):
+            upserted, removed = write_symbol_db(model, layout, dry_run)
+        if upserted or removed:
+            status = "[dry-run] Would update" if dry_run else "Updated"
+            print(f"{status} symbol database: {upserted} file(s) upserted, {removed} removed ({_path_to_record(layout.root, path)})")
+
+    if layout.search_index:
+        with profiler.phase("export: search index"):
+            changed = write_search_index(model, layout, dry_run, manifest)
+        if changed:
+            status = "[dry-run] Would update" if dry_run else "Updated"
+            print(f"{status} {changed} search index file(s) under {_path_to_record(layout.root, layout.docs_dir / SEARCH_INDEX_SUBDIR)}")
+
+
+class PollingWatcher:
+    """Portable watcher that diffs (size, mtime) snapshots of the watched trees."""
+
+    def __init__(self, directories: Sequence[Path], interval: float = WATCH_POLL_INTERVAL) -> None:
+        self.directories = list(directories)
+        self.interval = interval
+        self.snapshot = self._take_snapshot()
+
+    def _take_snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for directory in self.directories:
+            if not directory.exists():
+                continue
+            for path in directory.rglob("*"):
+                if path.suffix not in WATCH_SUFFIXES:
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def wait(self) -> set[Path]:
+        while True:
+            time.sleep(self.interval)
+            current = self._take_snapshot()
+            if current == self.snapshot:
+                continue
 
-        subdirectories = sorted(
-            (path for path in directory.iterdir() if path.is_dir()),
-            key=lambda path: path.name.casefold(),
+            changed = {
+                path
+                for path in current.keys() | self.snapshot.keys()
+                if current.get(path) != self.snapshot.get(path)
+            }
+            self.snapshot = current
+            return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher driven through ctypes, so no third-party package is needed."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_ISDIR = 0x40000000
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directories: Sequence[Path], debounce: float = WATCH_DEBOUNCE) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.debounce = debounce
+        self.mask = (
+            self.IN_MODIFY
+            | self.IN_CLOSE_WRITE
+            | self.IN_MOVED_FROM
+            | self.IN_MOVED_TO
+            | self.IN_CREATE
+            | self.IN_DELETE
         )
-        for subdirectory in subdirectories:
-            nested_lines = render_dir(subdirectory, level_indent + 4)
-            if not nested_lines:
+        self.watches: Dict[int, Path] = {}
+        for directory in directories:
+            self._add_tree(directory)
+
+    def _add_tree(self, directory: Path) -> None:
+        if not directory.is_dir():
+            return
+
+        for path in [directory, *(path for path in directory.rglob("*") if path.is_dir())]:
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(path)), self.mask)
+            if wd >= 0:
+                self.watches[wd] = path
+
+    def _read_events(self) -> set[Path]:
+        data = os.read(self.fd, 64 * 1024)
+        changed: set[Path] = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            directory = self.watches.get(wd)
+            if directory is None or not name:
                 continue
 
-            lines.append(f'{" " * level_indent}- {yaml_quote(pretty_nav_label(subdirectory.name))}:')
-            lines.extend(nested_lines)
+            path = directory / os.fsdecode(name)
+            if mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    self._add_tree(path)
+                    changed.update(item for item in path.rglob("*") if item.suffix in WATCH_SUFFIXES)
+                continue
 
-        return lines
+            if path.suffix in WATCH_SUFFIXES:
+                changed.add(path)
+        return changed
 
-    return render_dir(manuals_docs_dir, indent)
+    def wait(self) -> set[Path]:
+        changed: set[Path] = set()
+        while not changed:
+            select.select([self.fd], [], [])
+            changed |= self._read_events()
+            # Editors emit several events per save; coalesce them into one rebuild.
+            while select.select([self.fd], [], [], self.debounce)[0]:
+                changed |= self._read_events()
+        return changed
 
+    def close(self) -> None:
+        os.close(self.fd)
 
-def collect_root_pages(docs_dir: Path) -> List[Tuple[str, str]]:
-    pages: List[Tuple[str, str]] = []
 
-    index_page = docs_dir / "index.md"
-    readme = docs_dir / "README.md"
+def create_watcher(directories: Sequence[Path]):
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories)
 
-    if index_page.exists():
-        pages.append(("Home", "index.md"))
-    elif readme.exists():
-        pages.append(("Home", "README.md"))
 
-    root_pages = [
-        path
-        for path in docs_dir.glob("*.md")
-        if path.name not in {"README.md", "index.md"} and path.name.lower() != "index.md"
-    ]
-    titled_pages = [(extract_markdown_title(path), path.name) for path in root_pages]
-    for title, page in sorted(titled_pages, key=lambda item: nav_sort_key(item[0])):
-        pages.append((title, page))
+def save_model_snapshot(layout: DocsLayout, scanned_files: Sequence[ScannedFile], dry_run: bool) -> None:
+    if dry_run:
+        return
 
-    return pages
+    write_stream_if_changed(layout.docs_dir / MODEL_FILE, iter_model_snapshot_chunks(layout, scanned_files), dry_run)
+
+
+def iter_model_snapshot_chunks(layout: DocsLayout, scanned_files: Sequence[ScannedFile]) -> Iterator[str]:
+    """Serialize the snapshot one file record at a time; the whole document is never built in memory."""
+    revision = git_revision(layout.root)
+    # Sources that differed from the revision when the model was built; --since reparses them too, in case they
+    # have been reverted since.
+    dirty = git_changed_files(layout, revision) if revision else None
+    header = {
+        "version": MODEL_VERSION,
+        "stamp": generator_digest(),
+        "options": fingerprint_options(layout),
+        "revision": revision,
+        "dirty": (
+            sorted(_path_to_record(layout.root, path) for path in dirty[0] | dirty[1])
+            if dirty is not None
+            else None
+        ),
+    }
+    yield json.dumps(header, separators=(",", ":"))[:-1] + ',"files":['
+    for index, scanned in enumerate(scanned_files):
+        record = json.dumps(scanned_file_to_record(layout.root, scanned), separators=(",", ":"))
+        yield f",{record}" if index else record
+    yield "]}"
+
+
+def load_model_snapshot(
+    layout: DocsLayout,
+) -> Optional[Tuple[List[ScannedFile], Optional[str], Optional[List[str]]]]:
+    """Return the stored scanned files, the revision they were generated at and the sources that differed from it,
+    if still usable."""
+    try:
+        payload = json.loads((layout.docs_dir / MODEL_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
 
+    if (
+        payload.get("version") != MODEL_VERSION
+        or payload.get("stamp") != generator_digest()
+        # Round-trip through JSON so tuples and lists compare alike.
+        or payload.get("options") != json.loads(json.dumps(fingerprint_options(layout)))
+    ):
+        return None
+    files = [scanned_file_from_record(layout.root, record) for record in payload["files"]]
+    return files, payload.get("revision"), payload.get("dirty")
 
-def main() -> None:
-    args = parse_args()
 
-    root = args.root.resolve()
-    source_inputs = args.source or list(DEFAULT_SOURCE_DIRS)
-    source_dirs = [normalize_path(root, source) for source in source_inputs]
-    manuals_source_dir = normalize_path(root, args.manuals_source)
-
-    docs_dir = normalize_path(root, args.docs_dir)
-    api_dir = docs_dir / args.api_subdir
-    libraries_docs_dir = docs_dir / args.libraries_subdir
-    meta_docs_dir = docs_dir / args.meta_subdir
-    hooks_docs_dir = docs_dir / args.hooks_subdir
-    manuals_docs_dir = docs_dir / args.manuals_subdir
-    mkdocs_path = normalize_path(root, args.mkdocs_file)
-
-    ensure_docs_scaffold(docs_dir, args.dry_run)
-    sync_manuals_to_docs(manuals_source_dir, manuals_docs_dir, args.dry_run)
-
-    if args.clean and api_dir.exists():
-        if args.dry_run:
-            print(f"[dry-run] Would remove: {api_dir}")
-        else:
-            shutil.rmtree(api_dir)
-            print(f"Removed: {api_dir}")
-    if args.clean and libraries_docs_dir.exists():
-        if args.dry_run:
-            print(f"[dry-run] Would remove: {libraries_docs_dir}")
-        else:
-            shutil.rmtree(libraries_docs_dir)
-            print(f"Removed: {libraries_docs_dir}")
-    if args.clean and meta_docs_dir.exists():
-        if args.dry_run:
-            print(f"[dry-run] Would remove: {meta_docs_dir}")
-        else:
-            shutil.rmtree(meta_docs_dir)
-            print(f"Removed: {meta_docs_dir}")
-    if args.clean and hooks_docs_dir.exists():
-        if args.dry_run:
-            print(f"[dry-run] Would remove: {hooks_docs_dir}")
-        else:
-            shutil.rmtree(hooks_docs_dir)
-            print(f"Removed: {hooks_docs_dir}")
+def _run_git(root: Path, *args: str) -> str:
+    result = subprocess.run(["git", "-C", str(root), *args], capture_output=True, text=True, check=True)
+    return result.stdout
 
-    file_docs: List[FileDoc] = []
-    scanned_files = 0
 
-    for source_dir in source_dirs:
-        if not source_dir.exists():
-            print(f"Skipping missing source path: {source_dir}")
+def git_revision(root: Path, rev: str = "HEAD") -> Optional[str]:
+    try:
+        return _run_git(root, "rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}").strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_changed_files(layout: DocsLayout, rev: str) -> Optional[Tuple[set[Path], set[Path]]]:
+    """Sources added or modified, and sources deleted, between rev and the working tree (renames count as both).
+
+    Only Lua files under the source dirs and manuals count; generated pages are untracked too and are left out.
+    """
+    root = layout.root
+    try:
+        top = Path(_run_git(root, "rev-parse", "--show-toplevel").strip())
+        diff = _run_git(root, "diff", "--name-status", "-z", "-M", rev, "--")
+        untracked = _run_git(root, "ls-files", "--others", "--exclude-standard", "--full-name", "-z")
+    except OSError as error:
+        print(f"Cannot run git ({error}); running a full generation.")
+        return None
+    except subprocess.CalledProcessError as error:
+        print(f"git could not diff against {rev}: {error.stderr.strip() or error}; running a full generation.")
+        return None
+
+    changed: set[Path] = {top / name for name in untracked.split("\0") if name}
+    deleted: set[Path] = set()
+    fields = diff.split("\0")
+    index = 0
+    while index < len(fields) and fields[index]:
+        status = fields[index][0]
+        if status in "RC":
+            old_path, new_path = top / fields[index + 1], top / fields[index + 2]
+            if status == "R":
+                deleted.add(old_path)
+            changed.add(new_path)
+            index += 3
             continue
+        path = top / fields[index + 1]
+        (deleted if status == "D" else changed).add(path)
+        index += 2
+    return (
+        {path for path in changed if _is_docs_source(layout, path)},
+        {path for path in deleted if _is_docs_source(layout, path)},
+    )
 
-        lua_files = sorted(source_dir.rglob("*.lua"))
-        scanned_files += len(lua_files)
-        for lua_file in lua_files:
-            file_doc = build_file_doc(
-                root=root,
-                source_dir=source_dir,
-                api_subdir=args.api_subdir,
-                file_path=lua_file,
-            )
-            if file_doc:
-                file_docs.append(file_doc)
 
-    file_docs.sort(key=lambda item: item.output_relative.as_posix())
+def regenerate_since(
+    layout: DocsLayout,
+    rev: str,
+    cache: Optional[ScanCache],
+    manifest: GeneratedManifest,
+    dry_run: bool,
+    profiler: Optional[RunProfiler] = None,
+) -> Optional[Tuple[List[ScannedFile], List[PagePlan], DocsModel]]:
+    """Merge the files changed since rev into the stored model and rewrite the affected pages.
+
+    Returns None, having written nothing, when the stored model or git cannot be used.
+    """
+    profiler = profiler or RunProfiler()
+    snapshot = load_model_snapshot(layout)
+    if snapshot is None:
+        print(f"No usable {MODEL_FILE} for this generator and layout; running a full generation.")
+        return None
+    previous_files, stored_revision, stored_dirty = snapshot
+    if stored_revision is None or stored_dirty is None:
+        print(f"{MODEL_FILE} does not record the git revision it was built at; running a full generation.")
+        return None
+    changes = git_changed_files(layout, rev)
+    if changes is None:
+        return None
+
+    changed_paths, deleted_paths = changes
+    if git_revision(layout.root, rev) != stored_revision:
+        # The stored model reflects its own revision, not rev: also reparse what changed since then.
+        print(f"The stored model was generated at {stored_revision[:12]}, not {rev}; also diffing against it.")
+        since_stored = git_changed_files(layout, stored_revision)
+        if since_stored is None:
+            return None
+        changed_paths |= since_stored[0]
+        deleted_paths |= since_stored[1]
+    for record in stored_dirty:
+        path = _path_from_record(layout.root, record)
+        (changed_paths if path.exists() else deleted_paths).add(path)
+
+    scanned_by_path: Dict[Path, ScannedFile] = {scanned.source_path: scanned for scanned in previous_files}
+    changed_sources: set[str] = set()
+    manuals_changed = False
+    with profiler.phase("scan"):
+        for path in sorted(changed_paths | deleted_paths):
+            if path.suffix == ".md":
+                try:
+                    path.relative_to(layout.manuals_source_dir)
+                except ValueError:
+                    continue
+                manuals_changed = True
+                continue
 
-    api_file_docs = api_entries_without_meta(file_docs)
+            owner = _owning_source_dir(layout.source_dirs, path)
+            if path.suffix != ".lua" or owner is None:
+                continue
 
-    changed_api_files = 0
-    for file_doc in api_file_docs:
-        output_path = docs_dir / file_doc.output_relative
-        markdown = render_file_markdown(file_doc, root)
-        if write_if_changed(output_path, markdown, args.dry_run):
-            changed_api_files += 1
-            status = "[dry-run] Would write" if args.dry_run else "Wrote"
-            print(f"{status}: {output_path.relative_to(root)}")
+            changed_sources.add(source_key(path))
+            if path in changed_paths and path.exists():
+                scanned_by_path[path] = rescan_lua_file(layout, owner[1], path, cache)
+            else:
+                scanned_by_path.pop(path, None)
 
-    source_to_api_page = {
-        str(file_doc.source_path.resolve()): file_doc.output_relative for file_doc in api_file_docs
-    }
+    manifest.resume()
+    if manuals_changed:
+        with profiler.phase("manual sync"):
+            manifest.forget_under(layout.manuals_docs_dir)
+            sync_manuals_to_docs(layout.manuals_source_dir, layout.manuals_docs_dir, dry_run, manifest, layout.manuals_mode)
 
-    library_index = build_ax_library_index(api_file_docs)
-    library_pages: Dict[str, Path] = {}
-    changed_library_files = 0
-    expected_library_files: set[str] = set()
-    for library_name, entries in library_index.items():
-        output_relative = Path(args.libraries_subdir).joinpath(*library_name.split(".")).with_suffix(".md")
-        library_pages[library_name] = output_relative
-        output_path = docs_dir / output_relative
-        expected_library_files.add(str(output_path.resolve()))
-        content = render_library_page(root, library_name, output_relative, entries)
-        if write_if_changed(output_path, content, args.dry_run):
-            changed_library_files += 1
-            status = "[dry-run] Would write" if args.dry_run else "Wrote"
-            print(f"{status}: {output_path.relative_to(root)}")
-
-    libraries_index_relative = Path(args.libraries_subdir) / "index.md"
-    libraries_index_path = docs_dir / libraries_index_relative
-    expected_library_files.add(str(libraries_index_path.resolve()))
-    uncovered = _uncovered_file_docs(api_file_docs, library_index)
-    libraries_index_content = render_libraries_index(library_index, library_pages, args.libraries_subdir, uncovered)
-    if write_if_changed(libraries_index_path, libraries_index_content, args.dry_run):
-        changed_library_files += 1
-        status = "[dry-run] Would write" if args.dry_run else "Wrote"
-        print(f"{status}: {libraries_index_path.relative_to(root)}")
-
-    remove_stale_generated_markdown(libraries_docs_dir, expected_library_files, args.dry_run)
-
-    meta_index = build_meta_index(file_docs)
-    meta_pages: Dict[str, Path] = {}
-    changed_meta_files = 0
-    expected_meta_files: set[str] = set()
-    for meta_type, entries in meta_index.items():
-        output_relative = Path(args.meta_subdir) / f"{meta_type}.md"
-        meta_pages[meta_type] = output_relative
-        output_path = docs_dir / output_relative
-        expected_meta_files.add(str(output_path.resolve()))
-        content = render_meta_page(root, meta_type, output_relative, entries)
-        if write_if_changed(output_path, content, args.dry_run):
-            changed_meta_files += 1
-            status = "[dry-run] Would write" if args.dry_run else "Wrote"
-            print(f"{status}: {output_path.relative_to(root)}")
-
-    meta_index_relative = Path(args.meta_subdir) / "index.md"
-    meta_index_path = docs_dir / meta_index_relative
-    expected_meta_files.add(str(meta_index_path.resolve()))
-    meta_index_content = render_meta_index(meta_index, meta_pages, args.meta_subdir)
-    if write_if_changed(meta_index_path, meta_index_content, args.dry_run):
-        changed_meta_files += 1
-        status = "[dry-run] Would write" if args.dry_run else "Wrote"
-        print(f"{status}: {meta_index_path.relative_to(root)}")
-
-    remove_stale_generated_markdown(meta_docs_dir, expected_meta_files, args.dry_run)
-
-    hook_occurrences = collect_hook_occurrences(source_dirs)
-    grouped_hooks = group_hook_occurrences(hook_occurrences)
-    changed_hook_files = 0
-    expected_hook_files: set[str] = set()
-
-    hooks_index_relative = Path(args.hooks_subdir) / "index.md"
-    hooks_index_path = docs_dir / hooks_index_relative
-    expected_hook_files.add(str(hooks_index_path.resolve()))
-    hooks_index_content = render_hooks_overview(grouped_hooks, args.hooks_subdir)
-    if write_if_changed(hooks_index_path, hooks_index_content, args.dry_run):
-        changed_hook_files += 1
-        status = "[dry-run] Would write" if args.dry_run else "Wrote"
-        print(f"{status}: {hooks_index_path.relative_to(root)}")
+    ordered = sorted(
+        scanned_by_path.values(),
+        key=lambda scanned: (_owning_source_dir(layout.source_dirs, scanned.source_path)[0], scanned.source_path),
+    )
+    model = build_docs_model(ordered, layout, profiler)
+    with profiler.phase("plan"):
+        previous_plans = plan_pages(build_docs_model(previous_files, layout), layout)
+        plans = plan_pages(model, layout)
+        targets = affected_pages(previous_plans, plans, changed_sources)
+    changed = write_pages(plans, layout, dry_run, only=targets, manifest=manifest, profiler=profiler)
+
+    new_outputs = {plan.output_relative for plan in plans}
+    for plan in previous_plans:
+        if plan.output_relative not in new_outputs:
+            manifest.current.pop(manifest.key(layout.docs_dir / plan.output_relative), None)
+
+    write_mkdocs_config(model, layout, dry_run, manifest, profiler)
+    write_model_exports(model, layout, dry_run, manifest, profiler)
+    with profiler.phase("stale cleanup"):
+        manifest.remove_stale(dry_run)
+        manifest.save(dry_run)
+    save_model_snapshot(layout, ordered, dry_run)
 
-    for kind in HOOK_KIND_ORDER:
-        output_relative = Path(args.hooks_subdir) / f"{kind}.md"
-        output_path = docs_dir / output_relative
-        expected_hook_files.add(str(output_path.resolve()))
-        content = render_hook_kind_page(
-            root=root,
-            kind=kind,
-            grouped_by_name=grouped_hooks[kind],
-            source_to_api_page=source_to_api_page,
-            hooks_subdir=args.hooks_subdir,
-            all_grouped_hooks=grouped_hooks,
+    print(
+        "Done. Reparsed {} changed Lua file(s) since {}{}, rendered {} page(s), rewrote {}{}.".format(
+            sum(1 for key in changed_sources if Path(key).exists()),
+            rev,
+            " and resynced manuals" if manuals_changed else "",
+            len(targets),
+            sum(changed.values()),
+            " (dry-run)" if dry_run else "",
         )
-        if write_if_changed(output_path, content, args.dry_run):
-            changed_hook_files += 1
-            status = "[dry-run] Would write" if args.dry_run else "Wrote"
-            print(f"{status}: {output_path.relative_to(root)}")
+    )
+    return ordered, plans, model
 
-    remove_stale_generated_markdown(hooks_docs_dir, expected_hook_files, args.dry_run)
 
-    api_index_path = api_dir / "index.md"
-    api_index_content = render_api_index(
-        file_docs=api_file_docs,
-        api_subdir=args.api_subdir,
-        libraries_subdir=args.libraries_subdir,
-        meta_subdir=args.meta_subdir,
-        hooks_subdir=args.hooks_subdir,
-    )
-    if write_if_changed(api_index_path, api_index_content, args.dry_run):
-        status = "[dry-run] Would write" if args.dry_run else "Wrote"
-        print(f"{status}: {api_index_path.relative_to(root)}")
+def _owning_source_dir(source_dirs: Sequence[Path], path: Path) -> Optional[Tuple[int, Path]]:
+    for index, source_dir in enumerate(source_dirs):
+        try:
+            path.relative_to(source_dir)
+        except ValueError:
+            continue
+        return index, source_dir
+    return None
 
-    root_pages = collect_root_pages(docs_dir)
-    manuals_nav_lines = build_manuals_nav_lines(manuals_docs_dir, args.manuals_subdir)
-    libraries_nav_lines = build_libraries_nav_lines(library_pages, args.libraries_subdir, uncovered, args.api_subdir)
-    meta_nav_lines = build_meta_nav_lines(meta_pages, args.meta_subdir)
-    hooks_nav_lines = build_hooks_nav_lines(args.hooks_subdir)
-    logo_relative = "assets/images/parallax-logo.png"
-    favicon_relative = "assets/images/favicon.png"
-    extra_css_relative = "assets/stylesheets/extra.css"
 
-    logo_path = logo_relative if (docs_dir / logo_relative).exists() else None
-    favicon_path = favicon_relative if (docs_dir / favicon_relative).exists() else None
-    extra_css_path = extra_css_relative if (docs_dir / extra_css_relative).exists() else None
+def _is_docs_source(layout: DocsLayout, path: Path) -> bool:
+    if path.suffix == ".lua":
+        return _owning_source_dir(layout.source_dirs, path) is not None
+    if path.suffix == ".md":
+        try:
+            path.relative_to(layout.manuals_source_dir)
+        except ValueError:
+            return False
+        return True
+    return False
 
-    mkdocs_content = build_mkdocs_yaml(
-        docs_dir_relative=args.docs_dir,
-        site_name=args.site_name,
-        site_description=args.site_description,
-        root_pages=root_pages,
-        manuals_nav_lines=manuals_nav_lines,
-        libraries_nav_lines=libraries_nav_lines,
-        meta_nav_lines=meta_nav_lines,
-        hooks_nav_lines=hooks_nav_lines,
-        logo_path=logo_path,
-        favicon_path=favicon_path,
-        extra_css_path=extra_css_path,
-    )
-    if write_if_changed(mkdocs_path, mkdocs_content, args.dry_run):
-        status = "[dry-run] Would write" if args.dry_run else "Wrote"
-        print(f"{status}: {mkdocs_path.relative_to(root)}")
+
+def rescan_lua_file(
+    layout: DocsLayout,
+    source_dir: Path,
+    file_path: Path,
+    cache: Optional[ScanCache],
+) -> ScannedFile:
+    if cache is not None:
+        cached, data = cache.lookup(source_dir, layout.api_subdir, file_path)
+        if cached is not None:
+            return cached
+        scanned = _scan_job((source_dir, layout.api_subdir, file_path, data))
+        cache.store(scanned)
+        return scanned
+    return scan_lua_file(layout.root, source_dir, layout.api_subdir, file_path)
+
+
+def watch_and_regenerate(
+    layout: DocsLayout,
+    scanned_files: Sequence[ScannedFile],
+    plans: Sequence[PagePlan],
+    cache: Optional[ScanCache],
+    manifest: GeneratedManifest,
+    dry_run: bool,
+) -> None:
+    watcher = create_watcher([*layout.source_dirs, layout.manuals_source_dir])
+    print(f"Watching for changes ({type(watcher).__name__}). Press Ctrl+C to stop.")
+
+    scanned_by_path: Dict[Path, ScannedFile] = {scanned.source_path: scanned for scanned in scanned_files}
+    try:
+        while True:
+            changed_paths = watcher.wait()
+            changed_sources: set[str] = set()
+            manuals_changed = False
+
+            for path in sorted(changed_paths):
+                if path.suffix == ".md":
+                    try:
+                        path.relative_to(layout.manuals_source_dir)
+                    except ValueError:
+                        continue
+                    manuals_changed = True
+                    continue
+
+                owner = _owning_source_dir(layout.source_dirs, path)
+                if path.suffix != ".lua" or owner is None:
+                    continue
+
+                changed_sources.add(source_key(path))
+                if path.exists():
+                    scanned_by_path[path] = rescan_lua_file(layout, owner[1], path, cache)
+                else:
+                    scanned_by_path.pop(path, None)
+
+            if not changed_sources and not manuals_changed:
+                continue
+
+            manifest.carry_over()
+            if manuals_changed:
+                manifest.forget_under(layout.manuals_docs_dir)
+                sync_manuals_to_docs(layout.manuals_source_dir, layout.manuals_docs_dir, dry_run, manifest, layout.manuals_mode)
+
+            ordered = sorted(
+                scanned_by_path.values(),
+                key=lambda scanned: (_owning_source_dir(layout.source_dirs, scanned.source_path)[0], scanned.source_path),
+            )
+            model = build_docs_model(ordered, layout)
+            new_plans = plan_pages(model, layout)
+            targets = affected_pages(plans, new_plans, changed_sources) if changed_sources else set()
+            changed = write_pages(new_plans, layout, dry_run, only=targets, manifest=manifest)
+
+            new_outputs = {plan.output_relative for plan in new_plans}
+            for plan in plans:
+                if plan.output_relative not in new_outputs:
+                    manifest.current.pop(manifest.key(layout.docs_dir / plan.output_relative), None)
+
+            write_mkdocs_config(model, layout, dry_run, manifest)
+            write_model_exports(model, layout, dry_run, manifest)
+            manifest.remove_stale(dry_run)
+            manifest.save(dry_run)
+            save_model_snapshot(layout, ordered, dry_run)
+            if cache is not None and not dry_run:
+                cache.save()
+
+            plans = new_plans
+            print(
+                "Rebuilt {} changed source file(s): rendered {} page(s), rewrote {}.".format(
+                    len(changed_sources), len(targets), sum(changed.values())
+                )
+            )
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        watcher.close()
+
+
+class DocsProject:
+    """The generator's stages as individually callable steps: scan -> index -> plan/render -> write.
+
+    Each stage runs the ones before it on first use and keeps its result, so a caller
+    that only needs the parsed model never renders a page, and several tools in one
+    process can share a single parse. Extra pages and outputs plug in through
+    add_renderer() and add_output(); they are written and tracked in the manifest
+    like the built-in ones, but are not added to the MkDocs nav.
+    """
+
+    def __init__(
+        self,
+        layout: DocsLayout,
+        scan_cache: Optional[ScanCache] = None,
+        manifest: Optional[GeneratedManifest] = None,
+        jobs: int = 1,
+        dry_run: bool = False,
+        profiler: Optional[RunProfiler] = None,
+    ) -> None:
+        self.layout = layout
+        self.scan_cache = scan_cache
+        if manifest is None:
+            manifest = GeneratedManifest(layout.root, layout.docs_dir)
+            manifest.load()
+        self.manifest = manifest
+        self.jobs = max(1, jobs)
+        self.dry_run = dry_run
+        self.profiler = profiler or RunProfiler()
+        self.renderers: List[Callable[[DocsModel, DocsLayout], Iterable[PagePlan]]] = []
+        self.outputs: List[Callable[[DocsModel, DocsLayout, bool, GeneratedManifest], None]] = []
+        self.scanned_files: Optional[List[ScannedFile]] = None
+        self.model: Optional[DocsModel] = None
+        self.plans: Optional[List[PagePlan]] = None
+
+    @classmethod
+    def from_args(cls, argv: Sequence[str] = ()) -> DocsProject:
+        """Configure a project from generate_docs.py options, e.g. ["--root", path, "--no-cache"]."""
+        return project_from_args(parse_args(list(argv)))
+
+    def add_renderer(self, renderer: Callable[[DocsModel, DocsLayout], Iterable[PagePlan]]) -> None:
+        """Register extra pages; renderer returns PagePlans relative to the docs directory."""
+        self.renderers.append(renderer)
+        self.plans = None
+
+    def add_output(self, output: Callable[[DocsModel, DocsLayout, bool, GeneratedManifest], None]) -> None:
+        """Register an extra export, called like write_model_exports after the pages are written."""
+        self.outputs.append(output)
+
+    def scan(self) -> List[ScannedFile]:
+        if self.scanned_files is None:
+            layout = self.layout
+            with self.profiler.phase("scan"):
+                self.scanned_files = scan_source_dirs(
+                    layout.root, layout.source_dirs, layout.api_subdir, self.scan_cache, self.jobs, self.profiler
+                )
+            if self.scan_cache is not None and not self.dry_run:
+                self.scan_cache.save()
+        return self.scanned_files
+
+    def index(self) -> DocsModel:
+        if self.model is None:
+            self.model = build_docs_model(self.scan(), self.layout, self.profiler)
+        return self.model
+
+    def plan(self) -> List[PagePlan]:
+        if self.plans is None:
+            model = self.index()
+            with self.profiler.phase("plan"):
+                plans = plan_pages(model, self.layout)
+                for renderer in self.renderers:
+                    plans.extend(renderer(model, self.layout))
+            self.plans = plans
+        return self.plans
+
+    def render(self, output_relative: Path) -> str:
+        """Render one page in memory without writing it."""
+        for plan in self.plan():
+            if plan.output_relative == Path(output_relative):
+                return plan.render()
+        raise KeyError(f"No generated page at {output_relative}")
+
+    def write(self) -> Dict[str, int]:
+        """Write pages, mkdocs.yml and every export; returns the changed page count per section."""
+        layout = self.layout
+        profiler = self.profiler
+        with profiler.phase("manual sync"):
+            sync_manuals_to_docs(layout.manuals_source_dir, layout.manuals_docs_dir, self.dry_run, self.manifest, layout.manuals_mode)
+
+        model = self.index()
+        plans = self.plan()
+        changed = write_pages(plans, layout, self.dry_run, manifest=self.manifest, profiler=profiler)
+        write_mkdocs_config(model, layout, self.dry_run, self.manifest, profiler)
+        write_model_exports(model, layout, self.dry_run, self.manifest, profiler)
+        for output in self.outputs:
+            with profiler.phase("export: plugins"):
+                output(model, layout, self.dry_run, self.manifest)
+        with profiler.phase("stale cleanup"):
+            remove_stale_outputs(plans, layout, self.manifest, self.dry_run)
+            self.manifest.save(self.dry_run)
+        save_model_snapshot(layout, self.scan(), self.dry_run)
+        return changed
+
+
+def project_from_args(args: argparse.Namespace, profiler: Optional[RunProfiler] = None) -> DocsProject:
+    layout = layout_from_args(args)
+    scan_cache: Optional[ScanCache] = None
+    if not args.no_cache:
+        scan_cache = ScanCache(layout.root, normalize_path(layout.root, args.cache_dir) / SCAN_CACHE_FILE)
+        scan_cache.load()
+    return DocsProject(layout, scan_cache, jobs=args.jobs, dry_run=args.dry_run, profiler=profiler)
+
+
+def generate_all(project: DocsProject, clean: bool, fingerprint_path: Path) -> None:
+    """Scan every source file and rewrite all generated output."""
+    layout = project.layout
+    dry_run = project.dry_run
+    # Taken before anything is written so generated files never count as inputs.
+    fingerprint, fingerprint_inputs = compute_input_fingerprint(layout, project.manifest)
+
+    if clean:
+        for subdir in layout.generated_sections.values():
+            section_dir = layout.docs_dir / subdir
+            if not section_dir.exists():
+                continue
+            if dry_run:
+                print(f"[dry-run] Would remove: {section_dir}")
+            else:
+                shutil.rmtree(section_dir)
+                print(f"Removed: {section_dir}")
+
+    changed = project.write()
+    if not dry_run:
+        save_fingerprint(fingerprint_path, fingerprint, fingerprint_inputs)
+
+    cache_note = ""
+    scan_cache = project.scan_cache
+    if scan_cache is not None:
+        cache_note = f" ({scan_cache.misses} parsed, {scan_cache.hits} cached)"
 
     print(
-        "Done. Scanned {} Lua files, documented {} files, changed {} API pages, {} library pages, {} meta pages, {} hook pages{}.".format(
-            scanned_files,
-            len(file_docs),
-            changed_api_files,
-            changed_library_files,
-            changed_meta_files,
-            changed_hook_files,
-            " (dry-run)" if args.dry_run else "",
+        "Done. Scanned {} Lua files{}, documented {} files, changed {} API pages, {} library pages, {} meta pages, {} hook pages{}.".format(
+            len(project.scan()),
+            cache_note,
+            len(project.index().file_docs),
+            changed["api"],
+            changed["libraries"],
+            changed["meta"],
+            changed["hooks"],
+            " (dry-run)" if dry_run else "",
         )
     )
 
 
+def main() -> None:
+    args = parse_args()
+    if args.command == "query":
+        sys.exit(run_query(args))
+
+    profiler = RunProfiler(args.profile, max(0, args.profile_top))
+    cprofiler: Optional[cProfile.Profile] = None
+    if args.cprofile:
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+
+    fingerprint_path = normalize_path(args.root.resolve(), args.cache_dir) / FINGERPRINT_FILE
+    if args.check or args.write_fingerprint:
+        sys.exit(check_fingerprint(layout_from_args(args), fingerprint_path, write=args.write_fingerprint))
+
+    project = project_from_args(args, profiler)
+    layout = project.layout
+    root = layout.root
+    ensure_docs_scaffold(layout.docs_dir, args.dry_run)
+    manifest = project.manifest
+    scan_cache = project.scan_cache
+
+    incremental = None
+    if args.since:
+        incremental = regenerate_since(layout, args.since, scan_cache, manifest, args.dry_run, profiler)
+    if incremental is not None:
+        scanned_files, plans, model = incremental
+        if scan_cache is not None and not args.dry_run:
+            scan_cache.save()
+        # Only the changed files were hashed, so the stored fingerprint no longer describes the output.
+        if not args.dry_run and fingerprint_path.exists():
+            fingerprint_path.unlink()
+    else:
+        generate_all(project, args.clean, fingerprint_path)
+        scanned_files, plans, model = project.scan(), project.plan(), project.index()
+
+    if cprofiler is not None:
+        cprofiler.disable()
+        cprofile_path = normalize_path(root, args.cprofile)
+        cprofile_path.parent.mkdir(parents=True, exist_ok=True)
+        cprofiler.dump_stats(str(cprofile_path))
+        print(f"Wrote cProfile stats: {cprofile_path}")
+
+    if args.profile:
+        report = profiler.report(root)
+        print_profile_report(report)
+        report_path = normalize_path(root, args.profile_json or str(Path(args.cache_dir) / PROFILE_FILE))
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_bytes(report_path, (json.dumps(report, indent=2) + "\n").encode("utf-8"))
+        print(f"Wrote profile: {report_path}")
+
+    failed = False
+    if model.hot_hooks is not None and model.hot_hooks["violations"]:
+        for violation in model.hot_hooks["violations"]:
+            print(f"Hot hook over budget: {violation}")
+        failed = True
+    if model.hot_lint is not None:
+        failures = hot_lint_failures(model.hot_lint, args.fail_on)
+        if failures:
+            print(f"Hot path lint: {failures} finding(s) at or above {args.fail_on}")
+            failed = True
+    if failed and not args.watch:
+        sys.exit(1)
+
+    if args.watch:
+        watch_and_regenerate(layout, scanned_files, plans, scan_cache, manifest, args.dry_run)
+
+
 if __name__ == "__main__":
     main()